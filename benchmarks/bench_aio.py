@@ -0,0 +1,89 @@
+"""
+Event loop latency while decoding a large JSON array: synchronous `from_json_many` versus `aiter_json`.
+A ticker task measures how late it wakes up while the records are decoded.
+
+    python -m benchmarks.bench_aio [RECORDS]
+"""
+import asyncio
+import sys
+from timeit import default_timer
+
+from pyjo import Model, Field, RangeField, ListField
+
+
+class Record(Model):
+    id = Field(type=int, required=True)
+    name = Field(type=str)
+    score = RangeField(min=0, max=100)
+    tags = ListField(Field(type=str))
+
+
+class Ticker(object):
+    """
+    Wakes up every `interval` seconds, recording the largest delay
+    """
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.max_delay = 0.0
+        self.running = True
+
+    async def run(self):
+        while self.running:
+            start = default_timer()
+            await asyncio.sleep(self.interval)
+            self.max_delay = max(self.max_delay, default_timer() - start - self.interval)
+
+
+async def chunks(data, size=64 * 1024):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+        await asyncio.sleep(0)
+
+
+async def measure(decode):
+    ticker = Ticker()
+    task = asyncio.ensure_future(ticker.run())
+    await asyncio.sleep(0.01)
+    start = default_timer()
+    count = await decode()
+    elapsed = default_timer() - start
+    ticker.running = False
+    await task
+    return count, elapsed, ticker.max_delay
+
+
+async def bench(records):
+    data = Record.to_json_many([Record(id=i, name='record{}'.format(i), score=i % 100, tags=['a', 'b'])
+                                for i in range(records)]).encode('utf-8')
+
+    async def sync_decode():
+        return len(Record.from_json_many(data.decode('utf-8')))
+
+    async def async_decode():
+        count = 0
+        async for _ in Record.aiter_json(chunks(data)):
+            count += 1
+        return count
+
+    res = {}
+    for name, decode in (('from_json_many', sync_decode), ('aiter_json', async_decode)):
+        count, elapsed, max_delay = await measure(decode)
+        assert count == records
+        print('{:16} {:10.1f} ms  max loop delay {:8.2f} ms'.format(name, elapsed * 1e3, max_delay * 1e3))
+        res[name] = {'time': elapsed, 'max_delay': max_delay}
+    return res
+
+
+def main(records=100000):
+    print('records={}'.format(records))
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(bench(records))
+    finally:
+        loop.close()
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:2]]
+    main(*args)
@@ -0,0 +1,82 @@
+"""
+Import time of a generated module declaring a large catalog of models, with deep inheritance and mixins.
+
+    python -m benchmarks.bench_import [MODELS] [DEPTH]
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+_module = 'pyjo_bench_catalog'
+
+# imports pyjo first, so that only the class creations of the catalog are timed
+_script = """
+import sys
+from timeit import default_timer
+import pyjo
+start = default_timer()
+import {module}
+print(default_timer() - start)
+"""
+
+
+def make_source(models, depth):
+    """
+    `models` model classes in chains of `depth` classes, each class adding 3 fields to its parent.
+    Every 5th class also inherits a mixin model
+    """
+    lines = [
+        'from pyjo import Model, Field, ListField, MapField, RangeField',
+        '',
+        '',
+        'class Audit(Model):',
+        '    created_by = Field(type=str)',
+        '    tags = ListField(Field(type=str))',
+        '',
+    ]
+    for i in range(models):
+        if i % depth == 0:
+            bases = 'Model'
+        else:
+            bases = 'M{}'.format(i - 1)
+        if i % 5 == 4:
+            bases += ', Audit'
+        lines += [
+            '',
+            'class M{}({}):'.format(i, bases),
+            '    f{}_a = Field(type=str, required=True)'.format(i),
+            '    f{}_b = RangeField(min=0, max=100)'.format(i),
+            '    f{}_c = MapField(Field(type=int))'.format(i),
+            '',
+        ]
+    return '\n'.join(lines)
+
+
+def time_import(path, repeat):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([path] + sys.path), PYTHONDONTWRITEBYTECODE='1')
+    script = _script.format(module=_module)
+    times = []
+    for _ in range(repeat):
+        out = subprocess.check_output([sys.executable, '-c', script], env=env)
+        times.append(float(out.decode().strip()))
+    return min(times)
+
+
+def main(models=500, depth=10, repeat=5):
+    path = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(path, _module + '.py'), 'w') as f:
+            f.write(make_source(models, depth))
+        elapsed = time_import(path, repeat)
+    finally:
+        shutil.rmtree(path)
+    print('models={} depth={}'.format(models, depth))
+    print('import  {:10.1f} ms  ({:.1f} us per model)'.format(elapsed * 1e3, elapsed / models * 1e6))
+    return {'import': elapsed}
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
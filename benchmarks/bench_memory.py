@@ -0,0 +1,52 @@
+"""
+Memory used by model instances, with the default dictionary storage and with `_slots = True`.
+
+    python -m benchmarks.bench_memory [N]
+"""
+import gc
+import sys
+import tracemalloc
+
+from pyjo import Model, Field, RangeField
+
+
+class Record(Model):
+    id = Field(type=int)
+    name = Field(type=str)
+    score = RangeField(min=0, max=100)
+    active = Field(type=bool)
+
+
+class SlotRecord(Model):
+    _slots = True
+    id = Field(type=int)
+    name = Field(type=str)
+    score = RangeField(min=0, max=100)
+    active = Field(type=bool)
+
+
+def bytes_per_instance(cls, n):
+    # values are created up front so that only the instances are measured
+    names = ['name{}'.format(i) for i in range(n)]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(id=i, name=names[i], score=i % 100, active=True) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # the list holding the instances is not part of the instance cost
+    list_size = sys.getsizeof(instances)
+    return (after - before - list_size) / float(n)
+
+
+def main(n=100000):
+    results = {}
+    for cls in (Record, SlotRecord):
+        results[cls.__name__] = bytes_per_instance(cls, n)
+        print('{:<12} {:8.1f} bytes/instance'.format(cls.__name__, results[cls.__name__]))
+    print('saved        {:8.1f}%'.format(100 * (1 - results['SlotRecord'] / results['Record'])))
+    return results
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
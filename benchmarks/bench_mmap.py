@@ -0,0 +1,76 @@
+"""
+Peak memory and time of decoding a large JSON array file: `from_json_many` on the whole content versus
+`iter_json_array` (memory mapped, one window at a time), each in a fresh process.
+
+    python -m benchmarks.bench_mmap [RECORDS]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from pyjo import Model, Field, ListField, RangeField
+
+
+class Record(Model):
+    id = Field(type=int, required=True)
+    name = Field(type=str)
+    score = RangeField(min=0, max=100)
+    tags = ListField(Field(type=str))
+
+
+_script = """
+import resource
+import sys
+from timeit import default_timer
+from benchmarks.bench_mmap import Record
+
+path, mode = sys.argv[1:3]
+start = default_timer()
+if mode == 'from_json_many':
+    with open(path) as f:
+        count = len(Record.from_json_many(f.read()))
+else:
+    count = 0
+    for _ in Record.iter_json_array(path):
+        count += 1
+elapsed = default_timer() - start
+# kilobytes on Linux
+print(count, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def write_file(path, records):
+    with open(path, 'w') as f:
+        f.write('[')
+        for i in range(records):
+            if i:
+                f.write(',\n')
+            json.dump({'id': i, 'name': 'record{}'.format(i), 'score': i % 100, 'tags': ['a', 'b'],
+                       'payload': 'x' * 200}, f)
+        f.write(']')
+
+
+def main(records=200000):
+    fd, path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        write_file(path, records)
+        print('records={} file={:.1f} MB'.format(records, os.path.getsize(path) / 1e6))
+        cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        res = {}
+        for mode in ('from_json_many', 'iter_json_array'):
+            out = subprocess.check_output([sys.executable, '-c', _script, path, mode], cwd=cwd)
+            count, elapsed, rss = out.decode().split()
+            assert int(count) == records
+            print('{:16} {:10.1f} ms  peak RSS {:8.1f} MB'.format(mode, float(elapsed) * 1e3, int(rss) / 1e3))
+            res[mode] = {'time': float(elapsed), 'max_rss': int(rss) * 1000}
+    finally:
+        os.remove(path)
+    return res
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:2]]
+    main(*args)
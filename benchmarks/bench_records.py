@@ -0,0 +1,80 @@
+"""
+Memory and scan time of flat records kept as models versus packed by `pack_records` and read through
+`record_views`.
+
+    python -m benchmarks.bench_records [N]
+"""
+import gc
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from enum import Enum
+from timeit import default_timer
+
+from pyjo import Model, Field, RangeField, DatetimeField, EnumField
+
+
+class Level(Enum):
+    low = 1
+    high = 2
+
+
+class Reading(Model):
+    _slots = True
+    id = Field(type=int, required=True)
+    sensor = RangeField(min=0, max=1000)
+    value = Field(type=float)
+    level = EnumField(Level)
+    at = DatetimeField()
+
+
+def allocated(build):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    res = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return res, after - before
+
+
+def timed(scan):
+    start = default_timer()
+    res = scan()
+    return res, default_timer() - start
+
+
+def main(n=1000000):
+    start = datetime(2020, 1, 1)
+    models = [Reading.construct(id=i, sensor=i % 1000, value=i * 0.5, level=Level.high if i % 3 else Level.low,
+                                at=start + timedelta(seconds=i))
+              for i in range(n)]
+    buf, packed_size = allocated(lambda: Reading.pack_records(models))
+    views = Reading.record_views(buf)
+    _, models_size = allocated(lambda: [Reading.construct(**{name: getattr(m, name) for name in Reading._fields})
+                                        for m in models])
+    print('records={} record size={} bytes'.format(n, views.record_size))
+    print('{:24} {:10.1f} MB'.format('models', models_size / 1e6))
+    print('{:24} {:10.1f} MB'.format('packed records', packed_size / 1e6))
+    res = {'models_bytes': models_size, 'packed_bytes': packed_size}
+    scans = [
+        ('models', lambda: sum(m.value for m in models if m.level is Level.low)),
+        ('views', lambda: sum(v.value for v in views if v.level is Level.low)),
+        ('columns', lambda: sum(value for value, level in zip(views.column('value'), views.column('level'))
+                                if level is Level.low)),
+    ]
+    expected = None
+    for name, scan in scans:
+        total, elapsed = timed(scan)
+        assert expected is None or total == expected
+        expected = total
+        print('scan {:19} {:10.1f} ms'.format(name, elapsed * 1e3))
+        res['scan_' + name] = elapsed
+    _, elapsed = timed(lambda: Reading.pack_records(models))
+    print('{:24} {:10.1f} ms'.format('pack_records', elapsed * 1e3))
+    res['pack'] = elapsed
+    return res
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,94 @@
+"""
+Memory of worker processes holding the same reference dataset: each worker decoding its own models
+versus attaching to a `ModelTable` in shared memory. Reports the private memory (not shared with other
+processes) and the PSS of each worker, from /proc (Linux only).
+
+    python -m benchmarks.bench_table [RECORDS] [WORKERS]
+"""
+import multiprocessing
+import sys
+from datetime import datetime, timedelta
+from timeit import default_timer
+
+from pyjo import Model, Field, RangeField, DatetimeField
+from pyjo.table import ModelTable
+
+
+class Product(Model):
+    id = Field(type=int, required=True)
+    name = Field(type=str)
+    category = Field(type=str)
+    price = Field(type=float)
+    stock = RangeField(min=0, max=100000)
+    updated = DatetimeField()
+
+
+def memory():
+    """
+    Private and proportional set size of the process, in bytes
+    """
+    res = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            if key in ('Pss', 'Private_Clean', 'Private_Dirty'):
+                res[key] = int(value.split()[0]) * 1024
+    return res['Private_Clean'] + res['Private_Dirty'], res['Pss']
+
+
+def records(n):
+    start = datetime(2020, 1, 1)
+    return [{'id': i, 'name': 'product{}'.format(i), 'category': 'category{}'.format(i % 50), 'price': i * 0.01,
+             'stock': i % 1000, 'updated': Product.updated.to_dict(start + timedelta(seconds=i))}
+            for i in range(n)]
+
+
+def worker_models(json_value, _):
+    before = memory()[0]
+    products = Product.from_json_many(json_value)
+    total = sum(p.price for p in products if p.category == 'category7')
+    private, pss = memory()
+    return private - before, pss, total
+
+
+def worker_table(_, name):
+    before = memory()[0]
+    with ModelTable.attach(Product, name) as products:
+        total = sum(p.price for p in products if p.category == 'category7')
+        private, pss = memory()
+    return private - before, pss, total
+
+
+def main(n=200000, workers=4):
+    value = Product.to_json_many(Product.from_dicts(records(n)))
+    start = default_timer()
+    table = ModelTable.create(Product, Product.from_json_many(value))
+    print('records={} workers={} table={:.1f} MB built in {:.1f} ms'.format(
+        n, workers, table._shm.size / 1e6, (default_timer() - start) * 1e3))
+    res = {}
+    context = multiprocessing.get_context('fork')
+    try:
+        for mode, worker in (('models', worker_models), ('table', worker_table)):
+            pool = context.Pool(workers)
+            try:
+                start = default_timer()
+                results = pool.starmap(worker, [(value if mode == 'models' else None, table.name)] * workers)
+                elapsed = default_timer() - start
+            finally:
+                pool.close()
+                pool.join()
+            assert len(set(total for _, _, total in results)) == 1
+            private = sum(r[0] for r in results) / float(workers)
+            pss = sum(r[1] for r in results) / float(workers)
+            print('{:8} private {:8.1f} MB/worker  PSS {:8.1f} MB/worker  {:8.1f} ms'.format(
+                mode, private / 1e6, pss / 1e6, elapsed * 1e3))
+            res[mode] = {'private': private, 'pss': pss, 'time': elapsed}
+    finally:
+        table.close()
+        table.unlink()
+    return res
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
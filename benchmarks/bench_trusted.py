@@ -0,0 +1,66 @@
+"""
+Validated versus trusted (`from_dict(..., trusted=True)`) deserialization of deep documents.
+
+    python -m benchmarks.bench_trusted [DEPTH] [WIDTH]
+"""
+import sys
+import timeit
+
+from pyjo import Model, Field, ListField, MapField, RangeField, DatetimeField
+
+
+class Leaf(Model):
+    id = Field(type=int, required=True)
+    name = Field(type=str)
+    score = RangeField(min=0, max=100)
+    created = DatetimeField()
+
+
+class Node(Model):
+    name = Field(type=str, required=True)
+    leaves = ListField(Field(type=Leaf))
+    tags = MapField(Field(type=str))
+
+
+
+
+def make_models(depth):
+    """
+    One model class per level, so that each level nests the next one
+    """
+    child = Node
+    for level in range(depth):
+        child = type(str('Level{}'.format(level)), (Model,), {
+            'name': Field(type=str, required=True),
+            'leaves': ListField(Field(type=Leaf)),
+            'tags': MapField(Field(type=str)),
+            'child': Field(type=child),
+        })
+    return child
+
+
+def make_document(depth, width):
+    leaves = [{'id': i, 'name': 'leaf{}'.format(i), 'score': i % 100, 'created': 1478390400 + i}
+              for i in range(width)]
+    doc = {'name': 'node', 'leaves': leaves, 'tags': {'k{}'.format(i): 'v' for i in range(width)}}
+    for level in range(depth):
+        doc = {'name': 'level{}'.format(level), 'leaves': leaves, 'tags': {'a': 'b'}, 'child': doc}
+    return doc
+
+
+def main(depth=5, width=20, number=200):
+    cls = make_models(depth)
+    doc = make_document(depth, width)
+    assert cls.from_dict(doc).to_dict() == cls.from_dict(doc, trusted=True).to_dict()
+
+    validated = min(timeit.repeat(lambda: cls.from_dict(doc), number=number, repeat=3)) / number
+    trusted = min(timeit.repeat(lambda: cls.from_dict(doc, trusted=True), number=number, repeat=3)) / number
+    print('depth={} width={}'.format(depth, width))
+    print('from_dict                {:10.1f} us'.format(validated * 1e6))
+    print('from_dict(trusted=True)  {:10.1f} us  ({:.2f}x)'.format(trusted * 1e6, validated / trusted))
+    return {'validated': validated, 'trusted': trusted}
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
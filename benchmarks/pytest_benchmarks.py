@@ -0,0 +1,19 @@
+"""
+The benchmark scenarios as a pytest-benchmark suite (not collected by the test suite):
+
+    pytest benchmarks/pytest_benchmarks.py [--benchmark-autosave] [--benchmark-compare]
+"""
+import pytest
+
+from benchmarks.scenarios import SCENARIOS
+
+pytest.importorskip('pytest_benchmark')
+
+_ops = {name: build() for name, build in SCENARIOS.items()}
+_cases = [(name, op) for name in sorted(_ops) for op in sorted(_ops[name])]
+
+
+@pytest.mark.parametrize('name,op', _cases, ids=['{}:{}'.format(name, op) for name, op in _cases])
+def test_scenario(benchmark, name, op):
+    benchmark.group = name
+    benchmark(_ops[name][op])
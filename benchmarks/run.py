@@ -0,0 +1,78 @@
+"""
+Run the benchmark scenarios and optionally save/compare the results.
+
+    python -m benchmarks.run [-s SCENARIO ...] [-o results.json] [-c previous.json]
+
+Timings are the best time per call out of `--repeat` runs, in seconds.
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+from datetime import datetime
+
+import pyjo
+from benchmarks.scenarios import SCENARIOS
+
+
+def measure(function, repeat):
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(names, repeat=5):
+    results = {}
+    for name in names:
+        ops = SCENARIOS[name]()
+        results[name] = {op: measure(function, repeat) for op, function in sorted(ops.items())}
+    return results
+
+
+def _format(seconds):
+    if seconds >= 1e-3:
+        return '{:10.2f} ms'.format(seconds * 1e3)
+    return '{:10.2f} us'.format(seconds * 1e6)
+
+
+def report(results, previous=None):
+    for name, ops in results.items():
+        print(name)
+        for op, seconds in ops.items():
+            line = '    {:28}{}'.format(op, _format(seconds))
+            old = (previous or {}).get(name, {}).get(op)
+            if old:
+                line += '  {:+7.1%}'.format(seconds / old - 1)
+            print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='pyjo benchmarks')
+    parser.add_argument('-s', '--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='scenario to run (default: all)')
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    parser.add_argument('-o', '--output', help='save the results to a JSON file')
+    parser.add_argument('-c', '--compare', help='JSON file of a previous run to compare with')
+    args = parser.parse_args(argv)
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)['results']
+
+    results = run(args.scenario or sorted(SCENARIOS), repeat=args.repeat)
+    report(results, previous)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'pyjo_version': pyjo.__version__,
+                'python': platform.python_version(),
+                'date': datetime.utcnow().isoformat(),
+                'results': results,
+            }, f, indent=2, sort_keys=True)
+    return results
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
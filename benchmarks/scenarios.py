@@ -0,0 +1,410 @@
+"""
+Benchmark scenarios shared by the plain Python runner (`python -m benchmarks.run`) and the
+pytest-benchmark suite (`pytest benchmarks/pytest_benchmarks.py`).
+
+Each scenario maps operation names to functions without arguments. Operations prefixed with
+`dict.` or `dataclass.` are baselines doing the equivalent work without pyjo.
+"""
+import hashlib
+import json
+import re
+from datetime import datetime
+from enum import Enum
+
+from pyjo import Model, Field, ListField, MapField, DatetimeField, EnumField, RegexField, RangeField, ArrayField
+from pyjo import selective
+
+try:
+    import dataclasses
+except ImportError:
+    dataclasses = None
+
+_types = [str, int, float, bool]
+_samples = {str: 'value', int: 42, float: 3.14, bool: True}
+
+
+def _flat_fields(count):
+    return [('f{}'.format(i), _types[i % len(_types)]) for i in range(count)]
+
+
+def _make_model(name, fields):
+    return type(str(name), (Model,), {key: Field(type=t) for key, t in fields})
+
+
+def _make_dataclass(name, fields):
+    return dataclasses.make_dataclass(str(name), fields)
+
+
+def flat(count):
+    fields = _flat_fields(count)
+    cls = _make_model('Flat{}'.format(count), fields)
+    data = {key: _samples[t] for key, t in fields}
+    instance = cls.from_dict(data)
+    ops = {
+        'init': lambda: cls(**data),
+        'from_dict': lambda: cls.from_dict(data),
+        'to_dict': lambda: instance.to_dict(),
+        'dict.copy': lambda: dict(data),
+    }
+    if dataclasses is not None:
+        dc = _make_dataclass('FlatDC{}'.format(count), fields)
+        dc_instance = dc(**data)
+        ops['dataclass.init'] = lambda: dc(**data)
+        ops['dataclass.asdict'] = lambda: dataclasses.asdict(dc_instance)
+    return ops
+
+
+def nested(depth):
+    cls = _make_model('Leaf', _flat_fields(5))
+    data = {key: _samples[t] for key, t in _flat_fields(5)}
+    for level in range(depth):
+        cls = type(str('Level{}'.format(level)), (Model,), {'name': Field(type=str), 'child': Field(type=cls)})
+        data = {'name': 'level{}'.format(level), 'child': data}
+    instance = cls.from_dict(data)
+
+    def copy_dict(d):
+        return {k: copy_dict(v) if isinstance(v, dict) else v for k, v in d.items()}
+
+    ops = {
+        'from_dict': lambda: cls.from_dict(data),
+        'to_dict': lambda: instance.to_dict(),
+        'dict.copy': lambda: copy_dict(data),
+    }
+    if dataclasses is not None:
+        dc = _make_dataclass('LeafDC', _flat_fields(5))
+        dc_data = data
+        for level in range(depth):
+            dc = _make_dataclass('LevelDC{}'.format(level), [('name', str), ('child', dc)])
+
+        def dc_from_dict(d, klass=dc):
+            kwargs = dict(d)
+            if 'child' in kwargs:
+                kwargs['child'] = dc_from_dict(kwargs['child'], klass.__dataclass_fields__['child'].type)
+            return klass(**kwargs)
+
+        dc_instance = dc_from_dict(dc_data)
+        ops['dataclass.from_dict'] = lambda: dc_from_dict(dc_data)
+        ops['dataclass.asdict'] = lambda: dataclasses.asdict(dc_instance)
+    return ops
+
+
+class Item(Model):
+    id = Field(type=int, required=True)
+    name = Field(type=str)
+
+
+def containers(size):
+    class Containers(Model):
+        numbers = ListField(Field(type=int))
+        items = ListField(Field(type=Item))
+        scores = MapField(Field(type=int))
+        matrix = ListField(MapField(Field(type=int)))
+
+    numbers = list(range(size))
+    items = [{'id': i, 'name': 'item'} for i in range(size)]
+    scores = {'k{}'.format(i): i for i in range(size)}
+    cls = Containers
+    list_data = {'numbers': numbers}
+    models_data = {'items': items}
+    map_data = {'scores': scores}
+    nested_data = {'matrix': [{'k{}'.format(j): j for j in range(10)} for _ in range(size // 10)]}
+    list_instance = cls.from_dict(list_data)
+    models_instance = cls.from_dict(models_data)
+    map_instance = cls.from_dict(map_data)
+
+    def append():
+        list_instance.numbers.append(1)
+        list_instance.numbers.pop()
+
+    def reassign():
+        # how appends were validated before lists validated their insertions
+        list_instance.numbers = list_instance.numbers[:-1] + [1]
+
+    return {
+        'list.from_dict': lambda: cls.from_dict(list_data),
+        'list.to_dict': lambda: list_instance.to_dict(),
+        'list.append': append,
+        'list.reassign': reassign,
+        'list_models.from_dict': lambda: cls.from_dict(models_data),
+        'list_models.to_dict': lambda: models_instance.to_dict(),
+        'map.from_dict': lambda: cls.from_dict(map_data),
+        'map.to_dict': lambda: map_instance.to_dict(),
+        'nested.from_dict': lambda: cls.from_dict(nested_data),
+        'dict.list_copy': lambda: list(numbers),
+        'dict.list_models_copy': lambda: [dict(item) for item in items],
+        'dict.map_copy': lambda: dict(scores),
+    }
+
+
+def arrays(size):
+    class Samples(Model):
+        values = ListField(RangeField(min=0, max=1 << 30))
+
+    class ArraySamples(Model):
+        values = ArrayField('q', min=0, max=1 << 30)
+
+    numbers = list(range(size))
+    buffer = ArraySamples(values=numbers).values
+    samples = Samples(values=numbers)
+    array_samples = ArraySamples(values=numbers)
+    return {
+        'list.init': lambda: Samples(values=numbers),
+        'list.to_dict': lambda: samples.to_dict(),
+        'array.init': lambda: ArraySamples(values=numbers),
+        'array.init_buffer': lambda: ArraySamples(values=buffer),
+        'array.to_dict': lambda: array_samples.to_dict(),
+    }
+
+
+class Color(Enum):
+    red = 1
+    green = 2
+    blue = 3
+
+
+class Event(Model):
+    created = DatetimeField()
+    updated = DatetimeField()
+    color = EnumField(Color)
+    code = RegexField(r'^[A-Z]{3}-\d{4}$')
+    email = RegexField(r'^[^@\s]+@[^@\s]+\.[a-z]+$')
+
+
+class CachedEvent(Model):
+    created = DatetimeField()
+    updated = DatetimeField()
+    color = EnumField(Color, cache=16)
+    code = RegexField(r'^[A-Z]{3}-\d{4}$', cache=1024)
+    email = RegexField(r'^[^@\s]+@[^@\s]+\.[a-z]+$', cache=1024)
+
+
+def typed(count):
+    data = [{
+        'created': 1478390400 + i,
+        'updated': 1478390400 + 2 * i,
+        'color': Color(i % 3 + 1).name,
+        'code': 'ABC-{:04d}'.format(i % 100),
+        'email': 'user{}@example.com'.format(i % 100),
+    } for i in range(count)]
+    instances = Event.from_dicts(data)
+    code = re.compile(r'^[A-Z]{3}-\d{4}$')
+    email = re.compile(r'^[^@\s]+@[^@\s]+\.[a-z]+$')
+
+    def dict_decode():
+        res = []
+        for d in data:
+            if not code.match(d['code']) or not email.match(d['email']):
+                raise ValueError(d)
+            res.append({
+                'created': datetime.utcfromtimestamp(d['created']),
+                'updated': datetime.utcfromtimestamp(d['updated']),
+                'color': Color[d['color']],
+                'code': d['code'],
+                'email': d['email'],
+            })
+        return res
+
+    return {
+        'from_dicts': lambda: Event.from_dicts(data),
+        'from_dicts_cached': lambda: CachedEvent.from_dicts(data),
+        'to_dicts': lambda: Event.to_dicts(instances),
+        'dict.decode': dict_decode,
+    }
+
+
+def json_round_trip(count):
+    fields = _flat_fields(10)
+    cls = _make_model('Record', fields)
+    record = {key: _samples[t] for key, t in fields}
+    data = [dict(record, f0='record{}'.format(i)) for i in range(count)]
+    value = json.dumps(data)
+    instances = cls.from_dicts(data)
+    single = json.dumps(record)
+    instance = cls.from_dict(record)
+    return {
+        'from_json': lambda: cls.from_json(single),
+        'to_json': lambda: instance.to_json(),
+        'from_json_many': lambda: cls.from_json_many(value),
+        'to_json_many': lambda: cls.to_json_many(instances),
+        'dict.loads': lambda: json.loads(value),
+        'dict.dumps': lambda: json.dumps(data),
+    }
+
+
+def undeclared(count, blobs):
+    """
+    JSON arrays of records where ~90% of the bytes are under keys the model does not declare:
+    a nested structure of small values, or long strings if `blobs`.
+    `skip_undeclared` operations require pysimdjson
+    """
+    class Owner(Model):
+        id = Field(type=int)
+        name = Field(type=str)
+
+    class Document(Model):
+        id = Field(type=int, required=True)
+        title = Field(type=str)
+        owner = Field(type=Owner)
+        tags = ListField(Field(type=str))
+
+    def record(i):
+        declared = {'id': i, 'title': 'document{}'.format(i), 'owner': {'id': i % 10, 'name': 'owner'},
+                    'tags': ['a', 'b']}
+        size = len(json.dumps(declared)) * 9
+        if blobs:
+            extra = {'payload': 'x' * size}
+        else:
+            extra = {'history': [{'version': v, 'at': 1478390400 + v, 'ok': True, 'by': 'user'}
+                                 for v in range(size // 60)]}
+        declared['owner']['extra'] = {'notes': 'n' * 20}
+        return dict(declared, **extra)
+
+    value = json.dumps([record(i) for i in range(count)])
+    single = json.dumps(record(0))
+    ops = {
+        'from_json': lambda: Document.from_json(single),
+        'from_json_many': lambda: Document.from_json_many(value),
+        'dict.loads': lambda: json.loads(value),
+    }
+    if selective.simdjson is not None:
+        ops['from_json_skip'] = lambda: Document.from_json(single, skip_undeclared=True)
+        ops['from_json_many_skip'] = lambda: Document.from_json_many(value, skip_undeclared=True)
+    return ops
+
+
+def binary(count):
+    """
+    Binary encoding (`to_bytes`/`from_bytes`) of records with nested models, lists and enums, versus JSON
+    """
+    class Color(Enum):
+        red = 1
+        green = 2
+
+    class Point(Model):
+        x = Field(type=int)
+        y = Field(type=int)
+
+    class Shape(Model):
+        id = Field(type=int, required=True)
+        name = Field(type=str)
+        color = EnumField(Color)
+        created = DatetimeField()
+        area = Field(type=float)
+        points = ListField(Field(type=Point))
+        tags = ListField(Field(type=str))
+
+    instances = [Shape(id=i, name='shape{}'.format(i), color=Color.green, created=datetime(2020, 1, 1),
+                       area=i * 1.5, points=[Point(x=j, y=-j) for j in range(4)], tags=['a', 'b'])
+                 for i in range(count)]
+    encoded = [instance.to_bytes() for instance in instances]
+    jsons = [instance.to_json() for instance in instances]
+    return {
+        'to_bytes': lambda: [instance.to_bytes() for instance in instances],
+        'from_bytes': lambda: [Shape.from_bytes(data) for data in encoded],
+        'from_bytes_trusted': lambda: [Shape.from_bytes(data, trusted=True) for data in encoded],
+        'to_json': lambda: [instance.to_json() for instance in instances],
+        'from_json': lambda: [Shape.from_json(data) for data in jsons],
+    }
+
+
+def cached(count):
+    """
+    Repeated serialization of the same models, with and without `_cache_serialization`.
+    `*_after_change` operations change one nested model before serializing again
+    """
+    def make(cache):
+        class Item(Model):
+            _cache_serialization = cache
+            id = Field(type=int)
+            name = Field(type=str)
+            created = DatetimeField()
+
+        class Order(Model):
+            _cache_serialization = cache
+            id = Field(type=int)
+            items = ListField(Field(type=Item))
+            labels = MapField(Field(type=str))
+
+        return Order(id=1, items=[Item(id=i, name='item{}'.format(i), created=datetime(2020, 1, 1))
+                                  for i in range(count)], labels={'a': 'b'})
+
+    plain = make(False)
+    cached = make(True)
+
+    def change(order):
+        item = order.items[0]
+        item.id = 1 - item.id
+        return order
+
+    return {
+        'to_dict': lambda: plain.to_dict(),
+        'to_json': lambda: plain.to_json(),
+        'to_dict_cached': lambda: cached.to_dict(),
+        'to_json_cached': lambda: cached.to_json(),
+        'to_json_after_change': lambda: change(plain).to_json(),
+        'to_json_cached_after_change': lambda: change(cached).to_json(),
+    }
+
+
+def hashing(count):
+    """
+    Content hashes and deduplication of records (half of them duplicates), versus hashing their sorted JSON.
+    Slotted models compute their hash each time, the other models keep theirs until they change
+    """
+    def make(slots):
+        class Point(Model):
+            _slots = slots
+            x = Field(type=int)
+            y = Field(type=int)
+
+        class Shape(Model):
+            _slots = slots
+            id = Field(type=int, required=True)
+            name = Field(type=str)
+            created = DatetimeField()
+            points = ListField(Field(type=Point))
+            labels = MapField(Field(type=str))
+
+        return [Shape(id=i // 2, name='shape{}'.format(i // 2), created=datetime(2020, 1, 1),
+                      points=[Point(x=j, y=-j) for j in range(4)], labels={'a': 'b'})
+                for i in range(count)]
+
+    slotted = make(True)
+    instances = make(False)
+
+    def json_hash(instance):
+        return hashlib.blake2b(json.dumps(instance.to_dict(), sort_keys=True).encode('utf-8'),
+                               digest_size=16).digest()
+
+    def first_hash(instance):
+        # changing a field drops the hash kept by the model
+        instance.id = instance.id
+        return instance.content_hash()
+
+    pairs = list(zip(instances[::2], instances[1::2]))
+    return {
+        'json_hash': lambda: [json_hash(instance) for instance in instances],
+        'content_hash_slots': lambda: [instance.content_hash() for instance in slotted],
+        'content_hash_after_change': lambda: [first_hash(instance) for instance in instances],
+        'content_hash_kept': lambda: [instance.content_hash() for instance in instances],
+        'dedup_json_hash': lambda: len({json_hash(instance) for instance in instances}),
+        'dedup_content_hash': lambda: len({instance.content_hash() for instance in instances}),
+        'eq_pairs': lambda: [a == b for a, b in pairs],
+    }
+
+
+# scenario name -> function building its operations
+SCENARIOS = {
+    'flat-5': lambda: flat(5),
+    'flat-50': lambda: flat(50),
+    'nested-10': lambda: nested(10),
+    'containers-10k': lambda: containers(10000),
+    'arrays-100k': lambda: arrays(100000),
+    'typed-1k': lambda: typed(1000),
+    'json-1k': lambda: json_round_trip(1000),
+    'undeclared-1k': lambda: undeclared(1000, blobs=False),
+    'undeclared-blobs-1k': lambda: undeclared(1000, blobs=True),
+    'binary-1k': lambda: binary(1000),
+    'cached-1k': lambda: cached(1000),
+    'hash-1k': lambda: hashing(1000),
+}
@@ -2,3 +2,5 @@ __version__ = '3.3.0'
 
 from pyjo.model import *
 from pyjo.fields import *
+from pyjo.json_backends import *
+from pyjo.instrumentation import *
@@ -0,0 +1,262 @@
+"""
+Asyncio streaming of models (Python 3.6+), see Model.aiter_json and Model.adump_json
+"""
+import asyncio
+import codecs
+import inspect
+import json
+from timeit import default_timer
+
+from pyjo.codegen import compiled_method
+from pyjo.exceptions import set_error_index
+from pyjo.streaming import DEFAULT_CHUNK_SIZE, DEFAULT_YIELD_EVERY, DEFAULT_YIELD_INTERVAL, _truncated
+
+__all__ = ['aiter_json', 'adump_json']
+
+_whitespace = ' \t\r\n'
+
+
+class _Pacer(object):
+    """
+    Tells when to give control back to the event loop: every `every` records or `interval` seconds
+    """
+
+    def __init__(self, every, interval):
+        self.every = every
+        self.interval = interval
+        self.count = 0
+        self.start = default_timer()
+
+    def due(self):
+        self.count += 1
+        if ((self.every and self.count >= self.every)
+                or (self.interval is not None and default_timer() - self.start >= self.interval)):
+            self.count = 0
+            return True
+        return False
+
+    async def pause(self):
+        await asyncio.sleep(0)
+        self.start = default_timer()
+
+
+async def _chunks(stream, chunk_size):
+    """
+    Text chunks of an asyncio.StreamReader (or any object with a `read(n)` coroutine) or an async iterable,
+    bytes being decoded as UTF-8
+    """
+    if hasattr(stream, 'read'):
+        async def read():
+            while True:
+                chunk = await stream.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        source = read()
+    else:
+        source = stream
+    decoder = None
+    async for chunk in source:
+        if isinstance(chunk, str):
+            yield chunk
+            continue
+        if decoder is None:
+            decoder = codecs.getincrementaldecoder('utf-8')()
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    if decoder is not None:
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield text
+
+
+async def _lines(first, chunks):
+    """
+    Yield `(index, line)` for the non blank lines, the line index counting blank lines too
+    """
+    parts = []
+    index = 0
+    async for chunk in _prepend(first, chunks):
+        parts.append(chunk)
+        if '\n' not in chunk:
+            continue
+        lines = ''.join(parts).split('\n')
+        # the last line continues in the next chunk
+        parts = [lines.pop()]
+        for line in lines:
+            if line.strip():
+                yield index, line
+            index += 1
+    line = ''.join(parts)
+    if line.strip():
+        yield index, line
+
+
+async def _prepend(first, chunks):
+    yield first
+    async for chunk in chunks:
+        yield chunk
+
+
+async def _array(first, chunks):
+    """
+    Yield `(index, value)` for the elements of a JSON array, decoding them as soon as they are complete.
+    An element not complete yet is decoded again once twice as much text is buffered, as the window of
+    streaming.iter_array_elements
+    """
+    raw_decode = json.JSONDecoder().raw_decode
+    buf = first
+    pos = buf.index('[') + 1
+    eof = False
+    index = 0
+    expect_value = True
+    wanted = 0  # length of the text to buffer from `pos` before decoding the pending element again
+    while True:
+        while pos < len(buf) and buf[pos] in _whitespace:
+            pos += 1
+        if pos < len(buf):
+            char = buf[pos]
+            if expect_value:
+                if char == ']' and index == 0:
+                    return
+                end = None
+                if eof or len(buf) - pos >= wanted:
+                    try:
+                        value, end = raw_decode(buf, pos)
+                    except ValueError as e:
+                        if eof or not _truncated(e, buf):
+                            set_error_index(e, index)
+                            raise
+                # a value ending with the buffer may continue (e.g. numbers)
+                if end is not None and (end < len(buf) or eof):
+                    yield index, value
+                    index += 1
+                    pos = end
+                    expect_value = False
+                    wanted = 0
+                    continue
+                wanted = max(wanted, 2 * (len(buf) - pos))
+            elif char == ',':
+                pos += 1
+                expect_value = True
+                continue
+            elif char == ']':
+                return
+            else:
+                raise ValueError('Expecting \',\' delimiter or \']\' in JSON array, found {!r}'.format(char))
+        if eof:
+            raise ValueError('Unterminated JSON array')
+        parts = [buf[pos:]]
+        size = len(parts[0])
+        while True:
+            try:
+                chunk = await chunks.__anext__()
+            except StopAsyncIteration:
+                eof = True
+                break
+            parts.append(chunk)
+            size += len(chunk)
+            if size >= wanted:
+                break
+        buf = ''.join(parts)
+        pos = 0
+
+
+async def aiter_json(cls, stream, array=None, discard_non_fields=True, chunk_size=DEFAULT_CHUNK_SIZE,
+                     yield_every=DEFAULT_YIELD_EVERY, yield_interval=DEFAULT_YIELD_INTERVAL,
+                     skip_invalid=False, invalid=None):
+    """
+    Yield the models of a JSON array or of JSON Lines read from a stream. See Model.aiter_json
+    """
+    chunks = _chunks(stream, chunk_size)
+    try:
+        async for instance in _decode(cls, chunks, array, discard_non_fields, yield_every, yield_interval,
+                                      skip_invalid, invalid):
+            yield instance
+    finally:
+        # the stream may not be read until its end (e.g. data after a JSON array)
+        await chunks.aclose()
+
+
+async def _decode(cls, chunks, array, discard_non_fields, yield_every, yield_interval, skip_invalid, invalid):
+    first = ''
+    async for chunk in chunks:
+        first += chunk
+        if first.strip():
+            break
+    if not first.strip():
+        return
+    if array is None:
+        array = first.lstrip()[0] == '['
+    elif array and first.lstrip()[0] != '[':
+        raise ValueError('Expecting a JSON array')
+
+    decode = compiled_method(cls, 'from_dict')
+    loads = cls.json_backend().loads
+    pacer = _Pacer(yield_every, yield_interval)
+    records = _array(first, chunks) if array else _lines(first, chunks)
+    async for index, value in records:
+        try:
+            instance = decode(value if array else loads(value), discard_non_fields=discard_non_fields)
+        except Exception as e:
+            if not skip_invalid:
+                set_error_index(e, index)
+                raise
+            if invalid is not None:
+                invalid.append((index, value, e))
+            instance = None
+        if instance is not None:
+            yield instance
+        if pacer.due():
+            await pacer.pause()
+
+
+async def _iterate(instances):
+    if hasattr(instances, '__aiter__'):
+        async for instance in instances:
+            yield instance
+    else:
+        for instance in instances:
+            yield instance
+
+
+async def _write(writer, buffer):
+    res = writer.write(b''.join(buffer))
+    if inspect.isawaitable(res):
+        await res
+    drain = getattr(writer, 'drain', None)
+    if drain is not None:
+        await drain()
+
+
+async def adump_json(cls, instances, writer, array=False, chunk_size=DEFAULT_CHUNK_SIZE,
+                     yield_every=DEFAULT_YIELD_EVERY, yield_interval=DEFAULT_YIELD_INTERVAL):
+    """
+    Write the models to a stream as JSON Lines or as a JSON array. See Model.adump_json
+    """
+    pacer = _Pacer(yield_every, yield_interval)
+    buffer = [b'['] if array else []
+    size = 0
+    count = 0
+    async for instance in _iterate(instances):
+        data = instance.to_json_bytes()
+        if array:
+            if count:
+                buffer.append(b',')
+        else:
+            data += b'\n'
+        buffer.append(data)
+        size += len(data)
+        count += 1
+        if size >= chunk_size:
+            await _write(writer, buffer)
+            buffer = []
+            size = 0
+        if pacer.due():
+            await pacer.pause()
+    if array:
+        buffer.append(b']')
+    if buffer:
+        await _write(writer, buffer)
+    return count
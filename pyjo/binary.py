@@ -0,0 +1,544 @@
+"""
+Compact binary encoding of models, generated from their `_fields` (see Model.to_bytes).
+
+A record is a presence bitmap (one bit per field, in the order of `_fields`) followed by the values
+of the fields present: ints and datetimes as zigzag varints, floats as 8 bytes, strings and bytes
+length-prefixed, enums as varint ordinals, lists and maps as a varint count followed by their elements,
+nested models as records, arrays of ArrayField as their raw machine values. Fields the codec
+does not know are stored as the JSON of their `to_dict`.
+An encoded model starts with an 8-byte fingerprint of the schema, checked by the reader.
+
+The content hash of a model is a digest of the same encoding, maps hashed in key order, JSON with
+sorted keys and floats equal to zero as 0.0 (-0.0 == 0.0). Nested models contribute their own (memoized) content hash, except for slotted models not
+caching their serialization, encoded inline (see Model.content_hash).
+"""
+import array
+import hashlib
+import json
+import linecache
+import struct
+import sys
+import weakref
+from datetime import datetime
+
+from six import iteritems, text_type, binary_type, PY2
+
+from pyjo import codegen
+from pyjo.codegen import _inherits
+from pyjo.exceptions import SchemaMismatchError
+from pyjo.fields.arrayfield import ArrayField
+from pyjo.fields.containers import ValidatedList, ValidatedDict
+from pyjo.fields.datetimefield import DatetimeField, dt_to_timestamp
+from pyjo.fields.enumfield import EnumField
+from pyjo.fields.field import Field
+from pyjo.fields.listfield import ListField
+from pyjo.fields.mapfield import MapField
+
+__all__ = ['encode', 'decode', 'fingerprint', 'content_hash']
+
+FORMAT_VERSION = 1
+FINGERPRINT_SIZE = 8
+CONTENT_HASH_SIZE = 16
+
+_codecs = weakref.WeakKeyDictionary()  # model class -> _ModelCodec
+_double = struct.Struct('<d')
+_blake2b = getattr(hashlib, 'blake2b', None)  # Python 3.6+
+
+
+def _write_uvarint(out, n):
+    while n >= 0x80:
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_uvarint(buf, pos):
+    res = 0
+    shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        res |= (b & 0x7f) << shift
+        if b < 0x80:
+            return res, pos
+        shift += 7
+
+
+def _write_zigzag(out, n):
+    _write_uvarint(out, n << 1 if n >= 0 else ((-n) << 1) - 1)
+
+
+def _read_zigzag(buf, pos):
+    n, pos = _read_uvarint(buf, pos)
+    return (n >> 1) ^ -(n & 1), pos
+
+
+def _positive_zeros(value):
+    """
+    JSON value with its -0.0 floats replaced by 0.0, equal values being hashed the same
+    """
+    if value.__class__ is float:
+        return value + 0.0
+    if isinstance(value, dict):
+        return {k: _positive_zeros(v) for k, v in iteritems(value)}
+    if isinstance(value, (list, tuple)):
+        return [_positive_zeros(v) for v in value]
+    return value
+
+
+def _hashed_floats(value):
+    """
+    Float array with its -0.0 replaced by 0.0 for hashing, copied only if it contains zeros
+    """
+    if 0.0 not in value:
+        return value
+    if isinstance(value, array.array):
+        return array.array(value.typecode, [x + 0.0 for x in value])
+    return value + 0.0
+
+
+def _dumps_json(field, value, sort_keys):
+    """
+    JSON of a value stored as JSON, with sorted keys if possible (keys of different types can't be sorted)
+    and -0.0 as 0.0 when hashed
+    """
+    d = field.to_dict(value)
+    if sort_keys:
+        d = _positive_zeros(d)
+        try:
+            return json.dumps(d, sort_keys=True)
+        except TypeError:
+            pass
+    try:
+        return json.dumps(d)
+    except (TypeError, ValueError) as e:
+        raise TypeError('{} value can\'t be encoded, it is not JSON serializable: {}'.format(field.name, e))
+
+
+def _is_plain(field, cls):
+    """
+    True if the field converts its values as `cls` does, so the codec of `cls` can encode them
+    """
+    return (isinstance(field, cls) and field._to_dict is None and field._from_dict is None
+            and _inherits(field, cls, ('to_dict', 'from_dict')))
+
+
+def _kind(field):
+    """
+    Name of the codec of the values of a field
+    """
+    if _is_plain(field, ListField):
+        return 'list'
+    if _is_plain(field, MapField):
+        return 'map'
+    if _is_plain(field, ArrayField):
+        return 'array'
+    if _is_plain(field, DatetimeField):
+        return 'datetime'
+    if _is_plain(field, EnumField):
+        return 'enum'
+    if _is_plain(field, Field):
+        t = field._type
+        if getattr(t, '_fields', None) is not None:
+            # nested models converting themselves are stored as their JSON
+            return 'model' if _is_generic(t, ('to_dict', 'from_dict')) else 'json'
+        if t is bool:
+            return 'bool'
+        if t is int:
+            return 'int'
+        if t is float:
+            return 'float'
+        if t is text_type:
+            return 'str'
+        if t is binary_type and not PY2:
+            return 'bytes'
+    return 'json'
+
+
+def _generic_methods():
+    from pyjo.model import _generic_methods
+    return _generic_methods()
+
+
+def _is_generic(cls, names):
+    generic = _generic_methods()
+    return all(codegen._is_generic(cls, name, generic[name]) for name in names)
+
+
+def _describe(field, seen):
+    """
+    Canonical description of the encoding of a field, hashed into the fingerprint
+    """
+    kind = _kind(field)
+    if kind in ('list', 'map'):
+        return '{}<{}>'.format(kind, _describe(field.inner_field, seen))
+    if kind == 'array':
+        # raw machine values
+        return 'array<{}{}{}>'.format(field.typecode, array.array(field.typecode).itemsize, sys.byteorder)
+    if kind == 'enum':
+        return 'enum<{}>'.format(','.join(member.name for member in field.enum_cls))
+    if kind == 'model':
+        return 'model<{}>'.format(_describe_model(field._type, seen))
+    return kind
+
+
+def _describe_model(cls, seen):
+    """
+    Description of the fields of a model class, its name is not part of the schema
+    """
+    if cls in seen:
+        # models nesting themselves refer to the enclosing model
+        return 'ref<{}>'.format(seen.index(cls))
+    seen = seen + (cls,)
+    return '{{{}}}'.format(';'.join(
+        '{}:{}'.format(name, _describe(field, seen)) for name, field in iteritems(cls._fields)))
+
+
+def fingerprint(cls):
+    """
+    Fingerprint of the binary schema of a model class: models encoded by a class with a different
+    fingerprint can't be decoded
+    """
+    return _codec(cls).fingerprint
+
+
+class _Generator(object):
+    """
+    Source of the encode/decode functions of a model class, straight-line code for each field
+    """
+
+    def __init__(self, cls, hashing=False):
+        self.cls = cls
+        # encoding hashed by content_hash
+        self.hashing = hashing
+        self.ns = {
+            'C': cls,
+            'write_uvarint': _write_uvarint,
+            'read_uvarint': _read_uvarint,
+            'write_zigzag': _write_zigzag,
+            'read_zigzag': _read_zigzag,
+            'pack_double': _double.pack,
+            'unpack_double': _double.unpack_from,
+            'dt_to_timestamp': dt_to_timestamp,
+            'utcfromtimestamp': datetime.utcfromtimestamp,
+            'ValidatedList': ValidatedList,
+            'ValidatedDict': ValidatedDict,
+            'dumps_json': _dumps_json,
+            'loads': json.loads,
+        }
+        self.counter = 0
+
+    def var(self, prefix):
+        # distinct from the names bound by codegen._Builder, sharing the namespace of decode
+        self.counter += 1
+        return '{}_{}'.format(prefix, self.counter)
+
+    def bind(self, prefix, value):
+        name = self.var(prefix)
+        self.ns[name] = value
+        return name
+
+    def encode(self, field, v):
+        """
+        Lines appending the encoding of the value `v` of the field to `out`
+        """
+        kind = _kind(field)
+        if kind == 'int':
+            # zigzag inlined for one-byte values
+            return ['if -64 <= {v} < 64:'.format(v=v),
+                    '    out.append(({v} << 1) ^ ({v} >> 7))'.format(v=v),
+                    'else:',
+                    '    write_zigzag(out, {v})'.format(v=v)]
+        if kind == 'bool':
+            return ['out.append(1 if {} else 0)'.format(v)]
+        if kind == 'float':
+            if self.hashing:
+                return ['out += pack_double({} + 0.0)'.format(v)]
+            return ['out += pack_double({})'.format(v)]
+        if kind in ('str', 'bytes', 'json', 'array'):
+            b = self.var('b')
+            if kind == 'str':
+                lines = ['{} = {}.encode(\'utf-8\')'.format(b, v)]
+            elif kind == 'bytes':
+                lines = ['{} = {}'.format(b, v)]
+            elif kind == 'array':
+                if self.hashing and field.typecode in ('f', 'd'):
+                    v = '{}({})'.format(self.bind('hashed_floats', _hashed_floats), v)
+                lines = ['{} = {}.to_buffer({})'.format(b, self.bind('f', field), v)]
+            else:
+                lines = ['{} = dumps_json({}, {}, {}).encode(\'utf-8\')'.format(
+                    b, self.bind('f', field), v, self.hashing)]
+            return lines + ['write_uvarint(out, len({}))'.format(b), 'out += {}'.format(b)]
+        if kind == 'datetime':
+            return ['write_zigzag(out, dt_to_timestamp({}))'.format(v)]
+        if kind == 'enum':
+            ordinals = {member: i for i, member in enumerate(field.enum_cls)}
+            return ['write_uvarint(out, {}[{}])'.format(self.bind('ordinals', ordinals), v)]
+        if kind == 'model':
+            t = field._type
+            if self.hashing:
+                # hashes of nested models are combined, as kept by the models, except for the models
+                # which can't keep theirs (slotted without cache), hashed inline
+                if not t._slots or t._cache_serialization:
+                    return ['out += {}.content_hash()'.format(v)]
+                return ['if {}.__class__ is {}:'.format(v, self.bind('T', t)),
+                        '    {}.hash_encode({}, out)'.format(self.bind('codec', _codec(t)), v),
+                        'else:',
+                        '    out += {}.content_hash()'.format(v)]
+            return ['{}.encode({}, out)'.format(self.bind('codec', _codec(t)), v)]
+        x = self.var('x')
+        if kind == 'list':
+            return (['write_uvarint(out, len({}))'.format(v),
+                     'for {} in {}:'.format(x, v)]
+                    + _indent(self.encode(field.inner_field, x)))
+        k = self.var('k')
+        items = 'sorted({}.items())' if self.hashing else '{}.items()'
+        return (['write_uvarint(out, len({}))'.format(v),
+                 'for {}, {} in {}:'.format(k, x, items.format(v))]
+                + _indent(self.encode_key(k) + self.encode(field.inner_field, x)))
+
+    def encode_key(self, k):
+        b = self.var('b')
+        return ['{} = {}.encode(\'utf-8\')'.format(b, k), 'write_uvarint(out, len({}))'.format(b),
+                'out += {}'.format(b)]
+
+    def read_uvarint(self, n):
+        """
+        Lines reading a varint into `n`, inlined for values below 128 (most lengths and counts)
+        """
+        return ['{} = buf[pos]'.format(n),
+                'if {} < 0x80:'.format(n),
+                '    pos += 1',
+                'else:',
+                '    {}, pos = read_uvarint(buf, pos)'.format(n)]
+
+    def decode(self, field, v):
+        """
+        Lines decoding the value of the field at `pos` into `v`, advancing `pos`
+        """
+        kind = _kind(field)
+        if kind == 'int':
+            b = self.var('b')
+            return ['{} = buf[pos]'.format(b),
+                    'if {} < 0x80:'.format(b),
+                    '    {v} = ({b} >> 1) ^ -({b} & 1)'.format(v=v, b=b),
+                    '    pos += 1',
+                    'else:',
+                    '    {}, pos = read_zigzag(buf, pos)'.format(v)]
+        if kind == 'bool':
+            return ['{} = buf[pos] != 0'.format(v), 'pos += 1']
+        if kind == 'float':
+            return ['{} = unpack_double(buf, pos)[0]'.format(v), 'pos += 8']
+        if kind in ('str', 'bytes', 'json', 'array'):
+            n = self.var('n')
+            lines = self.read_uvarint(n)
+            raw = 'buf[pos:pos + {}]'.format(n)
+            if kind == 'str':
+                lines += ['{} = {}.decode(\'utf-8\')'.format(v, raw)]
+            elif kind == 'bytes':
+                lines += ['{} = bytes({})'.format(v, raw)]
+            elif kind == 'array':
+                # cast only converts the raw values to an array of the field, validation is left to the model
+                lines += ['{} = {}.cast(bytes({}))'.format(v, self.bind('f', field), raw)]
+            else:
+                lines += ['{} = {}.from_dict(loads({}.decode(\'utf-8\')))'.format(v, self.bind('f', field), raw)]
+            return lines + ['pos += {}'.format(n)]
+        if kind == 'datetime':
+            return ['{}, pos = read_zigzag(buf, pos)'.format(v), '{v} = utcfromtimestamp({v})'.format(v=v)]
+        if kind == 'enum':
+            n = self.var('n')
+            return self.read_uvarint(n) + ['{} = {}[{}]'.format(v, self.bind('members', list(field.enum_cls)), n)]
+        if kind == 'model':
+            return ['{}, pos = {}.decode(buf, pos, trusted)'.format(
+                v, self.bind('codec', _codec(field._type)))]
+        n, i, x = self.var('n'), self.var('i'), self.var('x')
+        # the elements are checked as decoded unless trusted, the model then sees the container as validated
+        inner = self.bind('f', field.inner_field)
+        check = '{} if trusted else {}({})'.format(x, self.bind('check', field.inner_field.checker()), x)
+        if kind == 'list':
+            return (self.read_uvarint(n)
+                    + ['{} = ValidatedList(field={})'.format(v, inner),
+                       'for {} in range({}):'.format(i, n)]
+                    + _indent(self.decode(field.inner_field, x) + ['list.append({}, {})'.format(v, check)]))
+        k = self.var('k')
+        return (self.read_uvarint(n)
+                + ['{} = ValidatedDict(field={})'.format(v, inner),
+                   'for {} in range({}):'.format(i, n)]
+                + _indent(self.decode_key(k) + self.decode(field.inner_field, x)
+                          + ['dict.__setitem__({}, {}, {})'.format(v, k, check)]))
+
+    def decode_key(self, k):
+        n = self.var('n')
+        return self.read_uvarint(n) + ['{} = buf[pos:pos + {}].decode(\'utf-8\')'.format(k, n),
+                                       'pos += {}'.format(n)]
+
+    def build_encode(self, function='encode'):
+        fields = list(iteritems(self.cls._fields))
+        size = (len(fields) + 7) // 8
+        lines = ['def {}(self, out):'.format(function),
+                 '    start = len(out)',
+                 '    out += {}'.format(repr(b'\0' * size)),
+                 '    bits = 0']
+        for i, (name, field) in enumerate(fields):
+            lines += _indent(['v = self.{}'.format(name),
+                              'if v is not None:',
+                              '    bits |= {}'.format(1 << i)]
+                             + _indent(self.encode(field, 'v')))
+        lines += ['    out[start + {}] = (bits >> {}) & 0xff'.format(k, 8 * k) for k in range(size)]
+        return self.exec_function(function, lines)
+
+    def build_decode(self):
+        fields = list(iteritems(self.cls._fields))
+        size = (len(fields) + 7) // 8
+        lines = ['def decode(buf, pos, trusted):',
+                 '    bits = {}'.format(' | '.join('(buf[pos + {}] << {})'.format(k, 8 * k) for k in range(size))
+                                        or '0'),
+                 '    pos += {}'.format(size)]
+        for i, (name, field) in enumerate(fields):
+            lines += _indent(['if bits & {}:'.format(1 << i)] + _indent(self.decode(field, 'v_{}'.format(i))))
+        lines += ['    if bits >> {}:'.format(len(fields)),
+                  '        raise ValueError(\'Invalid presence bitmap\')']
+        generic = _generic_methods()
+        if codegen._builds_instances(self.cls, generic):
+            builder = codegen._Builder(self.cls, generic)
+            if codegen._is_generic(self.cls, 'construct', generic['construct']):
+                build_trusted = self.build_instance(builder, fields, trusted=True)
+            else:
+                build_trusted = self.build_kwargs(fields) + ['self = C.construct(**kwargs)']
+            lines += (['    if trusted:'] + _indent(build_trusted, 2)
+                      + ['    else:'] + _indent(self.build_instance(builder, fields), 2)
+                      + ['    return self, pos'])
+            self.ns.update(builder.ns)
+        else:
+            lines += _indent(self.build_kwargs(fields))
+            lines += ['    return (C.construct(**kwargs) if trusted else C(**kwargs)), pos']
+        return self.exec_function('decode', lines)
+
+    def build_kwargs(self, fields):
+        lines = ['kwargs = {}']
+        for i, (name, field) in enumerate(fields):
+            lines += ['if bits & {}:'.format(1 << i), '    kwargs[{}] = v_{}'.format(repr(name), i)]
+        return lines
+
+    def build_instance(self, builder, fields, trusted=False):
+        """
+        Lines building the model from the decoded values as its generated `__init__` (or `construct` if trusted):
+        the values given are stored first, then the defaults of the others
+        """
+        lines = ['self = new(C)', builder.init_storage()]
+        missing = []
+        for i, (name, field) in enumerate(fields):
+            v = 'v_{}'.format(i)
+            if trusted:
+                store = builder.store_trusted(i, name, field, v)
+                default = builder.default(i, field, 'v')
+                if default:
+                    empty = ['v = None'] + default + builder.store_trusted(i, name, field, 'v')
+                else:
+                    empty = builder.store_trusted(i, name, field, 'None')
+            else:
+                store = self.store_decoded(builder, i, name, field, v)
+                empty = builder.store_empty(i, name, field)
+            lines += ['if bits & {}:'.format(1 << i)] + _indent(store)
+            missing += ['if not bits & {}:'.format(1 << i)] + _indent(empty)
+        return lines + missing + builder.after_init()
+
+    def store_decoded(self, builder, i, name, field, v):
+        """
+        Lines storing a decoded value, validated as by setting the field. Lists and maps of plain fields
+        are stored as decoded, their elements being checked while decoded
+        """
+        kind = _kind(field)
+        if (kind in ('list', 'map') and field._validator is None and field._cast is None
+                and builder.is_plain(name, field) and builder.inherits(field, ('__set__', 'name'))
+                and _inherits(field, ListField if kind == 'list' else MapField,
+                              ('cast', 'validate', 'cast_and_validate'))):
+            return ['{} = {}'.format(builder.target(name, field), v)]
+        return builder.store(i, name, field, v, not_none=True)
+
+    def exec_function(self, name, lines):
+        source = '\n'.join(lines) + '\n'
+        filename = '<pyjo generated binary {} {}.{}>'.format(name, self.cls.__module__, self.cls.__name__)
+        exec(compile(source, filename, 'exec'), self.ns)
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        return self.ns.pop(name)
+
+
+def _indent(lines, level=1):
+    return ['    ' * level + line for line in lines]
+
+
+class _ModelCodec(object):
+    """
+    Binary codec of a model class, its functions are generated on first use
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.fingerprint = hashlib.sha1('pyjo binary {} {}'.format(
+            FORMAT_VERSION, _describe_model(cls, ())).encode('utf-8')).digest()[:FINGERPRINT_SIZE]
+
+    def encode(self, instance, out):
+        self.compile()
+        return self.encode(instance, out)
+
+    def decode(self, buf, pos, trusted):
+        self.compile()
+        return self.decode(buf, pos, trusted)
+
+    def hash_encode(self, instance, out):
+        self.hash_encode = _Generator(self.cls, hashing=True).build_encode('hash_encode')
+        return self.hash_encode(instance, out)
+
+    def compile(self):
+        generator = _Generator(self.cls)
+        # set on the instance, replacing the methods compiling the codec
+        self.encode = generator.build_encode()
+        self.decode = generator.build_decode()
+
+
+def _codec(cls):
+    codec = _codecs.get(cls)
+    if codec is None:
+        codec = _codecs[cls] = _ModelCodec(cls)
+    return codec
+
+
+def encode(instance):
+    """
+    Binary encoding of a model, prefixed by the fingerprint of its class. See Model.to_bytes
+    """
+    codec = _codec(type(instance))
+    out = bytearray(codec.fingerprint)
+    codec.encode(instance, out)
+    return bytes(out)
+
+
+def decode(cls, data, trusted=False):
+    """
+    Model decoded from its binary encoding. See Model.from_bytes
+    """
+    codec = _codec(cls)
+    if bytes(data[:FINGERPRINT_SIZE]) != codec.fingerprint:
+        raise SchemaMismatchError('Binary data was not encoded with the schema of {}'.format(cls.__name__))
+    # indexing gives ints
+    buf = data if isinstance(data, (bytes, bytearray)) and not PY2 else bytearray(data)
+    try:
+        instance, pos = codec.decode(buf, FINGERPRINT_SIZE, trusted)
+    except (IndexError, struct.error, UnicodeDecodeError):
+        raise ValueError('Truncated or invalid binary data for {}'.format(cls.__name__))
+    if pos != len(buf):
+        raise ValueError('Extra data after the binary encoding of {}'.format(cls.__name__))
+    return instance
+
+
+def content_hash(instance):
+    """
+    Digest of the fingerprint of the class and of the values of a model. See Model.content_hash
+    """
+    codec = _codec(type(instance))
+    out = bytearray(codec.fingerprint)
+    codec.hash_encode(instance, out)
+    if _blake2b is None:
+        return hashlib.sha1(out).digest()[:CONTENT_HASH_SIZE]
+    return _blake2b(out, digest_size=CONTENT_HASH_SIZE).digest()
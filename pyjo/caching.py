@@ -0,0 +1,187 @@
+"""
+Serialization cache of the models: the results of `content_hash` are kept until a field of the model changes,
+or a field of one of the models it contains, as well as the results of `to_dict` and `to_json` of the models
+declared with `_cache_serialization = True`.
+
+The cache of a model is valid only if every value it was built from notifies the model when it changes:
+nested models caching their serialization too, and lists and maps of the model (`ValidatedList`,
+`ValidatedDict`). Models holding other mutable values (plain lists, arrays...) or raw values of a lazy
+`from_dict` are serialized each time, as well as the models with `_slots = True` not caching their
+serialization, having no slot for the cache.
+"""
+import array
+import weakref
+
+from pyjo.fields.containers import ValidatedList, ValidatedDict
+from pyjo.fields.field import LazyValue
+
+__all__ = ['SerializationCache', 'cached_dict', 'store_dict', 'cached_json', 'cached_hash', 'store_hash',
+           'invalidate']
+
+# values which may change in place without notice
+_untracked = (list, dict, set, bytearray, array.array, LazyValue)
+
+
+def _dropped():
+    return None
+
+
+class SerializationCache(object):
+    """
+    Cached serialization of a model, with the models containing it to invalidate when it changes.
+    Not shared by copies of the model, nor pickled
+    """
+    __slots__ = ('owner', 'dict', 'json', 'hash', 'parents')
+
+    def __init__(self, owner):
+        self.owner = weakref.ref(owner)
+        self.dict = None  # result of to_dict
+        self.json = None  # (JSON backend, bytes) -> result of to_json or to_json_bytes
+        self.hash = None  # result of content_hash
+        self.parents = None  # weak references to the cached models containing the model
+
+    def __reduce__(self):
+        return _dropped, ()
+
+    def is_empty(self):
+        # the JSON is cached along with the dict
+        return self.dict is None and self.hash is None
+
+
+def _cache(instance):
+    """
+    Cache of the model, None if it has none (copies of a model get their own)
+    """
+    cache = getattr(instance, '_serialization', None)
+    if cache is None or cache.owner() is not instance:
+        return None
+    return cache
+
+
+def cached_dict(instance):
+    """
+    Cached result of to_dict, None if not cached
+    """
+    cache = _cache(instance)
+    return None if cache is None else cache.dict
+
+
+def _adopt(parent, value):
+    """
+    Register the model `parent` (a weak reference) as containing the value.
+    False if changes of the value can't be tracked
+    """
+    if getattr(value, '_fields', None) is not None:
+        cache = _cache(value)
+        if cache is None or cache.is_empty():
+            return False
+        parents = cache.parents
+        if parents is None:
+            cache.parents = [parent]
+        else:
+            # weak references compare equal if their models do, compared by identity (the weak references
+            # to a model are usually the same object)
+            for ref in parents:
+                if ref is parent or ref() is parent():
+                    break
+            else:
+                parents.append(parent)
+        return True
+    if value.__class__ is ValidatedList or value.__class__ is ValidatedDict:
+        value.owner = parent
+        field = value.field
+        t = None if field is None else field._type
+        if t is not None and getattr(t, '_fields', None) is None and not issubclass(t, _untracked):
+            # immutable elements
+            return True
+        for element in (value.values() if value.__class__ is ValidatedDict else value):
+            if element is not None and not _adopt(parent, element):
+                return False
+        return True
+    return not isinstance(value, _untracked)
+
+
+def _tracked_cache(instance):
+    """
+    Cache of the model (created if needed) if the changes of all its values are tracked, None otherwise
+    """
+    parent = weakref.ref(instance)
+    for field in instance._fields.values():
+        value = field.get_raw(instance)
+        if value is not None and not _adopt(parent, value):
+            return None
+    cache = _cache(instance)
+    if cache is None:
+        cache = instance._serialization = SerializationCache(instance)
+        if not instance._notify_changes:
+            # the fields of the instance now report their changes
+            instance._notify_changes = True
+    return cache
+
+
+def store_dict(instance, res):
+    """
+    Cache the result of to_dict if the changes of all the values of the model are tracked. Returns it, or a copy
+    of it if cached: the cached dict itself is not returned by to_dict
+    """
+    cache = _tracked_cache(instance)
+    if cache is not None:
+        cache.dict = res
+        return dict(res)
+    return res
+
+
+def cached_json(instance, binary):
+    """
+    Result of to_json (to_json_bytes if `binary`) without indentation, cached along with the dict
+    """
+    backend = instance.json_backend()
+    key = (backend, binary)
+    cache = _cache(instance)
+    if cache is not None and cache.json is not None:
+        res = cache.json.get(key)
+        if res is not None:
+            return res
+    d = instance.to_dict()
+    res = backend.dumps_bytes(d) if binary else backend.dumps(d)
+    cache = _cache(instance)
+    if cache is not None and cache.dict is not None:
+        if cache.json is None:
+            cache.json = {}
+        cache.json[key] = res
+    return res
+
+
+def cached_hash(instance):
+    """
+    Cached result of content_hash, None if not cached
+    """
+    cache = _cache(instance)
+    return None if cache is None else cache.hash
+
+
+def store_hash(instance, res):
+    """
+    Cache the result of content_hash, as store_dict
+    """
+    if not instance._slots or instance._cache_serialization:
+        cache = _tracked_cache(instance)
+        if cache is not None:
+            cache.hash = res
+    return res
+
+
+def invalidate(instance):
+    """
+    Drop the cached serialization of the model and of the models containing it
+    """
+    cache = _cache(instance)
+    if cache is None or cache.is_empty():
+        # the models containing it were not cached either
+        return
+    parents = cache.parents
+    cache.dict = cache.json = cache.hash = cache.parents = None
+    for parent in parents or ():
+        parent = parent()
+        if parent is not None:
+            invalidate(parent)
@@ -0,0 +1,116 @@
+"""
+Change tracking of the models declared with `_track_changes = True`, see `Model.to_dict_changes`.
+
+Fields report their changes when set or deleted. Lists and maps of the model (`ValidatedList`, `ValidatedDict`,
+nested ones included) report their changes in place: they are bound to the model when it is clean (constructed,
+decoded lazily, unpickled or marked clean). Nested models are tracked if their class tracks changes. The values
+whose changes can't be known (nested models not tracking changes, plain lists and dicts, and the lists and maps
+holding them) are reported as changed whole.
+"""
+import array
+import weakref
+
+from pyjo import caching
+from pyjo.fields.containers import ValidatedList, ValidatedDict
+from pyjo.fields.field import LazyValue
+
+__all__ = ['reset', 'bind', 'bind_value', 'container_changed', 'is_clean', 'mark_clean']
+
+# values which may change in place without notice
+_mutable = (list, dict, set, bytearray, array.array)
+
+
+def _is_container(value):
+    return value.__class__ is ValidatedList or value.__class__ is ValidatedDict
+
+
+def _elements(container):
+    return container.values() if container.__class__ is ValidatedDict else container
+
+
+def _immutable_elements(container):
+    field = container.field
+    t = None if field is None else field._type
+    return t is not None and getattr(t, '_fields', None) is None and not issubclass(t, _mutable)
+
+
+def reset(instance):
+    """
+    Start tracking the changes of a model from its current state
+    """
+    instance._changes = None
+    bind(instance)
+
+
+def bind(instance):
+    """
+    Bind the lists and maps of the fields of the model to it, so that they report their changes
+    """
+    ref = None
+    for field in instance._fields.values():
+        value = field.get_raw(instance)
+        if value is not None and _is_container(value):
+            if ref is None:
+                ref = weakref.ref(instance)
+            bind_value(ref, value)
+
+
+def bind_value(ref, value):
+    """
+    Bind a list or map and the lists and maps it contains to the model `ref` (a weak reference)
+    """
+    if not _is_container(value):
+        return
+    value.owner = ref
+    if not _immutable_elements(value):
+        for element in _elements(value):
+            bind_value(ref, element)
+
+
+def _holds(value, container):
+    if value is container:
+        return True
+    if value is None or not _is_container(value) or _immutable_elements(value):
+        return False
+    return any(_holds(element, container) for element in _elements(value))
+
+
+def container_changed(instance, container):
+    """
+    Record the field of the model holding a list or map changed in place
+    """
+    for name, field in instance._fields.items():
+        if _holds(field.get_raw(instance), container):
+            instance._field_changed(name)
+            return
+    # no longer held by the model
+    caching.invalidate(instance)
+
+
+def is_clean(value):
+    """
+    False if a value held by a model may have changed since the model was clean. Lists and maps changed in place
+    are reported by the model itself
+    """
+    if value is None or value.__class__ is LazyValue:
+        # raw values of a lazy from_dict are decoded on access
+        return True
+    if getattr(value, '_fields', None) is not None:
+        if not value._track_changes or getattr(value, '_changes', None):
+            return False
+        return all(is_clean(field.get_raw(value)) for field in value._fields.values())
+    if _is_container(value):
+        return _immutable_elements(value) or all(is_clean(element) for element in _elements(value))
+    return not isinstance(value, _mutable)
+
+
+def mark_clean(value):
+    """
+    Forget the changes of the models held by a field, in lists and maps too
+    """
+    if getattr(value, '_fields', None) is not None:
+        if value._track_changes:
+            value.mark_clean()
+    elif _is_container(value) and not _immutable_elements(value):
+        for element in _elements(value):
+            mark_clean(element)
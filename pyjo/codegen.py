@@ -0,0 +1,667 @@
+import linecache
+import threading
+import weakref
+
+from six import iteritems
+
+from pyjo import caching, changes
+from pyjo.exceptions import Error, RequiredFieldError, FieldTypeError, ValidationError
+from pyjo.fields.field import Field, SlotStorage, LazyValue
+
+__all__ = ['compile_model', 'suspend_compilation', 'resume_compilation', 'compiled_method']
+
+_models = weakref.WeakKeyDictionary()  # model classes given to compile_model -> generic methods of Model
+_suspended = False
+_generated_methods = ('__init__', 'from_dict', 'construct', 'to_dict')
+_classmethods = ('from_dict', 'construct')
+_lock = threading.RLock()
+
+
+def _lookup(cls, name):
+    """
+    Return the raw attribute `name` as found along the MRO of `cls` (no descriptor binding)
+    """
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass.__dict__[name]
+    return None
+
+
+def _inherits(obj, base, names):
+    """
+    True if the class of `obj` does not override any of the given attributes of `base`
+    """
+    cls = obj if isinstance(obj, type) else type(obj)
+    return all(_lookup(cls, name) is _lookup(base, name) for name in names)
+
+
+def is_fused(cls, name, field):
+    """
+    True if the field of the model class decodes, casts and validates its raw values at once with `decoder()`
+    (containers decoding each element in a single pass), as done by Model.from_dict and the generated one
+    """
+    return (field._fused and _lookup(cls, name) is field
+            and _inherits(field, SlotStorage if isinstance(field, SlotStorage) else Field,
+                          ('__set__', 'cast_and_validate', 'name')))
+
+
+def decode_fused(name, field, value):
+    """
+    Decoded, cast and validated value of a fused field, its errors reporting the name of the field
+    """
+    try:
+        return field.decoder()(value)
+    except Error as e:
+        if e.field_name is None:
+            e.field_name = name
+        raise
+
+
+def _is_generic(cls, name, generic):
+    """
+    True if the method `name` of the model class is either the generic one of Model or a generated one
+    """
+    attr = _lookup(cls, name)
+    func = getattr(attr, '__func__', attr)
+    return func is generic or getattr(func, '_pyjo_generated', False)
+
+
+def _escape(value):
+    return value.replace('{', '{{').replace('}', '}}')
+
+
+def _obj_to_dict(value):
+    if isinstance(value, object) and hasattr(value, 'to_dict'):
+        return value.to_dict()
+    return value
+
+
+def _indent(lines, level=1):
+    return ['    ' * level + line for line in lines]
+
+
+class _Builder(object):
+    """
+    Collects the source of the specialized methods of a model class and the
+    objects they reference (fields, types, validators, ...)
+    """
+
+    def __init__(self, cls, generic):
+        self.cls = cls
+        self.generic = generic
+        self.fields = list(iteritems(cls._fields))
+        self.slots = cls._slots
+        self.track_changes = cls._track_changes
+        self.ns = {
+            'C': cls,
+            'RequiredFieldError': RequiredFieldError,
+            'FieldTypeError': FieldTypeError,
+            'ValidationError': ValidationError,
+            'Error': Error,
+            'obj_to_dict': _obj_to_dict,
+            'LazyValue': LazyValue,
+            'new': object.__new__,
+            'cached_dict': caching.cached_dict,
+            'store_dict': caching.store_dict,
+        }
+
+    def bind(self, prefix, i, value):
+        name = '{}{}'.format(prefix, i)
+        self.ns[name] = value
+        return name
+
+    def is_plain(self, name, field):
+        """
+        True if the attribute `name` of the class is the field itself (not shadowed by subclasses)
+        """
+        return _lookup(self.cls, name) is field
+
+    def inherits(self, field, names):
+        """
+        True if the field class does not override any of the given Field attributes
+        """
+        return _inherits(field, SlotStorage if isinstance(field, SlotStorage) else Field, names)
+
+    def target(self, name, field):
+        """
+        Expression of the storage of the field value
+        """
+        if self.slots:
+            return 'self.{}'.format(field._slot)
+        return 'd[{}]'.format(repr(name))
+
+    def default(self, i, field, v):
+        """
+        Lines replacing a None `v` with the default value of the field
+        """
+        if not self.inherits(field, ('default',)):
+            f = self.bind('f', i, field)
+            return [
+                'if {} is None:'.format(v),
+                '    dv = {}.default'.format(f),
+                '    if dv is not None:',
+                '        {} = dv() if callable(dv) else dv'.format(v),
+            ]
+        if field._default is None:
+            return []
+        d = self.bind('d', i, field._default)
+        if callable(field._default):
+            return ['if {} is None:'.format(v), '    {} = {}()'.format(v, d)]
+        return ['if {} is None:'.format(v), '    {} = {}'.format(v, d)]
+
+    def store(self, i, name, field, v, not_none=False):
+        """
+        Lines equivalent to `setattr(self, name, v)`, i.e. Field.__set__ unrolled.
+        `not_none` tells that `v` is known not to be None
+        """
+        key = repr(name)
+        target = self.target(name, field)
+        f = self.bind('f', i, field)
+        if not self.is_plain(name, field):
+            return ['setattr(self, {}, {})'.format(key, v)]
+        if not self.inherits(field, ('__set__',)):
+            return ['{}.__set__(self, {})'.format(f, v)]
+        if not self.inherits(field, ('cast_and_validate', 'cast', 'validate', 'required', 'name')):
+            return ['{} = {}.cast_and_validate({}, instance=self)'.format(target, f, v)]
+
+        if v == 'None':
+            # value known to be empty: nothing to cast or check but its presence
+            if field.required:
+                m = self.bind('mr', i, 'Field \'{}\' is required'.format(field.name))
+                return ['raise RequiredFieldError({})'.format(m)]
+            return ['{} = None'.format(target)]
+
+        if field._cache is not None:
+            return self.store_cached(i, field, target, v, not_none)
+
+        lines = []
+        if field._cast is not None:
+            c = self.bind('c', i, field._cast)
+            if not_none:
+                lines += ['{} = {}({})'.format(v, c, v)]
+            else:
+                lines += ['if {} is not None:'.format(v), '    {} = {}({})'.format(v, c, v)]
+            not_none = False
+
+        checks = []
+        if field._type is not None:
+            t = self.bind('t', i, field._type)
+            m = self.bind('mt', i, '{} value is not of type {}, given "{{}}"'.format(
+                _escape(field.name), _escape(field._type.__name__)))
+            checks += [
+                'if not isinstance({}, {}):'.format(v, t),
+                '    raise FieldTypeError({}.format({}))'.format(m, v),
+            ]
+        if field._validator:
+            val = self.bind('val', i, field._validator)
+            fn = self.bind('n', i, field.name)
+            checks += [
+                'try:',
+                '    res = {}({})'.format(val, v),
+                'except ValidationError as e:',
+                '    if e.field_name is None:',
+                '        raise ValidationError(\'{{}} did not pass the validation: {{}}\'.format({}, e.message),'
+                ' field_name={})'.format(fn, fn),
+                '    raise',
+                'if res is False:',
+                '    raise ValidationError(\'{{}} did not pass the validation\'.format({}))'.format(fn),
+            ]
+
+        if not_none:
+            lines += checks
+        elif field.required:
+            m = self.bind('mr', i, 'Field \'{}\' is required'.format(field.name))
+            lines += ['if {} is None:'.format(v), '    raise RequiredFieldError({})'.format(m)]
+            if checks:
+                lines += ['else:'] + _indent(checks)
+        elif checks:
+            lines += ['if {} is not None:'.format(v)] + _indent(checks)
+
+        lines.append('{} = {}'.format(target, v))
+        return lines
+
+    def store_cached(self, i, field, target, v, not_none):
+        """
+        Lines storing the value of a field with a cache: hits are looked up inline, misses and
+        values that can't be hashed go through cast_and_validate
+        """
+        f = self.bind('f', i, field)
+        cache = self.bind('cache', i, field._cache)
+        values = self.bind('cv', i, field._cache.values)
+        touch = self.bind('ct', i, getattr(field._cache.values, 'move_to_end', field._cache.touch))
+        lines = [
+            'try:',
+            '    k = ({}.__class__, {})'.format(v, v),
+            '    hit = {}[k]'.format(values),
+            'except (KeyError, TypeError):',
+            '    {} = {}.cast_and_validate({}, instance=self)'.format(v, f, v),
+            'else:',
+            '    {}(k)'.format(touch),
+            '    {}.hits += 1'.format(cache),
+            '    {} = hit'.format(v),
+        ]
+        if not not_none:
+            lines = ['if {} is not None:'.format(v)] + _indent(lines)
+            if field.required:
+                m = self.bind('mr', i, 'Field \'{}\' is required'.format(field.name))
+                lines += ['else:', '    raise RequiredFieldError({})'.format(m)]
+        return lines + ['{} = {}'.format(target, v)]
+
+    def after_init(self):
+        """
+        Lines ending the construction: the changes made while building the model are not tracked,
+        its lists and maps report their changes from now on (see changes.reset)
+        """
+        lines = ['self.after_init()']
+        if self.track_changes:
+            lines.append('self._changes = None')
+            bound = [(i, field) for i, (name, field) in enumerate(self.fields)
+                     if field._type is None or issubclass(field._type, (list, dict))]
+            if bound:
+                self.ns['bind_value'] = changes.bind_value
+                self.ns['weak_ref'] = weakref.ref
+                lines.append('tracked = weak_ref(self)')
+                lines += ['bind_value(tracked, {}(self))'.format(self.bind('raw', i, field.get_raw))
+                          for i, field in bound]
+        return lines
+
+    def init_storage(self):
+        if self.slots:
+            return 'd = None'
+        return 'self._data = d = {}'
+
+    def store_empty(self, i, name, field):
+        """
+        Lines storing the default value of a field not given in input
+        """
+        default = self.default(i, field, 'v')
+        if not default:
+            return self.store(i, name, field, 'None')
+        return ['v = None'] + default + self.store(i, name, field, 'v')
+
+    def from_dict_expr(self, i, field, r):
+        f = self.bind('f', i, field)
+        if not self.inherits(field, ('from_dict',)):
+            return '{}.from_dict({})'.format(f, r)
+        if field._from_dict is not None:
+            return '{}({})'.format(self.bind('fd', i, field._from_dict), r)
+        if field._type and hasattr(field._type, 'from_dict'):
+            return '{}.from_dict({})'.format(self.bind('t', i, field._type), r)
+        return r
+
+    def to_dict_expr(self, i, field, v):
+        f = self.bind('f', i, field)
+        if not self.inherits(field, ('to_dict',)):
+            return '{}.to_dict({})'.format(f, v)
+        if field._to_dict is not None:
+            return '{}({})'.format(self.bind('td', i, field._to_dict), v)
+        if field._type is not None and hasattr(field._type, 'to_dict'):
+            return '{}.to_dict()'.format(v)
+        if field._type is not None:
+            t = self.bind('t', i, field._type)
+            return '{} if {}.__class__ is {} else obj_to_dict({})'.format(v, v, t, v)
+        return 'obj_to_dict({})'.format(v)
+
+    def build_init(self):
+        setters = {}
+        self.ns['setters'] = setters
+        lines = [
+            'def __init__(self, **kwargs):',
+            '    if self.__class__ is not C:',
+            '        return generic_init(self, **kwargs)',
+            '    {}'.format(self.init_storage()),
+            '    if kwargs:',
+            '        for key in kwargs:',
+            '            setter = setters.get(key)',
+            '            if setter is None:',
+            '                setattr(self, key, kwargs[key])',
+            '            else:',
+            '                setter(self, d, kwargs[key])',
+        ]
+        missing = []
+        straight = []
+        for i, (name, field) in enumerate(self.fields):
+            body = self.default(i, field, 'v') + self.store(i, name, field, 'v')
+            setter_src = ['def s{}(self, d, v):'.format(i)] + _indent(body)
+            setter = self.exec_function('s{}'.format(i), setter_src, register=False)
+            setters[name] = self.ns['s{}'.format(i)] = setter
+            missing += ['if {} not in kwargs:'.format(repr(name)), '    s{}(self, d, None)'.format(i)]
+            straight += self.store_empty(i, name, field)
+        lines += _indent(missing, 2)
+        lines += ['    else:'] + _indent(straight, 2)
+        lines += _indent(self.after_init())
+        self.ns['generic_init'] = self.generic['__init__']
+        return self.exec_function('__init__', lines)
+
+    def is_fused(self, name, field):
+        return is_fused(self.cls, name, field)
+
+    def lazy_decoder(self, name, field):
+        """
+        Decoder of the raw values kept by a lazy from_dict, or None if the field is always decoded eagerly.
+        Only nested models and containers are kept raw
+        """
+        if not (self.is_plain(name, field) and self.inherits(field, ('__get__', '__set__', 'has_value'))):
+            return None
+        t = field._type
+        is_model = getattr(t, '_fields', None) is not None
+        if t is None or not (is_model or issubclass(t, (list, dict))):
+            return None
+        if (is_model and field._from_dict is None and self.inherits(field, ('from_dict',))
+                and _is_generic(t, 'from_dict', self.generic['from_dict'])):
+            # nested models are decoded lazily as well, the method resolved on each call (not the stub compiling
+            # the class)
+            return lambda value: t.from_dict(value, lazy=True)
+        return field.from_dict
+
+    def build_from_dict(self):
+        lines = [
+            'def from_dict(cls, data, discard_non_fields=True, lazy=False, trusted=False):',
+            '    if cls is not C or not discard_non_fields:',
+            '        return generic_from_dict(cls, data, discard_non_fields, lazy, trusted)',
+            '    if not isinstance(data, dict):',
+            '        raise TypeError(\'data must be a dictionary\')',
+            '    if trusted:',
+            '        return from_dict_trusted(cls, data)',
+            '    if lazy:',
+            '        return from_dict_lazy(cls, data)',
+        ]
+        lines += self.from_dict_body()
+        self.ns['generic_from_dict'] = self.generic['from_dict']
+        self.ns['from_dict_lazy'] = self.exec_function(
+            'from_dict_lazy', ['def from_dict_lazy(cls, data):'] + self.from_dict_body(lazy=True))
+        self.ns['from_dict_trusted'] = self.exec_function(
+            'from_dict_trusted', ['def from_dict_trusted(cls, data):'] + self.from_dict_body(trusted=True))
+        return classmethod(self.exec_function('from_dict', lines))
+
+    def build_construct(self):
+        lines = [
+            'def construct(cls, **kwargs):',
+            '    if cls is not C:',
+            '        return generic_construct(cls, **kwargs)',
+            '    self = new(cls)',
+            '    {}'.format(self.init_storage()),
+            '    get = kwargs.get',
+        ]
+        body = []
+        for i, (name, field) in enumerate(self.fields):
+            body += ['v = get({})'.format(repr(name))]
+            body += self.default(i, field, 'v') + self.store_trusted(i, name, field, 'v')
+        body += [
+            'for key in kwargs:',
+            '    if key not in field_names:',
+            '        setattr(self, key, kwargs[key])',
+        ]
+        body += self.after_init() + ['return self']
+        lines += _indent(body)
+        self.ns['field_names'] = frozenset(name for name, _ in self.fields)
+        self.ns['generic_construct'] = self.generic['construct']
+        return classmethod(self.exec_function('construct', lines))
+
+    def store_trusted(self, i, name, field, v):
+        """
+        Lines storing a value without casting and validating it, i.e. Field.set_trusted unrolled
+        """
+        if self.inherits(field, ('set_trusted', 'name')):
+            if v != 'None' and not self.inherits(field, ('trusted_value',)):
+                v = '{}({})'.format(self.bind('tv', i, field.trusted_value), v)
+            return ['{} = {}'.format(self.target(name, field), v)]
+        return ['{}.set_trusted(self, {})'.format(self.bind('f', i, field), v)]
+
+    def from_dict_trusted_expr(self, i, field, r):
+        f = self.bind('f', i, field)
+        if not self.inherits(field, ('from_dict_trusted',)):
+            return '{}.from_dict_trusted({})'.format(f, r)
+        if not self.inherits(field, ('from_dict',)):
+            return '{}({})'.format(self.bind('tdec', i, field.trusted_decoder()), r)
+        if field._from_dict is not None:
+            return '{}({})'.format(self.bind('fd', i, field._from_dict), r)
+        t = field._type
+        if getattr(t, '_fields', None) is not None and _is_generic(t, 'from_dict', self.generic['from_dict']):
+            return '{}.from_dict({}, trusted=True)'.format(self.bind('t', i, t), r)
+        return self.from_dict_expr(i, field, r)
+
+    def from_dict_body(self, lazy=False, trusted=False):
+        lines = [
+            '    get = data.get',
+            '    self = new(cls)',
+            '    {}'.format(self.init_storage()),
+        ]
+        # as Model.from_dict: the values given are all decoded (fused fields validated at once), then stored (cast
+        # and validated) in the order of the fields, then the defaults of the missing fields are stored
+        decoded = []
+        stored = []
+        missing = []
+        for i, (name, field) in enumerate(self.fields):
+            r = 'r{}'.format(i)
+            v = 'v{}'.format(i)
+            given = 'if {} is not None:'.format(r)
+            decoded += ['{} = get({})'.format(r, repr(name))]
+            decoder = self.lazy_decoder(name, field) if lazy else None
+            expr = self.from_dict_expr(i, field, r)
+            if trusted:
+                expr = self.from_dict_trusted_expr(i, field, r)
+                if expr == r:
+                    stored += [given] + _indent(self.store_trusted(i, name, field, r))
+                else:
+                    stored += [given] + _indent(['v = {}'.format(expr)] + self.default(i, field, 'v')
+                                                + self.store_trusted(i, name, field, 'v'))
+                missing += ['if {} is None:'.format(r)]
+                default = self.default(i, field, 'v')
+                if default:
+                    missing += _indent(['v = None'] + default + self.store_trusted(i, name, field, 'v'))
+                else:
+                    missing += _indent(self.store_trusted(i, name, field, 'None'))
+                continue
+            if decoder is not None:
+                dec = self.bind('dec', i, decoder)
+                stored += [given] + _indent(['{} = LazyValue({}, {})'.format(self.target(name, field), r, dec)])
+            elif self.is_fused(name, field):
+                # decode_fused unrolled
+                fdec = self.bind('fdec', i, field.decoder())
+                decoded += [given] + _indent([
+                    'try:',
+                    '    {} = {}({})'.format(v, fdec, r),
+                    'except Error as e:',
+                    '    if e.field_name is None:',
+                    '        e.field_name = {}'.format(repr(name)),
+                    '    raise',
+                ])
+                stored += [given, '    {} = {}'.format(self.target(name, field), v)]
+            elif expr == r:
+                stored += [given] + _indent(self.store(i, name, field, r, not_none=True))
+            else:
+                decoded += [given, '    {} = {}'.format(v, expr)]
+                stored += [given] + _indent(self.default(i, field, v) + self.store(i, name, field, v))
+            missing += ['if {} is None:'.format(r)]
+            missing += _indent(self.store_empty(i, name, field))
+        lines += _indent(decoded) + _indent(stored) + _indent(missing)
+        lines += _indent(self.after_init() + ['return self'])
+        return lines
+
+    def build_to_dict(self):
+        lines = [
+            'def to_dict(self):',
+            '    if self.__class__ is not C:',
+            '        return generic_to_dict(self)',
+            '    {}'.format('d = None' if self.slots else 'd = self._data'),
+        ]
+        if self.cls._cache_serialization:
+            lines += [
+                '    res = cached_dict(self)',
+                '    if res is not None:',
+                '        return dict(res)',
+            ]
+        lines += ['    res = {}']
+        body = []
+        for i, (name, field) in enumerate(self.fields):
+            key = repr(name)
+            if self.is_plain(name, field) and self.inherits(field, ('__get__', 'has_value', 'name')):
+                if self.slots:
+                    body += ['v = getattr(self, {}, None)'.format(repr(field._slot)), 'if v is not None:']
+                else:
+                    body += ['v = d.get({})'.format(key), 'if v is not None:']
+                if self.lazy_decoder(name, field) is not None:
+                    # raw values kept by a lazy from_dict are emitted untouched
+                    body += [
+                        '    if v.__class__ is LazyValue:',
+                        '        res[{}] = v.raw'.format(key),
+                        '    else:',
+                        '        res[{}] = {}'.format(key, self.to_dict_expr(i, field, 'v')),
+                    ]
+                    continue
+            else:
+                f = self.bind('f', i, field)
+                body += ['if {}.has_value(self):'.format(f), '    v = getattr(self, {})'.format(key)]
+            body += ['    res[{}] = {}'.format(key, self.to_dict_expr(i, field, 'v'))]
+        lines += _indent(body)
+        lines += ['    return store_dict(self, res)' if self.cls._cache_serialization else '    return res']
+        self.ns['generic_to_dict'] = self.generic['to_dict']
+        return self.exec_function('to_dict', lines)
+
+    def exec_function(self, name, lines, register=True):
+        source = '\n'.join(lines) + '\n'
+        filename = '<pyjo generated {} {}.{}>'.format(name, self.cls.__module__, self.cls.__name__)
+        code = compile(source, filename, 'exec')
+        exec(code, self.ns)
+        if register:
+            # make tracebacks and debuggers show the generated source
+            linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        func = self.ns.pop(name)
+        func._pyjo_generated = True
+        func.__doc__ = 'Generated {} of {}'.format(name, self.cls.__name__)
+        return func
+
+
+def compile_model(cls, generic):
+    """
+    Generate the specialized `__init__`, `from_dict` and `to_dict` of a model class.
+
+    The generated methods are straight-line equivalents of the generic ones of `Model`: every
+    field is handled by its own block of code and only the steps it needs (default, cast, type
+    check, validator, from_dict/to_dict conversion) are emitted. Fields overriding the `Field`
+    hooks fall back to calling them. Methods overridden by the model class are left untouched.
+
+    Methods are generated on the first call of any of them, so that defining models (e.g. importing
+    a large catalog of models) does not pay for the compilation of the unused ones.
+
+    :param generic: dict with the generic `__init__`, `from_dict` and `to_dict` functions of Model
+    """
+    if cls._fields is None:
+        return
+    _models[cls] = generic
+    if not _suspended:
+        _install_stubs(cls, generic)
+
+
+def suspend_compilation():
+    """
+    Remove the generated methods of all the model classes, so that they use the generic ones of Model.
+    Classes created until `resume_compilation` are not compiled
+    """
+    global _suspended
+    with _lock:
+        _suspended = True
+        for cls in list(_models):
+            for name in _generated_methods:
+                attr = cls.__dict__.get(name)
+                if getattr(getattr(attr, '__func__', attr), '_pyjo_generated', False):
+                    delattr(cls, name)
+
+
+def resume_compilation(generic):
+    """
+    Compile again all the model classes (on their first use)
+    """
+    global _suspended
+    with _lock:
+        _suspended = False
+        for cls in list(_models):
+            _install_stubs(cls, generic)
+
+
+def compiled_method(cls, name):
+    """
+    Bound method `name` of a model class, compiling the class first: the generated method is returned rather
+    than the stub compiling the class, which would otherwise stay in the way of every call
+    """
+    generic = _models.get(cls)
+    if generic is not None and _is_stub(cls.__dict__.get(name)):
+        _ensure_compiled(cls, generic)
+    return getattr(cls, name)
+
+
+def _is_stub(attr):
+    return getattr(getattr(attr, '__func__', attr), '_pyjo_stub', False)
+
+
+def _install_stubs(cls, generic):
+    """
+    Set the methods to generate to stubs compiling the class, then calling the generated method
+    """
+    for name in _generated_methods:
+        if _is_generic(cls, name, generic[name]):
+            setattr(cls, name, _stub(cls, name, generic))
+
+
+def _stub(cls, name, generic):
+    if name in _classmethods:
+        def method(klass, *args, **kwargs):
+            _ensure_compiled(cls, generic)
+            return _lookup(cls, name).__get__(None, klass)(*args, **kwargs)
+    else:
+        def method(self, *args, **kwargs):
+            _ensure_compiled(cls, generic)
+            return _lookup(cls, name)(self, *args, **kwargs)
+    method.__name__ = name
+    method._pyjo_generated = True
+    method._pyjo_stub = True
+    return classmethod(method) if name in _classmethods else method
+
+
+def _ensure_compiled(cls, generic):
+    with _lock:
+        stubs = [name for name in _generated_methods if _is_stub(cls.__dict__.get(name))]
+        if not stubs:
+            return
+        # without the stubs, the checks of _compile see the methods inherited by the class
+        for name in stubs:
+            delattr(cls, name)
+        if not _suspended:
+            _compile(cls, generic)
+
+
+def _builds_instances(cls, generic):
+    """
+    True if generated code may build the instances of the class field by field, as the generated `__init__`:
+    `__init__` and the methods it calls are generic, and instances are not created by a custom `__new__` or
+    metaclass `__call__`
+    """
+    return (_lookup(cls, '__setattr__') is object.__dict__['__setattr__']
+            and _is_generic(cls, '__init__', generic['__init__'])
+            and _is_generic(cls, '_set_defaults', generic['_set_defaults'])
+            and _is_generic(cls, '_set_values', generic['_set_values'])
+            and _lookup(cls, '__new__') is object.__dict__['__new__']
+            and _lookup(type(cls), '__call__') is type.__dict__['__call__'])
+
+
+def _compile(cls, generic):
+    if _lookup(cls, '__setattr__') is not object.__dict__['__setattr__']:
+        return
+
+    builder = _Builder(cls, generic)
+    init_generated = False
+    if (_is_generic(cls, '__init__', generic['__init__'])
+            and _is_generic(cls, '_set_defaults', generic['_set_defaults'])
+            and _is_generic(cls, '_set_values', generic['_set_values'])):
+        cls.__init__ = builder.build_init()
+        init_generated = True
+
+    if (init_generated and _is_generic(cls, 'from_dict', generic['from_dict'])
+            and _builds_instances(cls, generic)):
+        cls.from_dict = builder.build_from_dict()
+        if _is_generic(cls, 'construct', generic['construct']):
+            cls.construct = builder.build_construct()
+
+    if _is_generic(cls, 'to_dict', generic['to_dict']):
+        cls.to_dict = builder.build_to_dict()
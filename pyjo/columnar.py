@@ -0,0 +1,254 @@
+from six import iteritems
+
+from pyjo.exceptions import RequiredFieldError, ValidationError, set_error_index
+from pyjo.fields.datetimefield import DatetimeField, dt_to_timestamp
+from pyjo.fields.enumfield import EnumField
+from pyjo.fields.field import Field, _overrides
+from pyjo.fields.rangefield import RangeField
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = ['Columns', 'to_columns', 'from_columns']
+
+ENUM_MISSING = -1  # code of missing enum values
+
+
+class Columns(dict):
+    """
+    Mapping of column name to NumPy array, as returned by `Model.to_columns`.
+    Nested models are flattened to dotted column names.
+    `categories` maps the name of each enum column to the list of enum members its codes refer to
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(Columns, self).__init__(*args, **kwargs)
+        self.categories = {}
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError('numpy is required for columnar export/import')
+
+
+def _kind(field):
+    """
+    Kind of the column of a field: `model`, `enum`, `datetime`, `int`, `float`, `bool` or `object`
+    """
+    if isinstance(field, EnumField):
+        return 'enum'
+    if isinstance(field, DatetimeField):
+        return 'datetime'
+    t = field._type
+    if t is None:
+        return 'object'
+    if getattr(t, '_fields', None) is not None and field._to_dict is None and field._from_dict is None:
+        return 'model'
+    if t is bool:
+        return 'bool'
+    if t is int:
+        return 'int'
+    if t is float:
+        return 'float'
+    return 'object'
+
+
+_dtypes = {
+    'int': 'int64',
+    'float': 'float64',
+    'bool': 'bool',
+}
+
+
+def _object_array(values):
+    res = numpy.empty(len(values), dtype=object)
+    res[:] = values
+    return res
+
+
+def _typed_array(values, dtype):
+    missing = [v is None for v in values]
+    if not any(missing):
+        return numpy.array(values, dtype=dtype)
+    filled = [0 if v is None else v for v in values]
+    return numpy.ma.array(filled, mask=missing, dtype=dtype)
+
+
+def to_columns(cls, instances):
+    """
+    See Model.to_columns
+    """
+    _require_numpy()
+    columns = Columns()
+    _export(cls, list(instances), '', columns)
+    return columns
+
+
+def _export(cls, instances, prefix, columns):
+    for name, field in iteritems(cls._fields):
+        column = prefix + name
+        values = [None if instance is None else getattr(instance, name) for instance in instances]
+        kind = _kind(field)
+        if kind == 'model':
+            _export(field._type, values, column + '.', columns)
+        elif kind == 'enum':
+            members = list(field.enum_cls)
+            index = {member: code for code, member in enumerate(members)}
+            codes = [ENUM_MISSING if v is None else index[v] for v in values]
+            columns[column] = numpy.array(codes, dtype='int32')
+            columns.categories[column] = members
+        elif kind == 'datetime':
+            nat = numpy.iinfo('int64').min
+            timestamps = [nat if v is None else dt_to_timestamp(v) for v in values]
+            columns[column] = numpy.array(timestamps, dtype='int64').astype('datetime64[s]')
+        elif kind in _dtypes:
+            columns[column] = _typed_array(values, _dtypes[kind])
+        else:
+            columns[column] = _object_array(values)
+
+
+def from_columns(cls, columns):
+    """
+    See Model.from_columns
+    """
+    _require_numpy()
+    size = None
+    for array in columns.values():
+        if size is not None and len(array) != size:
+            raise ValueError('all columns must have the same length')
+        size = len(array)
+    if size is None:
+        return []
+    return _import(cls, columns, '', size)
+
+
+def _missing(array):
+    """
+    Boolean array, True where the column has no value
+    """
+    if numpy.ma.isMaskedArray(array):
+        return numpy.ma.getmaskarray(array)
+    if array.dtype.kind == 'M':
+        return numpy.isnat(array)
+    if array.dtype.kind == 'O':
+        return numpy.array([v is None for v in array], dtype=bool)
+    return numpy.zeros(len(array), dtype=bool)
+
+
+def _raise_at(error, missing_or_invalid):
+    index = int(numpy.flatnonzero(missing_or_invalid)[0])
+    set_error_index(error, index)
+    raise error
+
+
+def _check_range(field, array, missing):
+    """
+    Vectorized validation of the bounds of a RangeField column
+    """
+    invalid = numpy.zeros(len(array), dtype=bool)
+    if field.min is not None:
+        invalid |= array < field.min
+    if field.max is not None:
+        invalid |= array > field.max
+    invalid &= ~missing
+    if invalid.any():
+        _raise_at(ValidationError('{} did not pass the validation'.format(field.name)), invalid)
+
+
+# dtype kinds of the arrays holding values valid for each column kind
+_valid_dtype_kinds = {
+    'int': 'iu',
+    'float': 'f',
+    'bool': 'b',
+    'datetime': 'M',
+    'enum': 'iu',
+}
+
+
+def _is_vectorized(field, kind, array):
+    """
+    True if the values of the column are fully validated by the dtype of the array and the vectorized checks
+    """
+    if array.dtype.kind not in _valid_dtype_kinds.get(kind, ''):
+        return False
+    if field._cast is not None or (field._validator is not None and not isinstance(field, RangeField)):
+        return False
+    return not any(_overrides(field, Field, name) for name in ('cast_and_validate', 'cast', 'validate'))
+
+
+def _column_values(field, kind, array, missing):
+    """
+    Python values of a column, None where missing
+    """
+    if kind == 'enum':
+        members = list(field.enum_cls)
+        invalid = ((array < 0) | (array >= len(members))) & (array != ENUM_MISSING)
+        if invalid.any():
+            _raise_at(ValidationError('{} has an invalid enum code'.format(field.name)), invalid)
+        return [None if code == ENUM_MISSING else members[code] for code in array.tolist()]
+    if kind == 'datetime':
+        # datetime64[s].tolist() returns naive datetimes, None for NaT
+        return array.astype('datetime64[s]').tolist()
+    if kind == 'object':
+        return list(array)
+    # masked values are returned as None
+    return array.tolist()
+
+
+def _validate_each(field, values):
+    res = []
+    append = res.append
+    cast_and_validate = field.cast_and_validate
+    for index, value in enumerate(values):
+        try:
+            append(cast_and_validate(value))
+        except Exception as e:
+            set_error_index(e, index)
+            raise
+    return res
+
+
+def _import(cls, columns, prefix, size):
+    """
+    Build `size` instances of `cls` from the columns (None for nested models without any value).
+    Values are validated here, the instances are then built with `construct`
+    """
+    kwargs = {}
+    for name, field in iteritems(cls._fields):
+        column = prefix + name
+        kind = _kind(field)
+        array = columns.get(column)
+        if kind == 'model':
+            values = _import(field._type, columns, column + '.', size)
+        elif array is None:
+            values = [None] * size
+        else:
+            missing = _missing(array)
+            if isinstance(field, RangeField) and array.dtype.kind in 'iuf':
+                _check_range(field, array, missing)
+            values = _column_values(field, kind, array, missing)
+            if not _is_vectorized(field, kind, array):
+                values = _validate_each(field, values)
+        if field.required and field.default is None:
+            missing = numpy.array([v is None for v in values], dtype=bool)
+            if missing.any():
+                _raise_at(RequiredFieldError('Field \'{}\' is required'.format(field.name)), missing)
+        kwargs[name] = values
+
+    names = list(kwargs)
+    rows = zip(*[kwargs[name] for name in names]) if names else [()] * size
+    res = []
+    construct = cls.construct
+    nested = bool(prefix)
+    for index, row in enumerate(rows):
+        if nested and all(value is None for value in row):
+            res.append(None)
+            continue
+        try:
+            res.append(construct(**dict(zip(names, row))))
+        except Exception as e:
+            set_error_index(e, index)
+            raise
+    return res
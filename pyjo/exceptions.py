@@ -1,5 +1,9 @@
+from six import string_types
+
+
 class Error(Exception):
     field_name = None
+    index = None  # position of the failed record, for errors raised by batch operations
 
     def __init__(self, message, field_name=None):
         super(Error, self).__init__(message)
@@ -21,3 +25,22 @@ class ValidationError(Error):
 
 class NotEditableField(Error):
     pass
+
+
+class SchemaMismatchError(ValueError):
+    """
+    Binary data encoded with a schema different from the one of the model class decoding it
+    """
+
+
+def set_error_index(error, index):
+    """
+    Annotate the error raised by the record at position `index` of a batch
+    """
+    if getattr(error, 'index', None) is not None:
+        return
+    error.index = index
+    if isinstance(error, Error):
+        error.message = 'record {}: {}'.format(index, error.message)
+    if error.args and isinstance(error.args[0], string_types):
+        error.args = ('record {}: {}'.format(index, error.args[0]),) + error.args[1:]
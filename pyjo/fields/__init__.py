@@ -5,3 +5,5 @@ from pyjo.fields.regexfield import RegexField
 from pyjo.fields.datetimefield import DatetimeField
 from pyjo.fields.listfield import ListField
 from pyjo.fields.mapfield import MapField
+from pyjo.fields.arrayfield import ArrayField
+from pyjo.fields.containers import ValidatedList, ValidatedDict
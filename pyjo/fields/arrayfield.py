@@ -0,0 +1,107 @@
+import array
+
+from pyjo.exceptions import FieldTypeError, ValidationError
+from pyjo.fields.field import Field
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# typecodes of the same kind and size are interchangeable (e.g. 'l' and 'q' on 64 bit platforms)
+_kinds = {}
+for _codes, _kind in (('bhilq', 'int'), ('BHILQ', 'uint'), ('fd', 'float')):
+    for _code in _codes:
+        _kinds[_code] = (_kind, array.array(_code).itemsize)
+
+
+def _same_type(fmt, typecode):
+    fmt = fmt.lstrip('@')
+    return fmt == typecode or (fmt in _kinds and _kinds[fmt] == _kinds[typecode])
+
+
+class ArrayField(Field):
+    def __init__(self, typecode, min=None, max=None, ndarray=False, **kwargs):
+        """
+        Homogeneous numeric list stored as an `array.array` (or a NumPy array if `ndarray`),
+        e.g. `ArrayField('d')` for floats, `ArrayField('q', min=0)` for non negative ints.
+
+        Values can be any iterable of numbers or any object supporting the buffer protocol: arrays, NumPy
+        arrays, memoryviews and bytes (read as raw machine values). Arrays of the same type are stored as they
+        are. With `ndarray=True` other buffers of the same type (or raw bytes) are wrapped without copying,
+        otherwise they are copied into an array.array (which can't share the memory of a buffer).
+        `min`/`max` bounds are checked on the whole array at once.
+
+        :type typecode: str
+        :rtype: array.array
+        """
+        if typecode not in _kinds:
+            raise TypeError('Invalid value for typecode. It should be one of {}'.format(''.join(sorted(_kinds))))
+        if ndarray and numpy is None:
+            raise ImportError('numpy is required for ArrayField(ndarray=True)')
+        super(ArrayField, self).__init__(**kwargs)
+        self.typecode = typecode
+        self.min = min
+        self.max = max
+        self.ndarray = ndarray
+
+    def cast(self, value):
+        value = super(ArrayField, self).cast(value)
+        if self.ndarray:
+            if isinstance(value, numpy.ndarray) and value.dtype.char == self.typecode:
+                return value
+            return numpy.frombuffer(self._to_buffer(value), dtype=self.typecode)
+        if isinstance(value, array.array) and value.typecode == self.typecode:
+            return value
+        res = array.array(self.typecode)
+        res.frombytes(self._to_buffer(value))
+        return res
+
+    def _to_buffer(self, value):
+        """
+        Memoryview of the values as machine values of the type of the field, without copying when possible
+        """
+        try:
+            view = memoryview(value)
+        except TypeError:
+            view = None
+        if view is not None and view.c_contiguous:
+            if _same_type(view.format, self.typecode):
+                return view.cast('B')
+            if view.format in ('B', 'b', 'c') and view.nbytes % _kinds[self.typecode][1] == 0:
+                # raw bytes
+                return view.cast('B')
+        try:
+            return memoryview(array.array(self.typecode, value)).cast('B')
+        except (TypeError, OverflowError, ValueError):
+            raise FieldTypeError(
+                '{} value is not an array of type \'{}\', given {}'.format(
+                    self.name, self.typecode, type(value).__name__),
+                field_name=self.name
+            )
+
+    def validate(self, value, **kwargs):
+        super(ArrayField, self).validate(value, **kwargs)
+        if value is None or not len(value) or (self.min is None and self.max is None):
+            return
+        if numpy is not None:
+            # also for array.array, viewed without copying
+            data = value if self.ndarray else numpy.frombuffer(value, dtype=self.typecode)
+            low, high = data.min(), data.max()
+        else:
+            low, high = min(value), max(value)
+        if (self.min is not None and low < self.min) or (self.max is not None and high > self.max):
+            raise ValidationError('{} did not pass the validation'.format(self.name), field_name=self.name)
+
+    def to_dict(self, value):
+        if value is None:
+            return value
+        return value.tolist()
+
+    def to_buffer(self, value):
+        """
+        Raw machine values of the array, e.g. for binary codecs
+        """
+        if value is None:
+            return value
+        return memoryview(value).cast('B')
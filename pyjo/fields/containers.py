@@ -0,0 +1,174 @@
+import copy
+
+from six import iteritems
+
+__all__ = ['ValidatedList', 'ValidatedDict']
+
+
+def _notify(container):
+    """
+    Notify the model holding the container (caching its serialization or tracking its changes), if any
+    """
+    owner = container.owner
+    if owner is not None:
+        container.owner = None
+        model = owner()
+        if model is not None:
+            model._invalidate_serialization(container)
+
+
+class ValidatedList(list):
+    """
+    List returned by ListField: the elements inserted or replaced are cast and validated by the inner field,
+    the other elements are not checked again.
+    Pickled as a plain list, rebuilt by the models holding it when unpickled (see Field.trusted_value)
+    """
+    __slots__ = ('field', 'owner')
+
+    def __init__(self, iterable=(), field=None):
+        """
+        :param iterable: elements already cast and validated
+        """
+        super(ValidatedList, self).__init__(iterable)
+        self.field = field
+        self.owner = None  # weak reference to the model caching its serialization, notified of changes
+
+    def _changed(self):
+        _notify(self)
+
+    def _check(self, value):
+        if self.field is None:
+            return value
+        return self.field.cast_and_validate(value)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = [self._check(v) for v in value]
+        else:
+            value = self._check(value)
+        super(ValidatedList, self).__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index):
+        super(ValidatedList, self).__delitem__(index)
+        self._changed()
+
+    def append(self, value):
+        super(ValidatedList, self).append(self._check(value))
+        self._changed()
+
+    def insert(self, index, value):
+        super(ValidatedList, self).insert(index, self._check(value))
+        self._changed()
+
+    def extend(self, values):
+        super(ValidatedList, self).extend([self._check(v) for v in values])
+        self._changed()
+
+    def pop(self, *args):
+        res = super(ValidatedList, self).pop(*args)
+        self._changed()
+        return res
+
+    def remove(self, value):
+        super(ValidatedList, self).remove(value)
+        self._changed()
+
+    def clear(self):
+        del self[:]
+
+    def sort(self, *args, **kwargs):
+        super(ValidatedList, self).sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super(ValidatedList, self).reverse()
+        self._changed()
+
+    def __imul__(self, n):
+        res = super(ValidatedList, self).__imul__(n)
+        self._changed()
+        return res
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def __copy__(self):
+        return ValidatedList(self, self.field)
+
+    def __deepcopy__(self, memo):
+        return ValidatedList(copy.deepcopy(list(self), memo), self.field)
+
+    def __reduce_ex__(self, protocol):
+        return list, (list(self),)
+
+
+class ValidatedDict(dict):
+    """
+    Dict returned by MapField: the values inserted or replaced are cast and validated by the inner field,
+    the other values are not checked again.
+    Pickled as a plain dict, rebuilt by the models holding it when unpickled (see Field.trusted_value)
+    """
+    __slots__ = ('field', 'owner')
+
+    def __init__(self, mapping=(), field=None):
+        """
+        :param mapping: values already cast and validated
+        """
+        super(ValidatedDict, self).__init__(mapping)
+        self.field = field
+        self.owner = None  # weak reference to the model caching its serialization, notified of changes
+
+    def _changed(self):
+        _notify(self)
+
+    def _check(self, value):
+        if self.field is None:
+            return value
+        return self.field.cast_and_validate(value)
+
+    def __setitem__(self, key, value):
+        super(ValidatedDict, self).__setitem__(key, self._check(value))
+        self._changed()
+
+    def __delitem__(self, key):
+        super(ValidatedDict, self).__delitem__(key)
+        self._changed()
+
+    def pop(self, *args):
+        res = super(ValidatedDict, self).pop(*args)
+        self._changed()
+        return res
+
+    def popitem(self):
+        res = super(ValidatedDict, self).popitem()
+        self._changed()
+        return res
+
+    def clear(self):
+        super(ValidatedDict, self).clear()
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        values = dict(*args, **kwargs)
+        super(ValidatedDict, self).update({k: self._check(v) for k, v in iteritems(values)})
+        self._changed()
+
+    def __ior__(self, values):
+        self.update(values)
+        return self
+
+    def __copy__(self):
+        return ValidatedDict(self, self.field)
+
+    def __deepcopy__(self, memo):
+        return ValidatedDict(copy.deepcopy(dict(self), memo), self.field)
+
+    def __reduce_ex__(self, protocol):
+        return dict, (dict(self),)
@@ -1,19 +1,91 @@
+import copy
+import weakref
+from collections import OrderedDict, namedtuple
+
 from pyjo.exceptions import FieldTypeError, ValidationError, RequiredFieldError
 
 orig_type = type
 
 
+class LazyValue(object):
+    """
+    Raw value of a field kept by `Model.from_dict(..., lazy=True)`, decoded and validated on first access
+    """
+    __slots__ = ('raw', 'decode')
+
+    def __init__(self, raw, decode):
+        self.raw = raw
+        self.decode = decode
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class ValueCache(object):
+    """
+    Bounded LRU mapping of input values to their cast and validated values, see the `cache` argument of Field
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.values = OrderedDict()  # least recently used first
+
+    def get(self, key):
+        """
+        :raise KeyError: if the value is not cached
+        :raise TypeError: if the value is not hashable
+        """
+        try:
+            value = self.values[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self.touch(key)
+        self.hits += 1
+        return value
+
+    def touch(self, key):
+        """
+        Mark the value as the most recently used
+        """
+        values = self.values
+        if hasattr(values, 'move_to_end'):
+            values.move_to_end(key)
+        else:
+            values[key] = values.pop(key)
+
+    def put(self, key, value):
+        self.values[key] = value
+        if len(self.values) > self.maxsize:
+            self.values.popitem(last=False)
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.values))
+
+    def clear(self):
+        self.values.clear()
+        self.hits = self.misses = 0
+
+
 class Field(object):
     _name = None  # name of the field, for error messages
     _type = None  # type of the field
     _repr = False  # show value in string representation of the python object
+    _fused = False  # decoder() is equivalent to cast_and_validate(from_dict(value)), see codegen
+
+    _cache = None  # ValueCache of the cast and validated values
 
     def __init__(self, default=None, required=False, type=None, validator=None, to_dict=None, from_dict=None,
-                 cast=None, repr=False):
+                 cast=None, repr=False, cache=None):
         """
         :type default: T
         :type type: U
         :rtype: T | U
+        :param cache: memoize the result of cast and validation of the last `cache` hashable values.
+                      Only for fields whose cast and validator are pure functions of the value. The results are
+                      shared by the models given equal values: unhashable (mutable) results are not cached
         """
 
         if type is not None and not isinstance(type, orig_type):
@@ -34,6 +106,9 @@ class Field(object):
         if from_dict is not None and not callable(from_dict):
             raise TypeError('Invalid value for from_dict. It should be callable')
 
+        if cache is not None and (isinstance(cache, bool) or not isinstance(cache, int) or cache <= 0):
+            raise TypeError('Invalid value for cache. It should be a positive int')
+
         self._type = type
         self._cast = cast
         self._validator = validator
@@ -42,6 +117,8 @@ class Field(object):
         self._from_dict = from_dict
         self._default = default
         self._required = required
+        if cache is not None:
+            self._cache = ValueCache(cache)
 
     def __get__(self, instance, owner):
         if instance is None:
@@ -49,11 +126,23 @@ class Field(object):
             return self
 
         value = instance._data.get(self.name)
+        if value.__class__ is LazyValue:
+            value = instance._data[self.name] = self.cast_and_validate(value.decode(value.raw), instance=instance)
+            if instance._track_changes:
+                instance._track_value(value)
         return value
 
     def __set__(self, instance, value):
         value = self.cast_and_validate(value, instance=instance)
         instance._data[self.name] = value
+        if instance._notify_changes:
+            instance._field_changed(self.name)
+
+    def set_trusted(self, instance, value):
+        """
+        Store a value known to be valid, without casting and validating it
+        """
+        instance._data[self.name] = self.trusted_value(value)
 
     def __delete__(self, instance):
         # NOTE: we may want to keep the default value in this case, TBD
@@ -61,6 +150,8 @@ class Field(object):
             del instance._data[self.name]
         except KeyError:
             pass
+        if instance._notify_changes:
+            instance._field_changed(self.name)
 
     @property
     def default(self):
@@ -76,6 +167,12 @@ class Field(object):
     def has_value(self, instance):
         return instance._data.get(self.name) is not None
 
+    def get_raw(self, instance):
+        """
+        Stored value of the field, without decoding the raw values kept by a lazy from_dict
+        """
+        return instance._data.get(self.name)
+
     @property
     def name(self):
         return self._name
@@ -93,10 +190,47 @@ class Field(object):
 
     def cast_and_validate(self, value, instance=None):
         if value is not None:
+            if self._cache is not None:
+                return self._cached_cast_and_validate(value, instance)
             value = self.cast(value)
         self.validate(value, instance=instance)
         return value
 
+    def _cached_cast_and_validate(self, value, instance):
+        cache = self._cache
+        key = (value.__class__, value)  # 1, 1.0 and True are equal but may not be valid alike
+        try:
+            return cache.get(key)
+        except KeyError:
+            res = self.cast(value)
+            self.validate(res, instance=instance)
+            try:
+                hash(res)
+            except TypeError:
+                # mutable results (lists, dicts, arrays, models...) would be shared by the models given the value
+                return res
+            cache.put(key, res)
+            return res
+        except TypeError:
+            # not hashable
+            value = self.cast(value)
+            self.validate(value, instance=instance)
+            return value
+
+    def cache_info(self):
+        """
+        Statistics of the cache of the field, None if it has no cache
+
+        :rtype: CacheInfo
+        """
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
+    def cache_clear(self):
+        if self._cache is not None:
+            self._cache.clear()
+
     def cast(self, value):
         if self._cast is not None:
             return self._cast(value)
@@ -140,6 +274,179 @@ class Field(object):
             return self._type.from_dict(value)
         return value
 
+    def trusted_value(self, value):
+        """
+        Value stored by set_trusted: the plain lists and dicts of the list and map fields (given to construct, as
+        defaults, or restored from a pickle) are wrapped as validated containers, their elements not checked
+        """
+        return value
+
+    def from_dict_trusted(self, value):
+        """
+        Same as from_dict, for values known to be valid: nested models are built without validation
+        """
+        return self.trusted_decoder()(value)
+
+    def trusted_decoder(self):
+        """
+        Return the function implementing from_dict_trusted, resolved once per field
+        """
+        decoder = self.__dict__.get('_trusted_decoder')
+        if decoder is None:
+            decoder = self._trusted_decoder = self._make_trusted_decoder()
+        return decoder
+
+    def _make_trusted_decoder(self):
+        if self._from_dict is None and _is_plain_model(self._type) and not _overrides(self, Field, 'from_dict'):
+            t = self._type
+            # resolved on each call, t.from_dict may be the stub compiling the class
+            return lambda value: t.from_dict(value, trusted=True)
+        return self.from_dict
+
+    def checker(self):
+        """
+        Return a function casting and validating one value, as done for the elements of containers
+        (`validate(cast(value))`), resolved once per field
+        """
+        checker = self.__dict__.get('_checker')
+        if checker is None:
+            checker = self._checker = self._make_checker()
+        return checker
+
+    def _make_checker(self):
+        if self._cache is not None:
+            cast_and_validate = self.cast_and_validate
+            return lambda value: cast_and_validate(value)
+        cast, validate = self.cast, self.validate
+        if (self._cast is None and self._validator is None and self._type is not None
+                and not any(_overrides(self, Field, name) for name in ('cast', 'validate', 'required'))):
+            # only the type is checked, the (slow) validate just reports invalid values
+            t = self._type
+
+            def check(value):
+                if not isinstance(value, t):
+                    validate(value)
+                return value
+            return check
+
+        def check(value):
+            value = cast(value)
+            validate(value)
+            return value
+        return check
+
+    def decoder(self):
+        """
+        Return a function deserializing, casting and validating one value in a single step, as done for the
+        elements of containers (`validate(cast(from_dict(value)))`), resolved once per field
+        """
+        decoder = self.__dict__.get('_decoder')
+        if decoder is None:
+            decoder = self._decoder = self._make_decoder()
+        return decoder
+
+    def _make_decoder(self):
+        check = self.checker()
+        if (self._from_dict is None and not _overrides(self, Field, 'from_dict')
+                and not hasattr(self._type, 'from_dict')):
+            return check
+        from_dict = self.from_dict
+        return lambda value: check(from_dict(value))
+
     def __repr__(self):
         return '<{}(name={})>'.format(
             self.__class__.__name__, self.name)
+
+
+def _overrides(obj, cls, name):
+    """
+    True if the class of `obj` overrides the method `name` of `cls`
+    """
+    return getattr(orig_type(obj), name) != getattr(cls, name)
+
+
+_plain_models = weakref.WeakKeyDictionary()
+
+
+def _is_plain_model(t):
+    """
+    True if `t` is a model class whose from_dict is not overridden (so it accepts `trusted`)
+    """
+    if t is None:
+        return False
+    res = _plain_models.get(t)
+    if res is None:
+        from pyjo.model import Model  # circular import
+        res = False
+        if isinstance(t, orig_type) and issubclass(t, Model):
+            func = getattr(t.from_dict, '__func__', None)
+            res = func is Model.from_dict.__func__ or getattr(func, '_pyjo_generated', False)
+        _plain_models[t] = res
+    return res
+
+
+class SlotStorage(Field):
+    """
+    Storage mixin for the fields of models declared with `_slots = True`: the value is kept in
+    the instance slot `_slot` instead of the `_data` dictionary
+    """
+    _slot = None  # name of the instance slot holding the value
+    _member = None  # member descriptor of the slot, bound by the metaclass
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            value = self._member.__get__(instance, owner)
+        except AttributeError:
+            return None
+        if value.__class__ is LazyValue:
+            value = self.cast_and_validate(value.decode(value.raw), instance=instance)
+            self._member.__set__(instance, value)
+            if instance._track_changes:
+                instance._track_value(value)
+        return value
+
+    def __set__(self, instance, value):
+        value = self.cast_and_validate(value, instance=instance)
+        self._member.__set__(instance, value)
+        if instance._notify_changes:
+            instance._field_changed(self.name)
+
+    def set_trusted(self, instance, value):
+        self._member.__set__(instance, self.trusted_value(value))
+
+    def __delete__(self, instance):
+        try:
+            self._member.__delete__(instance)
+        except AttributeError:
+            pass
+        if instance._notify_changes:
+            instance._field_changed(self.name)
+
+    def has_value(self, instance):
+        return self.__get__(instance, None) is not None
+
+    def get_raw(self, instance):
+        return getattr(instance, self._slot, None)
+
+
+_slotted_classes = {}
+
+
+def slotted(field, slot):
+    """
+    Return a copy of the field storing its value in the instance slot `slot`.
+    The storage mixin is placed right before Field in the MRO, so overrides of the field class still apply
+    """
+    field_cls = type(field)
+    slotted_cls = _slotted_classes.get(field_cls)
+    if field_cls is Field:
+        slotted_cls = SlotStorage
+    elif slotted_cls is None:
+        slotted_cls = orig_type(str('Slotted' + field_cls.__name__), (field_cls, SlotStorage), {})
+        _slotted_classes[field_cls] = slotted_cls
+    res = copy.copy(field)
+    res.__class__ = slotted_cls
+    res._slot = slot
+    return res
@@ -1,10 +1,15 @@
 from pyjo.exceptions import FieldTypeError
-from pyjo.fields.field import Field
+from pyjo.fields.containers import ValidatedList
+from pyjo.fields.field import Field, _overrides
 
 
 class ListField(Field):
+    _fused = True  # decoder() is equivalent to cast_and_validate(from_dict(value))
+
     def __init__(self, inner_field, **kwargs):
         """
+        Values are stored as `ValidatedList`, validating the elements added or replaced in place
+
         :type model: T
         :rtype: list[T]
         """
@@ -21,14 +26,29 @@ class ListField(Field):
                 '{} value is not of type {}, given "{}"'.format(self.name, self._type.__name__, value),
                 field_name=self.name
             )
-        return [self.inner_field.cast(v) for v in value]
+        if self._validated(value):
+            return ValidatedList(value, self.inner_field)
+        if self._validator is not None or _overrides(self, ListField, 'validate'):
+            # the list itself is validated first, then its elements (and the list bound to the inner field)
+            return ValidatedList([self.inner_field.cast(v) for v in value])
+        # elements are cast and validated in a single pass, validate then only checks the list itself
+        check = self.inner_field.checker()
+        return ValidatedList([check(v) for v in value], self.inner_field)
+
+    def _validated(self, value):
+        """
+        True if the elements of the list were already validated by the inner field
+        """
+        return value.__class__ is ValidatedList and value.field is self.inner_field
 
     def validate(self, value, **kwargs):
         super(ListField, self).validate(value, **kwargs)
-        if not value:
+        if value is None or self._validated(value):
             return
         for v in value:
             self.inner_field.validate(v)
+        if value.__class__ is ValidatedList and value.field is None:
+            value.field = self.inner_field
 
     def to_dict(self, value):
         if value is None:
@@ -47,3 +67,39 @@ class ListField(Field):
         for v in value:
             res.append(self.inner_field.from_dict(v))
         return res
+
+    def trusted_value(self, value):
+        if value.__class__ is not list:
+            return value
+        inner_field = self.inner_field
+        return ValidatedList([inner_field.trusted_value(v) for v in value], inner_field)
+
+    def _make_trusted_decoder(self):
+        if _overrides(self, ListField, 'from_dict'):
+            return self.from_dict
+        inner_field = self.inner_field
+        inner = inner_field.trusted_decoder()
+
+        def decode(value):
+            if value is None:
+                return value
+            return ValidatedList([inner(v) for v in value], inner_field)
+        return decode
+
+    def _make_decoder(self):
+        if (self._from_dict is not None or self._cast is not None or self._validator is not None
+                or any(_overrides(self, ListField, name) for name in ('from_dict', 'cast', 'validate'))):
+            return super(ListField, self)._make_decoder()
+        generic = super(ListField, self)._make_decoder()
+        element = self.inner_field.decoder()
+        inner_field = self.inner_field
+        validate = super(ListField, self).validate
+
+        def decode(value):
+            if value.__class__ is not list:
+                return generic(value)
+            # each element is decoded, cast and validated at once, nested containers included
+            res = ValidatedList([element(v) for v in value], inner_field)
+            validate(res)
+            return res
+        return decode
@@ -1,12 +1,17 @@
 from six import iteritems
 
 from pyjo.exceptions import FieldTypeError
-from pyjo.fields.field import Field
+from pyjo.fields.containers import ValidatedDict
+from pyjo.fields.field import Field, _overrides
 
 
 class MapField(Field):
+    _fused = True  # decoder() is equivalent to cast_and_validate(from_dict(value))
+
     def __init__(self, inner_field, **kwargs):
         """
+        Values are stored as `ValidatedDict`, validating the values added or replaced in place
+
         :type inner_field: T
         :rtype: dict[str, T]
         """
@@ -23,14 +28,29 @@ class MapField(Field):
                 '{} value is not of type {}, given "{}"'.format(self.name, self._type.__name__, value),
                 field_name=self.name
             )
-        return {k: self.inner_field.cast(v) for k, v in iteritems(value)}
+        if self._validated(value):
+            return ValidatedDict(value, self.inner_field)
+        if self._validator is not None or _overrides(self, MapField, 'validate'):
+            # the dict itself is validated first, then its values (and the dict bound to the inner field)
+            return ValidatedDict({k: self.inner_field.cast(v) for k, v in iteritems(value)})
+        # values are cast and validated in a single pass, validate then only checks the dict itself
+        check = self.inner_field.checker()
+        return ValidatedDict({k: check(v) for k, v in iteritems(value)}, self.inner_field)
+
+    def _validated(self, value):
+        """
+        True if the values of the dict were already validated by the inner field
+        """
+        return value.__class__ is ValidatedDict and value.field is self.inner_field
 
     def validate(self, value, **kwargs):
         super(MapField, self).validate(value, **kwargs)
-        if not value:
+        if value is None or self._validated(value):
             return
         for k, v in value.items():
             self.inner_field.validate(v)
+        if value.__class__ is ValidatedDict and value.field is None:
+            value.field = self.inner_field
 
     def from_dict(self, value):
         if value is None:
@@ -50,3 +70,39 @@ class MapField(Field):
             res[k] = self.inner_field.to_dict(v)
 
         return res
+
+    def trusted_value(self, value):
+        if value.__class__ is not dict:
+            return value
+        inner_field = self.inner_field
+        return ValidatedDict({k: inner_field.trusted_value(v) for k, v in iteritems(value)}, inner_field)
+
+    def _make_trusted_decoder(self):
+        if _overrides(self, MapField, 'from_dict'):
+            return self.from_dict
+        inner_field = self.inner_field
+        inner = inner_field.trusted_decoder()
+
+        def decode(value):
+            if value is None:
+                return value
+            return ValidatedDict({k: inner(v) for k, v in iteritems(value)}, inner_field)
+        return decode
+
+    def _make_decoder(self):
+        if (self._from_dict is not None or self._cast is not None or self._validator is not None
+                or any(_overrides(self, MapField, name) for name in ('from_dict', 'cast', 'validate'))):
+            return super(MapField, self)._make_decoder()
+        generic = super(MapField, self)._make_decoder()
+        element = self.inner_field.decoder()
+        inner_field = self.inner_field
+        validate = super(MapField, self).validate
+
+        def decode(value):
+            if value.__class__ is not dict:
+                return generic(value)
+            # each value is decoded, cast and validated at once, nested containers included
+            res = ValidatedDict({k: element(v) for k, v in iteritems(value)}, inner_field)
+            validate(res)
+            return res
+        return decode
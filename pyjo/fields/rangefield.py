@@ -11,3 +11,5 @@ class RangeField(Field):
             return (min is None or min <= x) and (max is None or max >= x)
 
         super(RangeField, self).__init__(type=int, validator=validator, **kwargs)
+        self.min = min
+        self.max = max
@@ -10,8 +10,10 @@ class RegexField(Field):
         :rtype: str
         """
 
+        pattern = re.compile(regex)
+
         def validator(x):
-            if not bool(re.match(regex, x)):
+            if pattern.match(x) is None:
                 raise ValidationError('value does not match regex'.format())
 
         try:
@@ -20,3 +22,5 @@ class RegexField(Field):
             basestr_t = str
 
         super(RegexField, self).__init__(type=basestr_t, validator=validator, **kwargs)
+        self.pattern = pattern
+
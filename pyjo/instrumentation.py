@@ -0,0 +1,182 @@
+import threading
+from timeit import default_timer
+
+from six import iteritems
+
+from pyjo import codegen
+from pyjo.fields.field import Field
+from pyjo.model import Model, _generic_methods
+
+__all__ = ['enable_stats', 'disable_stats', 'stats_enabled', 'stats', 'reset_stats']
+
+_enabled = False
+_callback = None
+_stats = {}  # (model, field, phase) -> [calls, time, failures]
+_lock = threading.Lock()
+_originals = {}
+
+
+def _record(model, field, phase, elapsed, failed):
+    key = (model, field, phase)
+    with _lock:
+        entry = _stats.get(key)
+        if entry is None:
+            entry = _stats[key] = [0, 0.0, 0]
+        entry[0] += 1
+        entry[1] += elapsed
+        if failed:
+            entry[2] += 1
+    if _callback is not None:
+        _callback(model, field, phase, elapsed, failed)
+
+
+def _timed(model, field, phase, function, *args, **kwargs):
+    start = default_timer()
+    try:
+        res = function(*args, **kwargs)
+    except Exception:
+        _record(model, field, phase, default_timer() - start, True)
+        raise
+    _record(model, field, phase, default_timer() - start, False)
+    return res
+
+
+def _model_name(instance):
+    return None if instance is None else instance.__class__.__name__
+
+
+def _cast_and_validate(self, value, instance=None):
+    model = _model_name(instance)
+    if self._cache is not None:
+        # cache hits have neither a cast nor a validation
+        return _timed(model, self.name, 'cast_and_validate', _originals['cast_and_validate'], self, value,
+                      instance=instance)
+    if value is not None:
+        value = _timed(model, self.name, 'cast', self.cast, value)
+    _timed(model, self.name, 'validate', self.validate, value, instance=instance)
+    return value
+
+
+def _checker(self):
+    # the functions cached by the fields bypass the patched cast_and_validate
+    cast_and_validate = self.cast_and_validate
+    return lambda value: cast_and_validate(value)
+
+
+def _decoder(self):
+    cast_and_validate, from_dict = self.cast_and_validate, self.from_dict
+    return lambda value: cast_and_validate(_timed(None, self.name, 'from_dict', from_dict, value))
+
+
+def _init(self, **kwargs):
+    _timed(self.__class__.__name__, None, 'init', _originals['__init__'], self, **kwargs)
+
+
+def _from_dict(cls, data, discard_non_fields=True, lazy=False, trusted=False):
+    if trusted or lazy or not isinstance(data, dict):
+        return _timed(cls.__name__, None, 'from_dict', _originals['from_dict'], cls, data,
+                      discard_non_fields=discard_non_fields, lazy=lazy, trusted=trusted)
+    return _timed(cls.__name__, None, 'from_dict', _decode, cls, data, discard_non_fields)
+
+
+def _decode(cls, data, discard_non_fields):
+    # same as Model.from_dict, timing the from_dict of each field
+    model = cls.__name__
+    field_values = {}
+    for name, field in iteritems(cls._fields):
+        value = data.get(name)
+        if value is not None:
+            field_values[name] = _timed(model, name, 'from_dict', field.from_dict, value)
+    if discard_non_fields:
+        data = field_values
+    else:
+        data.update(field_values)
+    return cls(**data)
+
+
+def _to_dict(self):
+    return _timed(self.__class__.__name__, None, 'to_dict', _encode, self)
+
+
+def _encode(self):
+    # same as Model.to_dict, timing the to_dict of each field
+    model = self.__class__.__name__
+    res = {}
+    for name, field in iteritems(self._fields):
+        if field.has_value(self):
+            res[name] = _timed(model, name, 'to_dict', field.to_dict, getattr(self, name))
+    return res
+
+
+def enable_stats(callback=None):
+    """
+    Start recording call counts, cumulative time and failures of the models (`init`, `from_dict`, `to_dict`)
+    and of their fields (`cast`, `validate`, `from_dict`, `to_dict`), see `stats`.
+    Times are inclusive: the time of a nested model field includes the time of the nested model.
+    Fields with a cache record a single `cast_and_validate` phase. The elements of lists and maps are recorded
+    under the inner field, without model. A trusted or lazy `from_dict` records only the model phase.
+
+    While enabled, models use the generic (slower) methods of Model instead of the generated ones.
+    When disabled nothing is patched in, so there is no overhead.
+
+    :param callback: function `(model, field, phase, elapsed, failed)` called for every recorded call,
+                     e.g. to forward the measures to a metrics system. `field` is None for model phases
+    """
+    global _enabled, _callback
+    _callback = callback
+    if _enabled:
+        return
+    _enabled = True
+    generic = _generic_methods()
+    _originals.update(generic)
+    for name in ('cast_and_validate', 'checker', 'decoder'):
+        _originals[name] = Field.__dict__[name]
+    codegen.suspend_compilation()
+    Field.cast_and_validate = _cast_and_validate
+    Field.checker = _checker
+    Field.decoder = _decoder
+    Model.__init__ = _init
+    Model.from_dict = classmethod(_from_dict)
+    Model.to_dict = _to_dict
+
+
+def disable_stats():
+    """
+    Stop recording and restore the generated methods of the models. Recorded stats are kept
+    """
+    global _enabled, _callback
+    _callback = None
+    if not _enabled:
+        return
+    _enabled = False
+    for name in ('cast_and_validate', 'checker', 'decoder'):
+        setattr(Field, name, _originals[name])
+    Model.__init__ = _originals['__init__']
+    Model.from_dict = classmethod(_originals['from_dict'])
+    Model.to_dict = _originals['to_dict']
+    codegen.resume_compilation(_generic_methods())
+
+
+def stats_enabled():
+    return _enabled
+
+
+def stats(reset=False):
+    """
+    Snapshot of the recorded stats.
+
+    :param reset: clear the stats after taking the snapshot
+    :return: `{(model, field, phase): {'calls': int, 'time': float, 'failures': int}}`, time in seconds.
+             `field` is None for model phases, `model` is None for fields validated outside of a model
+    """
+    with _lock:
+        res = {key: {'calls': calls, 'time': time, 'failures': failures}
+               for key, (calls, time, failures) in iteritems(_stats)}
+        if reset:
+            _stats.clear()
+    return res
+
+
+def reset_stats():
+    with _lock:
+        _stats.clear()
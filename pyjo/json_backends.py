@@ -0,0 +1,139 @@
+import json
+
+from six import text_type, binary_type
+
+__all__ = ['JsonBackend', 'register_json_backend', 'set_json_backend', 'get_json_backend']
+
+
+class JsonBackend(object):
+    def __init__(self, name, dumps, loads):
+        """
+        :param dumps: function `(obj, indent) -> str | bytes` serializing python objects to JSON
+        :param loads: function `(str | bytes) -> obj` deserializing JSON
+        """
+        if not callable(dumps) or not callable(loads):
+            raise TypeError('Invalid value for dumps/loads. They should be callable')
+        self.name = name
+        self._dumps = dumps
+        self.loads = loads
+
+    def dumps(self, obj, indent=None):
+        res = self._dumps(obj, indent)
+        if isinstance(res, binary_type) and not isinstance(res, text_type):
+            res = res.decode('utf-8')
+        return res
+
+    def dumps_bytes(self, obj, indent=None):
+        res = self._dumps(obj, indent)
+        if isinstance(res, text_type):
+            res = res.encode('utf-8')
+        return res
+
+    def __repr__(self):
+        return '<{}(name={})>'.format(self.__class__.__name__, self.name)
+
+
+_backends = {}
+_default = None
+_auto_order = ['orjson', 'rapidjson', 'ujson', 'json']
+
+
+def register_json_backend(name, dumps, loads):
+    """
+    Register a JSON backend, which can then be selected globally with `set_json_backend`
+    or for a single model class with its `_json_backend` attribute
+    """
+    backend = JsonBackend(name, dumps, loads)
+    _backends[name] = backend
+    return backend
+
+
+def set_json_backend(name):
+    """
+    Set the JSON backend used by models not specifying their own.
+    `'auto'` selects the fastest one installed, falling back to the standard library `json`.
+    Note that orjson writes NaN and infinite floats as null (json, rapidjson and ujson as NaN/Infinity) and reads
+    ints beyond 64 bits as floats
+    """
+    global _default
+    if name == 'auto':
+        name = next(n for n in _auto_order if n in _backends)
+    _default = get_json_backend(name)
+    return _default
+
+
+def get_json_backend(name=None):
+    """
+    Return the backend registered as `name`, or the global one if `name` is None
+    """
+    if name is None:
+        return _default
+    try:
+        return _backends[name]
+    except KeyError:
+        raise ValueError('Unknown JSON backend \'{}\''.format(name))
+
+
+def _json_dumps(obj, indent):
+    return json.dumps(obj, indent=indent)
+
+
+def _json_loads(value):
+    if isinstance(value, binary_type) and not isinstance(value, text_type):
+        value = value.decode('utf-8')
+    return json.loads(value)
+
+
+register_json_backend('json', _json_dumps, _json_loads)
+_default = _backends['json']
+
+# NOTE: DatetimeField and EnumField values are always converted by to_dict (timestamps and enum names/values),
+# native datetime/enum support of the backends would produce a different output and is not used.
+# Indentations not supported by a backend fall back to the standard library.
+
+try:
+    import orjson
+except ImportError:
+    pass
+else:
+    def _orjson_dumps(obj, indent):
+        if indent is None:
+            option = 0
+        elif indent == 2:
+            option = orjson.OPT_INDENT_2
+        else:
+            return _json_dumps(obj, indent)
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass
+        # keys which are not strings (slower option), then ints beyond 64 bits and other values orjson can't
+        # serialize but json can
+        try:
+            return orjson.dumps(obj, option=option | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return _json_dumps(obj, indent)
+
+    register_json_backend('orjson', _orjson_dumps, orjson.loads)
+
+try:
+    import rapidjson
+except ImportError:
+    pass
+else:
+    def _rapidjson_dumps(obj, indent):
+        return rapidjson.dumps(obj, indent=indent)
+
+    register_json_backend('rapidjson', _rapidjson_dumps, rapidjson.loads)
+
+try:
+    import ujson
+except ImportError:
+    pass
+else:
+    def _ujson_dumps(obj, indent):
+        if indent is None:
+            return ujson.dumps(obj, escape_forward_slashes=False)
+        return ujson.dumps(obj, indent=indent, escape_forward_slashes=False)
+
+    register_json_backend('ujson', _ujson_dumps, ujson.loads)
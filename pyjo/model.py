@@ -1,7 +1,10 @@
-import json
+import weakref
 
-from pyjo.exceptions import RequiredFieldError, NotEditableField
-from pyjo.fields.field import Field
+from pyjo import binary, caching, changes, columnar, records, selective, streaming
+from pyjo.codegen import compile_model, compiled_method, is_fused, decode_fused
+from pyjo.exceptions import RequiredFieldError, NotEditableField, set_error_index
+from pyjo.fields.field import Field, SlotStorage, slotted
+from pyjo.json_backends import get_json_backend
 
 from six import with_metaclass, iteritems
 
@@ -19,58 +22,136 @@ class ModelMetaclass(type):
             return super_new(cls, name, bases, attrs)
 
         # Build _fields and assign name
-
-        # Merge all fields from subclasses
-        _fields = {}
-        flattened_bases = cls._get_bases(bases)
-        for base in flattened_bases[::-1]:
-            if hasattr(base, '_fields') and base._fields is not None:
-                _fields.update(base._fields)
-            fields = {}
-            for attr_name, attr_value in iteritems(base.__dict__):
-                if not isinstance(attr_value, Field):
-                    continue
-                attr_value.name = attr_name
-                fields[attr_name] = attr_value
-            _fields.update(fields)
-
-        # Discover any model fields
+        declared = {}
         for attr_name, attr_value in iteritems(attrs):
             if not isinstance(attr_value, Field):
                 continue
             attr_value.name = attr_name
-            _fields[attr_name] = attr_value
+            declared[attr_name] = attr_value
+        _fields = cls._inherited_fields(bases)
+        _fields.update(declared)
+
+        track_changes = cls._option('_track_changes', bases, attrs)
+        cache_serialization = cls._option('_cache_serialization', bases, attrs)
+        use_slots = cls._option('_slots', bases, attrs)
+        if use_slots:
+            cls._add_slots(bases, attrs, _fields, track_changes, cache_serialization)
 
         attrs['_fields'] = _fields
+        attrs['_notify_changes'] = track_changes or cache_serialization
+        attrs['_declared_fields'] = {k: v for k, v in iteritems(attrs) if isinstance(v, Field)}
 
-        return super_new(cls, name, bases, attrs)
+        new_cls = super_new(cls, name, bases, attrs)
+        if use_slots:
+            for field in _fields.values():
+                field._member = getattr(new_cls, field._slot)
+        compile_model(new_cls, _generic_methods())
+        return new_cls
 
     @classmethod
-    def _get_bases(cls, bases):
-        bases = cls.__get_bases(bases)
-        unique_bases = list(set(bases))
-        return unique_bases
+    def _option(cls, name, bases, attrs):
+        """
+        Value of a boolean class option, as declared by the class or inherited from its bases
+        """
+        if name in attrs:
+            return attrs[name]
+        return any(getattr(b, name, False) for b in bases)
 
     @classmethod
-    def __get_bases(cls, bases):
-        for base in bases:
-            if base is object:
+    def _add_slots(cls, bases, attrs, _fields, track_changes=False, cache_serialization=False):
+        """
+        Replace the fields with copies storing their value in instance slots, and declare the
+        slots not already provided by the bases
+        """
+        slots = list(attrs.get('__slots__', ()))
+        for attr_name, field in list(iteritems(_fields)):
+            if not isinstance(field, SlotStorage):
+                field = slotted(field, '_pyjo_{}'.format(attr_name))
+                _fields[attr_name] = attrs[attr_name] = field
+            if not any(hasattr(base, field._slot) for base in bases):
+                slots.append(field._slot)
+        if track_changes and not any('_changes' in getattr(klass, '__slots__', ())
+                                     for base in bases for klass in base.__mro__):
+            slots.append('_changes')
+        if cache_serialization and not any('_serialization' in getattr(klass, '__slots__', ())
+                                           for base in bases for klass in base.__mro__):
+            slots.append('_serialization')
+        # lists and maps notify the model through a weak reference
+        if (track_changes or cache_serialization) and not any(base.__weakrefoffset__ for base in bases):
+            slots.append('__weakref__')
+        attrs['__slots__'] = tuple(slots)
+
+    @classmethod
+    def _inherited_fields(cls, bases):
+        """
+        Fields inherited from the bases, the ones of the classes first in the MRO taking precedence.
+        The fields of model bases are already resolved: only the classes mixed in are scanned
+        """
+        if len(bases) == 1:
+            # single inheritance, the common case: the MRO of the base is the one of the class
+            if bases[0]._fields is not None:
+                return dict(bases[0]._fields)
+        res = {}
+        for klass in reversed(_mro(bases)):
+            if klass is object:
                 continue
-            yield base
-            for child_base in cls.__get_bases(base.__bases__):
-                yield child_base
+            fields = klass.__dict__.get('_declared_fields')
+            if fields is None:
+                fields = {}
+                for attr_name, attr_value in iteritems(klass.__dict__):
+                    if isinstance(attr_value, Field):
+                        attr_value.name = attr_name
+                        fields[attr_name] = attr_value
+            res.update(fields)
+        return res
+
+
+def _mro(bases):
+    """
+    MRO of a class with the given bases, the class itself excluded (C3 linearization)
+    """
+    sequences = [list(base.__mro__) for base in bases] + [list(bases)]
+    res = []
+    while True:
+        sequences = [seq for seq in sequences if seq]
+        if not sequences:
+            return res
+        for seq in sequences:
+            head = seq[0]
+            if not any(head in other[1:] for other in sequences):
+                break
+        else:
+            # let type() report the inconsistent bases
+            return res
+        res.append(head)
+        for seq in sequences:
+            if seq[0] is head:
+                del seq[0]
 
 
 class Model(with_metaclass(ModelMetaclass, object)):
+    __slots__ = ()
 
     _fields = None
+    _declared_fields = {}  # fields declared by the class itself, the others are inherited
+    _slots = False  # store field values in instance slots instead of a per-instance dictionary
+    _json_backend = None  # name of the JSON backend of the model, the global one if None
+    _track_changes = False  # record the fields set or deleted after construction, see to_dict_changes
+    _changes = None  # names of the fields changed since construction or the last mark_clean
+    _cache_serialization = False  # keep the results of to_dict and to_json until the model changes, see caching
+    _serialization = None  # cached serialization and content hash, see caching.SerializationCache
+    # fields call _field_changed when set or deleted, set by the metaclass and on the instances caching their hash
+    _notify_changes = False
     my_metaclass = ModelMetaclass
 
     def __init__(self, **kwargs):
-        self._data = {}
+        if not self._slots:
+            self._data = {}
         self._set_defaults(kwargs)
         self._set_values(kwargs)
         self.after_init()
+        if self._track_changes:
+            changes.reset(self)
 
     def _set_defaults(self, kwargs):
         for name, field in iteritems(self._fields):
@@ -87,20 +168,58 @@ class Model(with_metaclass(ModelMetaclass, object)):
         pass
 
     @classmethod
-    def from_dict(cls, data, discard_non_fields=True):
+    def from_dict(cls, data, discard_non_fields=True, lazy=False, trusted=False):
+        """
+        :param lazy: keep nested models, lists and maps raw, decoding and validating them on first access.
+                     Raw values not accessed are serialized back as they are by `to_dict`
+        :param trusted: the data is known to be valid (e.g. it was validated before being stored), build the
+                        model and its nested models with `construct`, without casting and validating values
+        """
+        # NOTE: lazy is only a hint, models with custom __init__/from_dict are decoded eagerly
         if not isinstance(data, dict):
             raise TypeError('data must be a dictionary')
         field_values = {}
         for name, field in iteritems(cls._fields):
             value = data.get(name)
-            if value is not None:
+            if value is None:
+                continue
+            if trusted:
+                field_values[name] = field.from_dict_trusted(value)
+            elif is_fused(cls, name, field):
+                # lists and maps are validated as decoded, their errors raised before the other fields are stored
+                field_values[name] = decode_fused(name, field, value)
+            else:
                 field_values[name] = field.from_dict(value)
         if discard_non_fields:
             data = field_values
         else:
             data.update(field_values)
+        if trusted:
+            return cls.construct(**data)
         return cls(**data)
 
+    @classmethod
+    def construct(cls, **kwargs):
+        """
+        Build a model from values known to be valid: defaults are applied, values are stored without
+        being cast and validated
+        """
+        self = cls.__new__(cls)
+        if not cls._slots:
+            self._data = {}
+        for name, field in iteritems(cls._fields):
+            value = kwargs.get(name)
+            if value is None and field.default is not None:
+                value = field.default() if callable(field.default) else field.default
+            field.set_trusted(self, value)
+        for key in kwargs:
+            if key not in cls._fields:
+                setattr(self, key, kwargs[key])
+        self.after_init()
+        if cls._track_changes:
+            changes.reset(self)
+        return self
+
     def update_from_dict(self, data, discard_non_fields=True):
         if not isinstance(data, dict):
             raise TypeError('data must be a dictionary')
@@ -118,20 +237,383 @@ class Model(with_metaclass(ModelMetaclass, object)):
         self._set_values(data)
 
     def to_dict(self):
+        """
+        With `_cache_serialization = True`, the result is kept until the model or one of the models it
+        contains changes, and a copy of it is returned: the dicts and lists it contains are shared and must
+        not be modified
+        """
+        if self._cache_serialization:
+            res = caching.cached_dict(self)
+            if res is not None:
+                return dict(res)
         res = {}
         for name, field in iteritems(self._fields):
             if field.has_value(self):
                 value = getattr(self, name)
                 res[name] = field.to_dict(value)
+        if self._cache_serialization:
+            return caching.store_dict(self, res)
         return res
 
+    def _field_changed(self, name):
+        if self._track_changes:
+            changed = getattr(self, '_changes', None)
+            if changed is None:
+                self._changes = changed = set()
+            changed.add(name)
+        caching.invalidate(self)
+
+    def _invalidate_serialization(self, container=None):
+        """
+        Called when a list or map of the model changes in place
+        """
+        if self._track_changes and container is not None:
+            changes.container_changed(self, container)
+        else:
+            caching.invalidate(self)
+
+    def _track_value(self, value):
+        """
+        Called when a raw value of a lazy from_dict is decoded
+        """
+        changes.bind_value(weakref.ref(self), value)
+
+    def __setstate__(self, state):
+        """
+        Restore a pickled model, rebuilding the lists and maps of its fields (pickled as plain lists and dicts)
+        """
+        if isinstance(state, tuple):
+            state, slots = state
+        else:
+            slots = None
+        if state:
+            self.__dict__.update(state)
+        for key, value in iteritems(slots or {}):
+            setattr(self, key, value)
+        for field in self._fields.values():
+            value = field.get_raw(self)
+            if value is not None:
+                field.set_trusted(self, value)
+        if self._track_changes:
+            changes.bind(self)
+
+    def mark_clean(self):
+        """
+        Forget the changes of the model and of its nested models (in lists and maps too), e.g. after saving them
+        """
+        if self._track_changes:
+            changes.reset(self)
+        for field in self._fields.values():
+            value = field.get_raw(self)
+            if value is not None:
+                changes.mark_clean(value)
+
+    def to_dict_changes(self):
+        """
+        Serialize only the fields set or deleted since construction or the last `mark_clean`
+        (requires `_track_changes = True`). Changes of nested models are reported with dotted paths,
+        untouched nested models are not serialized. Lists and maps changed in place, or holding a changed model,
+        are reported whole, as well as the values whose changes can't be tracked (nested models not tracking
+        their changes, plain lists and dicts...), see `changes`.
+
+        :return: `{'set': {path: value}, 'unset': [path]}`, fields set to None are unset
+        """
+        res = {'set': {}, 'unset': []}
+        self._collect_changes('', res)
+        return res
+
+    def _collect_changes(self, prefix, res):
+        changed = getattr(self, '_changes', None) or ()
+        for name, field in iteritems(self._fields):
+            path = prefix + name
+            if name in changed:
+                if field.has_value(self):
+                    res['set'][path] = field.to_dict(getattr(self, name))
+                else:
+                    res['unset'].append(path)
+                continue
+            value = field.get_raw(self)
+            if isinstance(value, Model) and value._track_changes:
+                value._collect_changes(path + '.', res)
+            elif not changes.is_clean(value):
+                res['set'][path] = field.to_dict(getattr(self, name))
+
+    @classmethod
+    def json_backend(cls):
+        """
+        :rtype: pyjo.json_backends.JsonBackend
+        """
+        return get_json_backend(cls._json_backend)
+
     @classmethod
-    def from_json(cls, value, discard_non_fields=True):
-        v = json.loads(value)
+    def from_json(cls, value, discard_non_fields=True, lazy=False, skip_undeclared=False):
+        """
+        :param skip_undeclared: parse only the keys declared by the model and by its nested models (also in lists
+                                and maps), skipping the values of the other keys without decoding them. Faster when
+                                most of the document is not declared. The document is parsed by simdjson whatever
+                                the JSON backend (requires pysimdjson), skipped values are validated as JSON by its
+                                tokenizer but never turned into Python objects
+        """
+        v = cls._loads(value, skip_undeclared, discard_non_fields)
+        if lazy:
+            return cls.from_dict(v, discard_non_fields=discard_non_fields, lazy=True)
         return cls.from_dict(v, discard_non_fields=discard_non_fields)
 
+    @classmethod
+    def _loads(cls, value, skip_undeclared, discard_non_fields, many=False):
+        if not skip_undeclared:
+            return cls.json_backend().loads(value)
+        if not discard_non_fields:
+            raise ValueError('skip_undeclared requires discard_non_fields')
+        generic_from_dict = _generic_methods()['from_dict']
+        if many:
+            return selective.loads_many(cls, value, generic_from_dict)
+        return selective.loads(cls, value, generic_from_dict)
+
     def to_json(self, indent=None):
-        return json.dumps(self.to_dict(), indent=indent)
+        if self._cache_serialization and indent is None:
+            return caching.cached_json(self, False)
+        return self.json_backend().dumps(self.to_dict(), indent=indent)
+
+    @classmethod
+    def from_json_bytes(cls, value, discard_non_fields=True, lazy=False, skip_undeclared=False):
+        # all backends accept both str and bytes
+        return cls.from_json(value, discard_non_fields=discard_non_fields, lazy=lazy, skip_undeclared=skip_undeclared)
+
+    def to_json_bytes(self, indent=None):
+        """
+        Same as `to_json`, returning UTF-8 encoded bytes
+        """
+        if self._cache_serialization and indent is None:
+            return caching.cached_json(self, True)
+        return self.json_backend().dumps_bytes(self.to_dict(), indent=indent)
+
+    def to_bytes(self):
+        """
+        Compact binary encoding of the model, generated from the fields of its class: a presence bitmap followed
+        by the values (varints for ints and datetimes, ordinals for enums, length-prefixed strings, lists and maps).
+        Starts with a fingerprint of the schema, see `from_bytes`
+
+        :rtype: bytes
+        """
+        return binary.encode(self)
+
+    @classmethod
+    def from_bytes(cls, data, trusted=False):
+        """
+        Decode a model encoded by `to_bytes`. Raises `SchemaMismatchError` if it was encoded by a class with a
+        different schema (fields, their order and types).
+
+        :param trusted: build the model (and nested models) without validating the values, as `construct`
+        """
+        return binary.decode(cls, data, trusted=trusted)
+
+    def content_hash(self):
+        """
+        Stable digest (16 bytes) of the schema and of the values of the model, hashing its binary encoding
+        without building dicts or JSON. Nested models contribute their own content hash, maps are hashed in
+        key order. Kept by the instance until the model or one of the models it contains changes (slotted
+        models keep it only with `_cache_serialization = True`).
+        Raises TypeError if a value of a field without type is not JSON serializable
+
+        :rtype: bytes
+        """
+        res = caching.cached_hash(self)
+        if res is None:
+            res = caching.store_hash(self, binary.content_hash(self))
+        return res
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        try:
+            return self.content_hash() == other.content_hash()
+        except (TypeError, ValueError):
+            # values without binary encoding
+            return self.to_dict() == other.to_dict()
+
+    def __ne__(self, other):
+        res = self.__eq__(other)
+        return res if res is NotImplemented else not res
+
+    # models are mutable and compared on their content: not hashable, deduplicate them on their content_hash()
+    __hash__ = None
+
+    @classmethod
+    def from_dicts(cls, data, discard_non_fields=True):
+        """
+        Deserialize an iterable of dictionaries into a list of models.
+        If a record is not valid, the raised error reports its position in `index`
+        """
+        decode = compiled_method(cls, 'from_dict')
+        res = []
+        append = res.append
+        for index, value in enumerate(data):
+            try:
+                append(decode(value, discard_non_fields=discard_non_fields))
+            except Exception as e:
+                set_error_index(e, index)
+                raise
+        return res
+
+    @classmethod
+    def to_dicts(cls, instances):
+        return [instance.to_dict() for instance in instances]
+
+    @classmethod
+    def from_json_many(cls, value, discard_non_fields=True, skip_undeclared=False):
+        """
+        Deserialize a JSON array into a list of models.
+        `skip_undeclared` parses only the declared keys of each record (see `from_json`).
+        """
+        data = cls._loads(value, skip_undeclared, discard_non_fields, many=True)
+        if not isinstance(data, list):
+            raise TypeError('data must be a list')
+        return cls.from_dicts(data, discard_non_fields=discard_non_fields)
+
+    @classmethod
+    def to_json_many(cls, instances, indent=None):
+        return cls.json_backend().dumps(cls.to_dicts(instances), indent=indent)
+
+    @classmethod
+    def iter_jsonl(cls, fileobj, discard_non_fields=True, chunk_size=streaming.DEFAULT_CHUNK_SIZE,
+                   skip_invalid=False, invalid=None):
+        """
+        Lazily deserialize a JSON Lines (text or binary) file object, yielding one model per line.
+        The file is read in chunks of `chunk_size`, so memory is bounded by the chunk size and the longest line.
+
+        :param skip_invalid: skip the lines that can't be decoded or validated instead of raising
+        :param invalid: list collecting `(line_index, line, error)` for every skipped line (with `skip_invalid`)
+        """
+        streaming.check_invalid(skip_invalid, invalid)
+        return streaming.iter_jsonl(cls, fileobj, discard_non_fields=discard_non_fields, chunk_size=chunk_size,
+                                    skip_invalid=skip_invalid, invalid=invalid)
+
+    @classmethod
+    def dump_jsonl(cls, instances, fileobj, chunk_size=streaming.DEFAULT_CHUNK_SIZE):
+        """
+        Serialize the models to a (text or binary) file object as JSON Lines, as they are consumed
+        from `instances`. Writes are buffered up to `chunk_size` characters.
+
+        :return: number of models written
+        """
+        return streaming.dump_jsonl(cls, instances, fileobj, chunk_size=chunk_size)
+
+    @classmethod
+    def iter_json_array(cls, path, start=None, end=None, discard_non_fields=True,
+                        window_size=streaming.DEFAULT_WINDOW_SIZE, skip_invalid=False, invalid=None, offsets=False):
+        """
+        Lazily deserialize a file holding a JSON array, yielding one model per element. The file is memory mapped
+        and decoded one window of `window_size` bytes at a time (grown for larger elements), releasing the pages
+        already decoded: memory is bounded by the window and the largest element, not by the file size.
+
+        :param start: byte offset of the first element to decode (from `split_json_array` or `offsets`),
+                      None for the whole array
+        :param end: stop at the first element starting at or after this byte offset
+        :param skip_invalid: skip the elements that can't be validated instead of raising (JSON syntax errors
+                             always raise)
+        :param invalid: list collecting `(index, element, error)` for every skipped element (with `skip_invalid`)
+        :param offsets: yield `(offset, model)`, offset being the byte offset of the element in the file
+        """
+        streaming.check_invalid(skip_invalid, invalid)
+        return streaming.iter_json_array(cls, path, start=start, end=end, discard_non_fields=discard_non_fields,
+                                         window_size=window_size, skip_invalid=skip_invalid, invalid=invalid,
+                                         offsets=offsets)
+
+    @staticmethod
+    def split_json_array(path, parts, window_size=streaming.DEFAULT_WINDOW_SIZE):
+        """
+        Split a file holding a JSON array into at most `parts` ranges of elements of about the same size,
+        e.g. to decode them in several workers with `iter_json_array(path, start, end)`.
+        The elements are decoded (not validated) once to find their exact offsets.
+
+        :return: list of `(start, end)` byte offsets
+        """
+        return streaming.split_json_array(path, parts, window_size=window_size)
+
+    @classmethod
+    def aiter_json(cls, stream, array=None, discard_non_fields=True, chunk_size=streaming.DEFAULT_CHUNK_SIZE,
+                   yield_every=streaming.DEFAULT_YIELD_EVERY, yield_interval=streaming.DEFAULT_YIELD_INTERVAL,
+                   skip_invalid=False, invalid=None):
+        """
+        Asynchronously deserialize a JSON array or JSON Lines read from an `asyncio.StreamReader` (or any object
+        with a `read(n)` coroutine) or an async iterable of bytes/str, yielding each model as soon as it is
+        decoded and validated (`async for model in Model.aiter_json(reader)`). Python 3.6+.
+        Control is given back to the event loop every `yield_every` records or `yield_interval` seconds,
+        bounding the time other tasks wait for the decoding.
+
+        :param array: True for a JSON array, False for JSON Lines, None to detect it from the first character
+        :param skip_invalid: skip the records that can't be decoded or validated instead of raising (JSON syntax
+                             errors in an array always raise, with the index of the element)
+        :param invalid: list collecting `(index, record, error)` for every skipped record (with `skip_invalid`)
+        """
+        streaming.check_invalid(skip_invalid, invalid)
+        from pyjo import aio
+        return aio.aiter_json(cls, stream, array=array, discard_non_fields=discard_non_fields,
+                              chunk_size=chunk_size, yield_every=yield_every, yield_interval=yield_interval,
+                              skip_invalid=skip_invalid, invalid=invalid)
+
+    @classmethod
+    def adump_json(cls, instances, writer, array=False, chunk_size=streaming.DEFAULT_CHUNK_SIZE,
+                   yield_every=streaming.DEFAULT_YIELD_EVERY, yield_interval=streaming.DEFAULT_YIELD_INTERVAL):
+        """
+        Coroutine writing the models of an iterable or async iterable to an `asyncio.StreamWriter` (or any object
+        with a `write` method, awaited if it returns an awaitable, and an optional `drain` coroutine) as JSON Lines,
+        or as a JSON array if `array`. Writes are buffered up to `chunk_size` bytes. Python 3.6+.
+
+        :return: number of models written
+        """
+        from pyjo import aio
+        return aio.adump_json(cls, instances, writer, array=array, chunk_size=chunk_size,
+                              yield_every=yield_every, yield_interval=yield_interval)
+
+    @classmethod
+    def to_columns(cls, instances):
+        """
+        Export the models as columns of NumPy arrays (requires numpy), one per field:
+        int64 for int fields, float64 for float fields, datetime64[s] for DatetimeField, int32 codes for EnumField
+        (members listed in `categories` of the result, -1 if missing) and object arrays for anything else.
+        Missing numeric values are masked. Nested models are flattened to dotted column names.
+
+        :rtype: pyjo.columnar.Columns
+        """
+        return columnar.to_columns(cls, instances)
+
+    @classmethod
+    def from_columns(cls, columns):
+        """
+        Build models from columns as returned by `to_columns` (requires numpy).
+        Columns are validated as a whole (required fields, RangeField bounds, dtypes), only object columns
+        and fields with custom validators are validated value by value; the models are then built with
+        `construct`. Errors report the index of the first invalid row.
+        Nested models with no value in any column are set to None.
+        """
+        return columnar.from_columns(cls, columns)
+
+    @classmethod
+    def pack_records(cls, instances):
+        """
+        Pack flat models (int, float, bool, DatetimeField, EnumField and RangeField fields only, TypeError
+        otherwise) into one buffer of fixed-width `struct` records, read in place by `record_views`.
+        Bounded RangeFields take the smallest integer fitting their bounds, datetimes are int64 timestamps
+        and enums their ordinals
+
+        :rtype: bytearray
+        """
+        return records.pack(cls, instances)
+
+    @classmethod
+    def record_views(cls, buffer):
+        """
+        Read-only views of the records packed by `pack_records` in a buffer (bytes, bytearray, mmap...).
+        The fields of a view are unpacked from the buffer on access: scanning the records creates
+        neither models nor dicts. `to_model()` of a view builds its model, validating the values
+
+        :rtype: pyjo.records.RecordArray
+        """
+        return records.RecordArray(cls, buffer)
 
     def __repr__(self):
         res = []
@@ -148,5 +630,16 @@ class Model(with_metaclass(ModelMetaclass, object)):
         return '<{}({})>'.format(self.__class__.__name__, fields)
 
 
+def _generic_methods():
+    return {
+        '__init__': Model.__dict__['__init__'],
+        '_set_defaults': Model.__dict__['_set_defaults'],
+        '_set_values': Model.__dict__['_set_values'],
+        'from_dict': Model.__dict__['from_dict'].__func__,
+        'construct': Model.__dict__['construct'].__func__,
+        'to_dict': Model.__dict__['to_dict'],
+    }
+
+
 if __name__ == '__main__':
     pass
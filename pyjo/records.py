@@ -0,0 +1,310 @@
+"""
+Fixed-width binary records of flat models (see Model.pack_records), read in place by views.
+
+The fields of a record are packed with `struct`, little-endian and without padding: a presence bitmap
+(one bit per field, in the order of `_fields`) followed by one value per field, int fields as int64
+(bounded RangeFields as the smallest integer fitting their bounds), float fields as doubles, bool fields
+as one byte, DatetimeFields as int64 timestamps and EnumFields as ordinals.
+"""
+import copy
+import linecache
+import struct
+import weakref
+from datetime import datetime
+
+from six import iteritems
+
+from pyjo.binary import _kind
+from pyjo.exceptions import NotEditableField, set_error_index
+from pyjo.fields.datetimefield import dt_to_timestamp
+from pyjo.fields.field import Field
+from pyjo.fields.rangefield import RangeField
+
+__all__ = ['RecordLayout', 'RecordView', 'RecordArray', 'layout', 'pack']
+
+_layouts = weakref.WeakKeyDictionary()  # model class -> RecordLayout
+
+# (signed, unsigned) struct codes of the integers, smallest first
+_int_codes = [('b', 'B'), ('h', 'H'), ('i', 'I'), ('q', 'Q')]
+
+
+def _int_code(low, high):
+    """
+    Struct code of the smallest integer holding the values from `low` to `high`, int64 if none does
+    """
+    for signed, unsigned in _int_codes:
+        bits = 8 * struct.calcsize('<' + signed)
+        if low >= 0 and high < (1 << bits):
+            return unsigned
+        if -(1 << (bits - 1)) <= low and high < (1 << (bits - 1)):
+            return signed
+    return 'q'
+
+
+def _field_codec(cls, name, field, strings):
+    """
+    Struct code of the values of a field, with the functions converting them to and from the packed values
+    """
+    kind = _kind(field)
+    if kind in ('str', 'bytes') and strings is not None:
+        # offset in the string area
+        if kind == 'str':
+            return 'Q', strings.store_text, strings.load_text
+        return 'Q', strings.store_bytes, strings.load_bytes
+    if kind == 'int':
+        if isinstance(field, RangeField) and field.min is not None and field.max is not None:
+            return _int_code(field.min, field.max), None, None
+        return 'q', None, None
+    if kind == 'float':
+        return 'd', None, None
+    if kind == 'bool':
+        return '?', None, None
+    if kind == 'datetime':
+        return 'q', dt_to_timestamp, datetime.utcfromtimestamp
+    if kind == 'enum':
+        members = list(field.enum_cls)
+        ordinals = {member: i for i, member in enumerate(members)}
+        return _int_code(0, len(members) - 1), ordinals.__getitem__, members.__getitem__
+    raise TypeError('{} is not a flat model, field {} can not be packed in a record'.format(cls.__name__, name))
+
+
+class PackedStorage(Field):
+    """
+    Storage mixin for the fields of record views: the value is unpacked from the buffer of the view
+    on each access, views are read-only
+    """
+    _unpack = None  # unpack_from of the struct reading the presence byte and the value of the field
+    _mask = 0  # bit of the field in its presence byte
+    _decode = None  # conversion of the packed value, None if stored as is
+
+    def __get__(self, view, owner):
+        if view is None:
+            return self
+        flags, value = self._unpack(view._buf, view._offset)
+        if not flags & self._mask:
+            return None
+        decode = self._decode
+        return value if decode is None else decode(value)
+
+    def __set__(self, view, value):
+        raise NotEditableField('{} is read-only in record views'.format(self.name), field_name=self.name)
+
+    def __delete__(self, view):
+        raise NotEditableField('{} is read-only in record views'.format(self.name), field_name=self.name)
+
+    def has_value(self, view):
+        return self.__get__(view, None) is not None
+
+    def get_raw(self, view):
+        return self.__get__(view, None)
+
+
+_packed_classes = {}
+
+
+def packed(field, unpack, mask, decode):
+    """
+    Return a copy of the field reading its value from the buffer of record views.
+    The storage mixin comes first in the MRO, taking precedence over the storage of slotted fields
+    """
+    field_cls = type(field)
+    packed_cls = _packed_classes.get(field_cls)
+    if packed_cls is None:
+        packed_cls = type(str('Packed' + field_cls.__name__), (PackedStorage, field_cls), {})
+        _packed_classes[field_cls] = packed_cls
+    res = copy.copy(field)
+    res.__class__ = packed_cls
+    res._unpack = unpack
+    res._mask = mask
+    res._decode = decode
+    return res
+
+
+class RecordView(object):
+    """
+    Read-only view of a record packed by `Model.pack_records`: fields are unpacked from the buffer
+    when accessed, nothing is copied
+    """
+    __slots__ = ('_buf', '_offset')
+
+    _fields = None
+    _model = None  # model class of the records
+
+    def __init__(self, buf, offset=0):
+        self._buf = buf
+        self._offset = offset
+
+    def to_dict(self):
+        res = {}
+        for name, field in iteritems(self._fields):
+            value = getattr(self, name)
+            if value is not None:
+                res[name] = field.to_dict(value)
+        return res
+
+    def to_model(self, trusted=False):
+        """
+        Model holding the values of the record
+
+        :param trusted: build the model with `construct`, without validating the values
+        """
+        values = {name: getattr(self, name) for name in self._fields}
+        if trusted:
+            return self._model.construct(**values)
+        return self._model(**values)
+
+    def __repr__(self):
+        res = []
+        for name, field in iteritems(self._fields):
+            if field._repr:
+                res.append('{}={}'.format(name, getattr(self, name)))
+        return '<{}View({})>'.format(self._model.__name__, ', '.join(res))
+
+
+class RecordLayout(object):
+    """
+    Fixed-width layout of the records of a flat model class
+    """
+
+    def __init__(self, cls, strings=None):
+        """
+        :param strings: string area storing the values of str and bytes fields, which can't be packed otherwise.
+                        Provides `store_text`/`store_bytes` returning the offset of a value,
+                        and `load_text`/`load_bytes` reading it back
+        """
+        self.cls = cls
+        fields = list(iteritems(cls._fields))
+        bitmap_size = (len(fields) + 7) // 8
+        fmt = '<' + 'B' * bitmap_size
+        self.columns = {}  # field name -> (index of the presence byte, mask, index of the value, decode)
+        encoders = []
+        view_fields = {}
+        for i, (name, field) in enumerate(fields):
+            code, encode, decode = _field_codec(cls, name, field, strings)
+            offset = struct.calcsize(fmt)
+            byte = i // 8
+            # reads the presence byte and the value at once
+            unpack = struct.Struct('<{}xB{}x{}'.format(byte, offset - byte - 1, code)).unpack_from
+            view_fields[name] = packed(field, unpack, 1 << (i % 8), decode)
+            self.columns[name] = (byte, 1 << (i % 8), bitmap_size + i, decode)
+            encoders.append((name, encode))
+            fmt += code
+        self.struct = struct.Struct(fmt)
+        self.size = self.struct.size
+        self.pack = self._build_pack(encoders, bitmap_size)
+        attrs = dict(view_fields, __slots__=(), __module__=cls.__module__, _fields=view_fields, _model=cls)
+        self.view_cls = type(str(cls.__name__ + 'View'), (RecordView,), attrs)
+
+    def _build_pack(self, encoders, bitmap_size):
+        """
+        Function packing instances into a buffer, straight-line code for each field
+        """
+        ns = {'pack_into': self.struct.pack_into, 'size': self.size, 'error': struct.error,
+              'out_of_range': _out_of_range}
+        body = ['bits = 0']
+        for i, (name, encode) in enumerate(encoders):
+            v = 'v{}'.format(i)
+            body += ['{} = instance.{}'.format(v, name),
+                     'if {} is None:'.format(v),
+                     '    {} = 0'.format(v),
+                     'else:',
+                     '    bits |= {}'.format(1 << i)]
+            if encode is not None:
+                ns['encode{}'.format(i)] = encode
+                body += ['    {v} = encode{i}({v})'.format(v=v, i=i)]
+        args = ['(bits >> {}) & 0xff'.format(8 * k) for k in range(bitmap_size)]
+        args += ['v{}'.format(i) for i in range(len(encoders))]
+        body += ['pack_into(buf, index * size, {})'.format(', '.join(args))]
+        lines = ['def pack(instances, buf):',
+                 '    for index, instance in enumerate(instances):',
+                 '        try:']
+        lines += ['            ' + line for line in body]
+        lines += ['        except (error, KeyError) as e:',
+                  '            raise out_of_range(e, index)']
+        source = '\n'.join(lines) + '\n'
+        filename = '<pyjo generated record pack {}.{}>'.format(self.cls.__module__, self.cls.__name__)
+        exec(compile(source, filename, 'exec'), ns)
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        return ns['pack']
+
+
+def _out_of_range(e, index):
+    error = ValueError('Value out of the range of its packed type: {}'.format(e))
+    set_error_index(error, index)
+    return error
+
+
+def layout(cls):
+    """
+    Record layout of a flat model class, TypeError if a field can not be packed
+
+    :rtype: RecordLayout
+    """
+    res = _layouts.get(cls)
+    if res is None:
+        res = _layouts[cls] = RecordLayout(cls)
+    return res
+
+
+def pack(cls, instances):
+    """
+    See Model.pack_records
+    """
+    record = layout(cls)
+    if not isinstance(instances, (list, tuple)):
+        instances = list(instances)
+    buf = bytearray(record.size * len(instances))
+    record.pack(instances, buf)
+    return buf
+
+
+class RecordArray(object):
+    """
+    Sequence of the records packed in a buffer, as returned by `Model.record_views`.
+    Items are `RecordView`s of the records, `column` reads one field of every record
+    """
+
+    def __init__(self, cls, buf, record_layout=None):
+        self.layout = record_layout or layout(cls)
+        self.record_size = self.layout.size
+        self._buf = memoryview(buf)
+        if self._buf.nbytes % self.record_size:
+            raise ValueError('Buffer size is not a multiple of the record size of {} ({} bytes)'.format(
+                cls.__name__, self.record_size))
+        self._count = self._buf.nbytes // self.record_size
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('record index out of range')
+        return self.layout.view_cls(self._buf, index * self.record_size)
+
+    def __iter__(self):
+        view_cls = self.layout.view_cls
+        buf = self._buf
+        for offset in range(0, self._count * self.record_size, self.record_size):
+            yield view_cls(buf, offset)
+
+    def column(self, name):
+        """
+        Values of a field in all the records, without creating views
+        """
+        byte, mask, position, decode = self.layout.columns[name]
+        iter_unpack = getattr(self.layout.struct, 'iter_unpack', None)
+        if iter_unpack is None:
+            # Python 2
+            unpack_from = self.layout.struct.unpack_from
+            rows = (unpack_from(self._buf, offset)
+                    for offset in range(0, self._count * self.record_size, self.record_size))
+        else:
+            rows = iter_unpack(self._buf)
+        if decode is None:
+            return [row[position] if row[byte] & mask else None for row in rows]
+        return [decode(row[position]) if row[byte] & mask else None for row in rows]
+
+    def to_models(self, trusted=False):
+        return [view.to_model(trusted=trusted) for view in self]
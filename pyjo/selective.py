@@ -0,0 +1,119 @@
+"""
+Schema-directed JSON parsing: only the keys declared by the models (and by their nested models) are turned into
+Python objects, the values of the other keys are skipped by the simdjson tokenizer (requires pysimdjson)
+"""
+import threading
+import weakref
+
+from six import binary_type, iteritems
+
+from pyjo.codegen import _inherits, _is_generic
+from pyjo.fields.field import Field
+from pyjo.fields.listfield import ListField
+from pyjo.fields.mapfield import MapField
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+__all__ = ['loads', 'loads_many']
+
+_plans = weakref.WeakKeyDictionary()  # model class -> {field name: value plan}
+
+_missing = object()
+
+_local = threading.local()  # parser of the thread, reused from one document to the next
+
+
+def _model_plan(cls, generic_from_dict):
+    """
+    How to parse the value of each field of a model class, built once per class
+    """
+    plan = _plans.get(cls)
+    if plan is None:
+        # registered before being filled, for models nesting themselves
+        plan = _plans[cls] = {}
+        for name, field in iteritems(cls._fields):
+            plan[name] = _value_plan(field, generic_from_dict)
+    return plan
+
+
+def _value_plan(field, generic_from_dict):
+    """
+    None to decode the value as is, otherwise `('object', model plan)`, `('list', value plan)`
+    or `('map', value plan)` to parse it selectively
+    """
+    if field._from_dict is not None:
+        return None
+    for container, kind in ((ListField, 'list'), (MapField, 'map')):
+        if isinstance(field, container):
+            if not _inherits(field, container, ('from_dict',)):
+                return None
+            inner = _value_plan(field.inner_field, generic_from_dict)
+            return None if inner is None else (kind, inner)
+    t = field._type
+    if (getattr(t, '_fields', None) is not None and _inherits(field, Field, ('from_dict',))
+            and _is_generic(t, 'from_dict', generic_from_dict)):
+        # the nested model would discard the keys it does not declare anyway
+        return 'object', _model_plan(t, generic_from_dict)
+    return None
+
+
+def _value(value, plan):
+    """
+    Python value of a simdjson value, only materializing the declared keys of the objects of models
+    """
+    if plan is not None:
+        kind, inner = plan
+        if kind == 'object' and isinstance(value, simdjson.Object):
+            res = {}
+            get = value.get
+            for name, field_plan in iteritems(inner):
+                v = get(name, _missing)
+                if v is not _missing:
+                    res[name] = _value(v, field_plan)
+            return res
+        if kind == 'map' and isinstance(value, simdjson.Object):
+            return {k: _value(v, inner) for k, v in value.items()}
+        if kind == 'list' and isinstance(value, simdjson.Array):
+            return [_value(v, inner) for v in value]
+    # anything else is materialized as is, and will be reported by the validation if not valid
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
+
+def _parse(s, plan):
+    if simdjson is None:
+        raise ImportError('pysimdjson is required for skip_undeclared (pip install pyjo[simdjson])')
+    if not isinstance(s, binary_type):
+        s = s.encode('utf-8')
+    parser = getattr(_local, 'parser', None)
+    if parser is None:
+        parser = _local.parser = simdjson.Parser()
+    try:
+        doc = parser.parse(s)
+    except RuntimeError:
+        # values of the previous document are still referenced (e.g. by a traceback), the parser can't be reused
+        parser = _local.parser = simdjson.Parser()
+        doc = parser.parse(s)
+    # the values of a document are only valid until the parser parses another one
+    return _value(doc, plan)
+
+
+def loads(cls, s, generic_from_dict):
+    """
+    Parse a JSON document (str or UTF-8 bytes) for the model class, building Python objects only for the keys
+    it declares
+    """
+    return _parse(s, ('object', _model_plan(cls, generic_from_dict)))
+
+
+def loads_many(cls, s, generic_from_dict):
+    """
+    Same as `loads`, for a JSON array of records
+    """
+    return _parse(s, ('list', ('object', _model_plan(cls, generic_from_dict))))
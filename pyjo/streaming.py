@@ -0,0 +1,263 @@
+import codecs
+import io
+import json
+import mmap
+
+from pyjo.codegen import compiled_method
+from pyjo.exceptions import set_error_index
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_WINDOW_SIZE = 1024 * 1024
+# asyncio streaming (see pyjo.aio) gives control back to the event loop every N records or every M seconds
+DEFAULT_YIELD_EVERY = 100
+DEFAULT_YIELD_INTERVAL = 0.005
+
+
+def iter_lines(fileobj, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield the lines of a text or binary file object, without line terminators, reading it in chunks
+    of `chunk_size`. Only the current chunk and the current line are kept in memory
+    """
+    pending = []  # pieces of the line continuing in the next chunk, joined once the line ends
+    newline = None
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+        if newline is None:
+            newline = b'\n' if isinstance(chunk, bytes) else '\n'
+        lines = chunk.split(newline)
+        if len(lines) == 1:
+            # a line longer than the chunk, only the new chunk is searched for its end
+            pending.append(chunk)
+            continue
+        if pending:
+            pending.append(lines[0])
+            lines[0] = chunk[:0].join(pending)
+        # the last line continues in the next chunk
+        rest = lines.pop()
+        pending = [rest] if rest else []
+        for line in lines:
+            yield line
+    if pending:
+        yield pending[0][:0].join(pending)
+
+
+def check_invalid(skip_invalid, invalid):
+    """
+    Invalid records are collected only when they are skipped
+    """
+    if invalid is not None and not skip_invalid:
+        raise ValueError('invalid requires skip_invalid')
+
+
+def iter_jsonl(cls, fileobj, discard_non_fields=True, chunk_size=DEFAULT_CHUNK_SIZE, skip_invalid=False,
+               invalid=None):
+    """
+    Yield one model for each line of a JSON Lines file object, reading it in chunks.
+    See Model.iter_jsonl
+    """
+    decode = compiled_method(cls, 'from_dict')
+    loads = cls.json_backend().loads
+    for index, line in enumerate(iter_lines(fileobj, chunk_size=chunk_size)):
+        if not line.strip():
+            continue
+        try:
+            instance = decode(loads(line), discard_non_fields=discard_non_fields)
+        except Exception as e:
+            if not skip_invalid:
+                set_error_index(e, index)
+                raise
+            if invalid is not None:
+                invalid.append((index, line, e))
+            continue
+        yield instance
+
+
+def _is_binary(fileobj):
+    if isinstance(fileobj, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    if isinstance(fileobj, io.TextIOBase):
+        return False
+    return 'b' in getattr(fileobj, 'mode', '')
+
+
+def dump_jsonl(cls, instances, fileobj, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Write the models as JSON Lines to a text or binary file object, flushing every `chunk_size`
+    characters (bytes). See Model.dump_jsonl
+    """
+    binary = _is_binary(fileobj)
+    buffer = []
+    size = 0
+    count = 0
+    for instance in instances:
+        line = instance.to_json_bytes() + b'\n' if binary else instance.to_json() + '\n'
+        buffer.append(line)
+        size += len(line)
+        count += 1
+        if size >= chunk_size:
+            _write(fileobj, buffer, binary)
+            buffer = []
+            size = 0
+    if buffer:
+        _write(fileobj, buffer, binary)
+    return count
+
+
+def _write(fileobj, lines, binary):
+    fileobj.write((b'' if binary else '').join(lines))
+
+
+def _open_map(path):
+    """
+    Read-only memory map of a file, bytes if empty (empty files can't be mapped)
+    """
+    with open(path, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b''
+
+
+def _release(buf, start, stop):
+    """
+    Tell the OS that the pages of the map between `start` and `stop` won't be needed anymore,
+    so that they do not count in the resident memory
+    """
+    if not hasattr(buf, 'madvise') or not hasattr(mmap, 'MADV_DONTNEED'):
+        return start
+    start -= start % mmap.PAGESIZE
+    stop -= stop % mmap.PAGESIZE
+    if stop > start:
+        buf.madvise(mmap.MADV_DONTNEED, start, stop - start)
+    return stop
+
+
+def _truncated(error, text):
+    """
+    True if the decoding error may be due to the window ending in the middle of the value
+    """
+    pos = getattr(error, 'pos', None)
+    return pos is None or pos >= len(text) - 32 or error.args[0].startswith('Unterminated string')
+
+
+def iter_array_elements(buf, start=None, end=None, window_size=DEFAULT_WINDOW_SIZE):
+    """
+    Yield `(offset, value)` for the elements of the JSON array held by `buf` (bytes or memory map), decoding
+    one window of `window_size` bytes at a time (grown for elements larger than the window).
+    `offset` is the position of the first byte of the element.
+
+    :param start: offset of the first element to decode (as yielded), None for the beginning of the array
+    :param end: stop at the first element starting at or after this offset
+    """
+    raw_decode = json.JSONDecoder().raw_decode
+    size = len(buf)
+    pos = 0 if start is None else start
+    released = pos
+    window = window_size
+    first = start is None  # the opening bracket is expected, then an element or the closing bracket
+    expect_value = True
+    while True:
+        data = buf[pos:pos + window]
+        eof = pos + len(data) >= size
+        text, consumed = codecs.utf_8_decode(data, 'strict', eof)
+        ascii = len(text) == consumed
+        # byte offset of text[char], computed incrementally from the last checkpoint for non ASCII text
+        char, byte = 0, 0
+        i = 0
+        refill = False
+        while not refill:
+            while i < len(text) and text[i] in ' \t\r\n':
+                i += 1
+            if i == len(text):
+                if eof:
+                    raise ValueError('Unterminated JSON array')
+                break
+            if first:
+                if text[i] != '[':
+                    raise ValueError('Expecting a JSON array, found {!r}'.format(text[i]))
+                first = False
+                i += 1
+                while i < len(text) and text[i] in ' \t\r\n':
+                    i += 1
+                if i < len(text) and text[i] == ']':
+                    return
+                continue
+            if not expect_value:
+                if text[i] == ',':
+                    expect_value = True
+                    i += 1
+                    continue
+                if text[i] == ']':
+                    return
+                raise ValueError('Expecting \',\' delimiter or \']\' in JSON array, found {!r}'.format(text[i]))
+            if not ascii:
+                byte += len(text[char:i].encode('utf-8'))
+                char = i
+            offset = pos + (i if ascii else byte)
+            if end is not None and offset >= end:
+                return
+            try:
+                value, j = raw_decode(text, i)
+            except ValueError as e:
+                if eof or not _truncated(e, text):
+                    raise
+                refill = True
+                continue
+            if j == len(text) and not eof:
+                # a value ending with the window may continue (e.g. numbers)
+                refill = True
+                continue
+            yield offset, value
+            i = j
+            expect_value = False
+        if not ascii:
+            byte += len(text[char:i].encode('utf-8'))
+        advance = i if ascii else byte
+        # an element larger than the window
+        window = window * 2 if advance == 0 else window_size
+        pos += advance
+        released = _release(buf, released, pos)
+
+
+def iter_json_array(cls, path, start=None, end=None, discard_non_fields=True, window_size=DEFAULT_WINDOW_SIZE,
+                    skip_invalid=False, invalid=None, offsets=False):
+    """
+    Yield one model for each element of the JSON array of a file, memory mapped. See Model.iter_json_array
+    """
+    buf = _open_map(path)
+    decode = compiled_method(cls, 'from_dict')
+    try:
+        for index, (offset, value) in enumerate(iter_array_elements(buf, start, end, window_size)):
+            try:
+                instance = decode(value, discard_non_fields=discard_non_fields)
+            except Exception as e:
+                if not skip_invalid:
+                    set_error_index(e, index)
+                    raise
+                if invalid is not None:
+                    invalid.append((index, value, e))
+                continue
+            yield (offset, instance) if offsets else instance
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+
+
+def split_json_array(path, parts, window_size=DEFAULT_WINDOW_SIZE):
+    """
+    Split the elements of the JSON array of a file into `parts` ranges of about the same size in bytes.
+    The elements are decoded once to find their exact offsets. See Model.split_json_array
+    """
+    buf = _open_map(path)
+    try:
+        size = len(buf)
+        bounds = []
+        for offset, _ in iter_array_elements(buf, window_size=window_size):
+            if not bounds or offset >= size * len(bounds) // parts:
+                bounds.append(offset)
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+    return list(zip(bounds, bounds[1:] + [size]))
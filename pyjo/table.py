@@ -0,0 +1,215 @@
+"""
+Tables of models in shared memory (requires Python 3.8+), readable in place by other processes.
+
+A table segment holds a header, the fixed-width records of the models (see `pyjo.records`) and a string
+area: the values of str and bytes fields are stored there once each, as a varint length followed by
+their bytes, the records holding their offset.
+"""
+import hashlib
+import struct
+import threading
+
+from six import binary_type
+
+from pyjo import binary, records
+from pyjo.binary import _read_uvarint, _write_uvarint
+from pyjo.exceptions import SchemaMismatchError
+
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:
+    shared_memory = resource_tracker = None
+
+__all__ = ['ModelTable']
+
+MAGIC = b'PYJOTBL1'
+
+# magic, layout fingerprint, number of records, size of the string area
+_header = struct.Struct('<8s8sQQ')
+
+
+_attach_lock = threading.Lock()
+
+
+def _require_shared_memory():
+    if shared_memory is None:
+        raise ImportError('multiprocessing.shared_memory (Python 3.8+) is required for model tables')
+
+
+def _attach_segment(name):
+    """
+    Existing shared memory segment, not registered to the resource tracker: the tracker (shared with the
+    creating process by its children) would remove it when this process exits, or forget it is still used
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always registers the segment
+        pass
+    with _attach_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+class _Strings(object):
+    """
+    String area of a table, written while the table is built and read in place afterwards
+    """
+
+    def __init__(self, buf=None):
+        self.buf = bytearray() if buf is None else buf
+        self.offsets = {}  # value -> offset, each distinct value is stored once
+
+    def store_bytes(self, value):
+        offset = self.offsets.get(value)
+        if offset is None:
+            offset = self.offsets[value] = len(self.buf)
+            _write_uvarint(self.buf, len(value))
+            self.buf += value
+        return offset
+
+    def store_text(self, value):
+        return self.store_bytes(value.encode('utf-8'))
+
+    def load_bytes(self, offset):
+        n, pos = _read_uvarint(self.buf, offset)
+        return binary_type(self.buf[pos:pos + n])
+
+    def load_text(self, offset):
+        n, pos = _read_uvarint(self.buf, offset)
+        return binary_type(self.buf[pos:pos + n]).decode('utf-8')
+
+
+def _fingerprint(cls, layout):
+    """
+    Fingerprint of the schema and of the record layout of a table
+    """
+    return hashlib.sha1(binary.fingerprint(cls) + layout.struct.format.encode('ascii')).digest()[:8]
+
+
+class ModelTable(object):
+    """
+    Read-only collection of models of one class in a shared memory segment: built once with `create`,
+    attached by name with `attach` in other processes (or inherited by forked workers).
+    Used as a context manager, the table is closed on exit, and unlinked by the creating process.
+    Items are read-only views of the models reading their fields from the segment on access, without
+    copying or unpickling: `to_model()` of a view builds the model.
+    Models are flat: int, float, bool, str, bytes, DatetimeField, EnumField and RangeField fields only
+    """
+
+    def __init__(self, cls, shm, owner):
+        self.cls = cls
+        self._shm = shm
+        self._owner = owner
+        buf = shm.buf
+        magic, fingerprint, count, strings_size = _header.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError('Shared memory segment {} does not hold a model table'.format(shm.name))
+        self._strings = _Strings()
+        layout = records.RecordLayout(cls, strings=self._strings)
+        if fingerprint != _fingerprint(cls, layout):
+            raise SchemaMismatchError('Table {} was not built with the schema of {}'.format(
+                shm.name, cls.__name__))
+        record_size = layout.size
+        strings_start = _header.size + count * record_size
+        self._records_buf = buf[_header.size:strings_start]
+        self._strings.buf = buf[strings_start:strings_start + strings_size]
+        self._records = records.RecordArray(cls, self._records_buf, layout)
+
+    @classmethod
+    def create(cls, model, instances, name=None):
+        """
+        Build a table of models in a new shared memory segment, named `name` (random if None).
+        The process creating the table should `unlink` it once done
+
+        :type model: type
+        :rtype: ModelTable
+        """
+        _require_shared_memory()
+        strings = _Strings()
+        layout = records.RecordLayout(model, strings=strings)
+        instances = list(instances)
+        data = bytearray(layout.size * len(instances))
+        layout.pack(instances, data)
+        header = _header.pack(MAGIC, _fingerprint(model, layout), len(instances), len(strings.buf))
+        size = len(header) + len(data) + len(strings.buf)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        try:
+            end = len(header) + len(data)
+            shm.buf[:len(header)] = header
+            shm.buf[len(header):end] = data
+            shm.buf[end:size] = strings.buf
+            return cls(model, shm, owner=True)
+        except Exception:
+            shm.close()
+            shm.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, model, name):
+        """
+        Table created by another process. The segment is left to the creating process: it is not
+        unlinked when the attaching process exits.
+        Raises `SchemaMismatchError` if the table was built for a model with different fields
+
+        :type model: type
+        :rtype: ModelTable
+        """
+        _require_shared_memory()
+        shm = _attach_segment(name)
+        try:
+            return cls(model, shm, owner=False)
+        except Exception:
+            shm.close()
+            raise
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    def __len__(self):
+        return len(self._records)
+
+    def __getitem__(self, index):
+        return self._records[index]
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def column(self, name):
+        """
+        Values of a field in all the models of the table
+        """
+        return self._records.column(name)
+
+    def to_models(self, trusted=False):
+        return self._records.to_models(trusted=trusted)
+
+    def close(self):
+        """
+        Detach the table from this process, its views can't be read anymore
+        """
+        self._records_buf.release()
+        if isinstance(self._strings.buf, memoryview):
+            self._strings.buf.release()
+        self._records._buf.release()
+        self._shm.close()
+
+    def unlink(self):
+        """
+        Remove the shared memory segment, once every process closed the table
+        """
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        # the creating process removes the segment as well
+        self.close()
+        if self._owner:
+            self.unlink()
@@ -17,7 +17,7 @@ setup(
     long_description_content_type="text/markdown",
     author='Marco Pazzaglia',
     author_email='marco@pazzaglia.me',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     package_data={'': ['LICENSE']},
     test_suite="tests",
     install_requires=[
@@ -25,4 +25,8 @@ setup(
         'future',
         "enum34 ; python_version<'3.4'",
     ],
+    extras_require={
+        'numpy': ['numpy'],
+        'simdjson': ['pysimdjson'],
+    },
 )
@@ -0,0 +1,198 @@
+import io
+import sys
+import unittest
+
+from pyjo import Model, Field, RangeField
+from pyjo.exceptions import RequiredFieldError
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+
+class A(Model):
+    foo = Field(type=str, required=True)
+    n = RangeField(min=0, max=10)
+
+
+class Chunks(object):
+    """
+    Async iterable of the given chunks
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        for chunk in self.chunks:
+            return asyncio.sleep(0, result=chunk)
+        raise StopAsyncIteration
+
+
+class Writer(object):
+    def __init__(self):
+        self.writes = []
+        self.drains = 0
+
+    def write(self, data):
+        self.writes.append(data)
+
+    def drain(self):
+        self.drains += 1
+        return asyncio.sleep(0)
+
+
+def split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@unittest.skipIf(asyncio is None or sys.version_info < (3, 6), 'requires Python 3.6+')
+class AsyncStreamingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def collect(self, iterator):
+        res = []
+        while True:
+            try:
+                res.append(self.loop.run_until_complete(iterator.__anext__()))
+            except StopAsyncIteration:
+                return res
+
+    def reader(self, data):
+        reader = asyncio.StreamReader(loop=self.loop)
+        reader.feed_data(data)
+        reader.feed_eof()
+        return reader
+
+    def test_json_lines(self):
+        data = u'{"foo": "a", "n": 1}\n\n{"foo": "è"}\r\n{"foo": "c"}'.encode('utf-8')
+        for stream in (self.reader(data), Chunks(split(data, 3)), Chunks(split(data.decode('utf-8'), 2))):
+            res = self.collect(A.aiter_json(stream, chunk_size=4))
+            self.assertEqual(A.to_dicts(res), [{'foo': 'a', 'n': 1}, {'foo': u'è'}, {'foo': 'c'}])
+
+    def test_json_array(self):
+        records = [{'foo': 'x{}'.format(i), 'n': i % 10} for i in range(50)]
+        data = A.to_json_many(A.from_dicts(records)).encode('utf-8')
+        for size in (1, 7, len(data)):
+            res = self.collect(A.aiter_json(Chunks(split(data, size))))
+            self.assertEqual(A.to_dicts(res), records)
+        self.assertEqual(self.collect(A.aiter_json(Chunks([b' [ ', b'] ']))), [])
+        self.assertEqual(self.collect(A.aiter_json(Chunks([]))), [])
+
+        # numbers split across chunks are not truncated
+        class B(Model):
+            n = Field(type=int)
+
+        res = self.collect(B.aiter_json(Chunks([b'[{"n": 1', b'23}', b', {"n": 4}]']), array=True))
+        self.assertEqual([b.n for b in res], [123, 4])
+
+    def test_invalid(self):
+        data = b'{"foo": "a"}\n{"n": 1}\nnot json\n{"foo": "b"}\n'
+        with self.assertRaises(RequiredFieldError) as e:
+            self.collect(A.aiter_json(Chunks([data])))
+        self.assertEqual(e.exception.index, 1)
+
+        invalid = []
+        res = self.collect(A.aiter_json(Chunks([data]), skip_invalid=True, invalid=invalid))
+        self.assertEqual([a.foo for a in res], ['a', 'b'])
+        self.assertEqual([(index, line) for index, line, _ in invalid], [(1, '{"n": 1}'), (2, 'not json')])
+        res = self.collect(A.aiter_json(Chunks([data]), skip_invalid=True))
+        self.assertEqual([a.foo for a in res], ['a', 'b'])
+        with self.assertRaises(ValueError):
+            A.aiter_json(Chunks([data]), invalid=[])
+
+        with self.assertRaises(RequiredFieldError) as e:
+            self.collect(A.aiter_json(Chunks([b'[{"foo": "a"}, {"n": 1}]'])))
+        self.assertEqual(e.exception.index, 1)
+        for data in (b'[{"foo": "a"} {"foo": "b"}]', b'[{"foo": "a"}, {"foo"', b'[{"foo": "a"}'):
+            with self.assertRaises(ValueError):
+                self.collect(A.aiter_json(Chunks(split(data, 4))))
+        with self.assertRaises(ValueError):
+            self.collect(A.aiter_json(Chunks([b'{"foo": "a"}']), array=True))
+
+    def test_malformed_array(self):
+        parts = split(b'[{"foo": "a"}, {"foo": x}, ' + b', '.join([b'{"foo": "b"}'] * 1000) + b']', 8)
+        chunks = Chunks(parts)
+        with self.assertRaises(ValueError) as e:
+            self.collect(A.aiter_json(chunks, skip_invalid=True))
+        # raised as soon as the element is read, not at the end of the stream
+        self.assertEqual(e.exception.index, 1)
+        self.assertGreater(len(list(chunks.chunks)), len(parts) - 10)
+
+    def test_large_array_element(self):
+        from unittest import mock
+        import json
+
+        data = A(foo='x' * 100000).to_json_bytes()
+        raw_decode = json.JSONDecoder.raw_decode
+        calls = []
+
+        def counting(self, s, idx=0):
+            calls.append(idx)
+            return raw_decode(self, s, idx)
+
+        with mock.patch.object(json.JSONDecoder, 'raw_decode', counting):
+            res = self.collect(A.aiter_json(Chunks(split(b'[' + data + b', ' + data + b']', 100)), array=True))
+        self.assertEqual([len(a.foo) for a in res], [100000, 100000])
+        # decoded again each time the buffered text doubles, not for each chunk
+        self.assertLess(len(calls), 30)
+
+    def drive(self, iterator):
+        """
+        Run the async iterator without event loop, counting the times it gives control back
+        """
+        res = []
+        suspensions = 0
+        while True:
+            step = iterator.__anext__()
+            try:
+                while True:
+                    step.send(None)
+                    suspensions += 1
+            except StopIteration as e:
+                res.append(e.value)
+            except StopAsyncIteration:
+                return res, suspensions
+
+    def test_gives_control_back(self):
+        data = b''.join(A(foo='x').to_json_bytes() + b'\n' for _ in range(100))
+        for every, interval, expected in ((10, None, 10), (None, 0, 100), (None, None, 0), (1000, 60, 0)):
+            res, suspensions = self.drive(A.aiter_json(self.reader(data), yield_every=every, yield_interval=interval))
+            self.assertEqual(len(res), 100)
+            self.assertEqual(suspensions, expected)
+
+    def test_dump(self):
+        models = [A(foo='x{}'.format(i), n=i % 10) for i in range(100)]
+        for array in (False, True):
+            writer = Writer()
+            count = self.loop.run_until_complete(A.adump_json(iter(models), writer, array=array, chunk_size=256))
+            self.assertEqual(count, 100)
+            self.assertGreater(len(writer.writes), 1)
+            self.assertEqual(writer.drains, len(writer.writes))
+            data = b''.join(writer.writes)
+            if array:
+                self.assertEqual(A.to_dicts(A.from_json_many(data.decode('utf-8'))), A.to_dicts(models))
+            else:
+                self.assertEqual(A.to_dicts(A.iter_jsonl(io.BytesIO(data))), A.to_dicts(models))
+            res = self.collect(A.aiter_json(Chunks(split(data, 100))))
+            self.assertEqual(A.to_dicts(res), A.to_dicts(models))
+
+        writer = Writer()
+        self.loop.run_until_complete(A.adump_json(Chunks(models), writer, array=True))
+        self.assertEqual(len(A.from_json_many(b''.join(writer.writes).decode('utf-8'))), 100)
+        writer = Writer()
+        self.assertEqual(self.loop.run_until_complete(A.adump_json([], writer, array=True)), 0)
+        self.assertEqual(writer.writes, [b'[]'])
+
+
+if __name__ == '__main__':
+    unittest.main()
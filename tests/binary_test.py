@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import datetime
+from enum import Enum
+
+from six import u
+
+from pyjo import (Model, Field, ListField, MapField, RangeField, DatetimeField, EnumField, ArrayField,
+                  binary)
+from pyjo.exceptions import SchemaMismatchError, ValidationError, FieldTypeError
+
+
+class Color(Enum):
+    red = 1
+    blue = 2
+
+
+class Point(Model):
+    x = Field(type=int)
+    y = Field(type=int)
+
+
+class Shape(Model):
+    name = Field(type=str, required=True)
+    size = RangeField(min=0, max=100)
+    big = Field(type=int)
+    area = Field(type=float)
+    visible = Field(type=bool)
+    created = DatetimeField()
+    color = EnumField(Color)
+    center = Field(type=Point)
+    points = ListField(Field(type=Point))
+    tags = MapField(ListField(Field(type=str)))
+    weights = ArrayField('d')
+    extra = Field()
+    label = Field(type=str, to_dict=lambda v: v.upper(), from_dict=lambda v: v.lower())
+
+
+class Scores(Model):
+    values = ListField(RangeField(min=0, max=10))
+
+
+class SlotShape(Shape):
+    _slots = True
+
+
+class ScoreDefaults(Model):
+    values = ListField(RangeField(min=0, max=10), default=lambda: [1])
+    by_name = MapField(RangeField(min=0, max=10), default=dict)
+
+
+class SlotScoreDefaults(ScoreDefaults):
+    _slots = True
+
+
+class Defaults(Model):
+    name = Field(type=str, default='none')
+    values = ListField(Field(type=int), validator=lambda v: len(v) < 3)
+
+    def after_init(self):
+        self.initialized = True
+
+
+class Custom(Model):
+    name = Field(type=str)
+
+    def __init__(self, **kwargs):
+        super(Custom, self).__init__(**kwargs)
+        self.custom = True
+
+
+class OtherShape(Model):
+    name = Field(type=str, required=True)
+    size = Field(type=int)
+
+
+class BinaryTest(unittest.TestCase):
+
+    def shape(self):
+        return Shape(name=u('shäpe'), size=10, big=-2 ** 70, area=1.5, visible=False,
+                     created=datetime(2020, 1, 2, 3, 4, 5), color=Color.blue, center=Point(x=1, y=-1),
+                     points=[Point(x=200), Point()], tags={'a': ['b', 'c'], 'd': []}, weights=[1.0, 2.5],
+                     extra={'any': [1, None]}, label='abc')
+
+    def test_round_trip(self):
+        shape = self.shape()
+        data = shape.to_bytes()
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(data[:binary.FINGERPRINT_SIZE], binary.fingerprint(Shape))
+        for trusted in (False, True):
+            decoded = Shape.from_bytes(data, trusted=trusted)
+            self.assertEqual(decoded.to_dict(), shape.to_dict())
+            self.assertEqual(decoded.created, shape.created)
+            self.assertIs(decoded.color, Color.blue)
+        self.assertEqual(Shape.from_bytes(bytearray(data)).to_dict(), shape.to_dict())
+        self.assertEqual(Shape.from_bytes(memoryview(data)).to_dict(), shape.to_dict())
+
+    def test_missing_fields_and_defaults(self):
+        shape = Shape.from_bytes(Shape(name='s').to_bytes())
+        self.assertEqual(shape.to_dict(), {'name': 's'})
+        self.assertIsNone(shape.center)
+
+    def test_smaller_than_json(self):
+        shape = self.shape()
+        self.assertLess(len(shape.to_bytes()), len(shape.to_json()) / 2)
+
+    def test_containers_stay_validated(self):
+        for trusted in (False, True):
+            shape = Shape.from_bytes(self.shape().to_bytes(), trusted=trusted)
+            with self.assertRaises(FieldTypeError):
+                shape.points.append(1)
+            with self.assertRaises(FieldTypeError):
+                shape.tags['x'] = [1]
+
+    def test_defaults_stay_validated(self):
+        for cls in (ScoreDefaults, SlotScoreDefaults):
+            given = cls(values=[2])
+            given.by_name = None
+            for trusted in (False, True):
+                for scores in (cls.from_bytes(given.to_bytes(), trusted=trusted),
+                               cls.from_bytes(cls(values=None, by_name=None).to_bytes(), trusted=trusted)):
+                    with self.assertRaises(ValidationError):
+                        scores.values.append(11)
+                    with self.assertRaises(ValidationError):
+                        scores.by_name['a'] = 11
+
+    def test_built_as_init(self):
+        shape = self.shape()
+        slotted = SlotShape.from_bytes(SlotShape(**{name: getattr(shape, name) for name in Shape._fields}).to_bytes())
+        self.assertEqual(slotted.to_dict(), shape.to_dict())
+        with self.assertRaises(FieldTypeError):
+            slotted.points.append(1)
+        for trusted in (False, True):
+            defaults = Defaults.from_bytes(Defaults(values=[1]).to_bytes(), trusted=trusted)
+            self.assertEqual(defaults.to_dict(), {'name': 'none', 'values': [1]})
+            self.assertTrue(defaults.initialized)
+        self.assertTrue(Custom.from_bytes(Custom(name='a').to_bytes()).custom)
+        # validators of lists apply to the decoded list
+        with self.assertRaises(ValidationError):
+            Defaults.from_bytes(Defaults.construct(values=[1, 2, 3]).to_bytes())
+
+    def test_not_json_serializable(self):
+        with self.assertRaises(TypeError) as context:
+            Shape(name='s', extra=object()).to_bytes()
+        self.assertIn('extra value', str(context.exception))
+        with self.assertRaises(TypeError):
+            Shape(name='s', extra=object()).content_hash()
+        # keys of different types are not sorted
+        self.assertEqual(Shape(name='s', extra={1: 'a', 'b': 2}).content_hash(),
+                         Shape(name='s', extra={1: 'a', 'b': 2}).content_hash())
+
+    def test_validation(self):
+        invalid = Shape.construct(name='s', size=1000).to_bytes()
+        with self.assertRaises(ValidationError):
+            Shape.from_bytes(invalid)
+        self.assertEqual(Shape.from_bytes(invalid, trusted=True).size, 1000)
+        invalid = Scores.construct(values=[1, 11]).to_bytes()
+        with self.assertRaises(ValidationError):
+            Scores.from_bytes(invalid)
+        self.assertEqual(Scores.from_bytes(invalid, trusted=True).values, [1, 11])
+
+    def test_schema_mismatch(self):
+        data = OtherShape(name='s', size=1).to_bytes()
+        self.assertNotEqual(binary.fingerprint(Shape), binary.fingerprint(OtherShape))
+        with self.assertRaises(SchemaMismatchError):
+            Shape.from_bytes(data)
+
+        class Renamed(Model):
+            name = Field(type=str, required=True)
+            length = Field(type=int)
+
+        with self.assertRaises(SchemaMismatchError):
+            Renamed.from_bytes(data)
+
+        class Same(Model):
+            name = Field(type=str)
+            size = RangeField(min=0, max=10)
+
+        self.assertEqual(Same.from_bytes(data).to_dict(), {'name': 's', 'size': 1})
+
+    def test_invalid_data(self):
+        data = self.shape().to_bytes()
+        for end in (binary.FINGERPRINT_SIZE, len(data) - 1, len(data) // 2):
+            with self.assertRaises(ValueError):
+                Shape.from_bytes(data[:end])
+        with self.assertRaises(ValueError):
+            Shape.from_bytes(data + b'\0')
+        with self.assertRaises(ValueError):
+            OtherShape.from_bytes(binary.fingerprint(OtherShape) + b'\xff')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import json
+import unittest
+
+from pyjo import Model, Field, ListField, RangeField
+from pyjo.exceptions import RequiredFieldError, ValidationError
+
+
+class B(Model):
+    n = RangeField(min=0, max=10)
+
+
+class A(Model):
+    foo = Field(type=str, required=True)
+    items = ListField(Field(type=B))
+
+
+class BulkTest(unittest.TestCase):
+
+    def test_from_dicts(self):
+        data = [{'foo': 'a'}, {'foo': 'b', 'items': [{'n': 1}]}]
+        res = A.from_dicts(iter(data))
+        self.assertEqual(len(res), 2)
+        self.assertEqual(res[1].items[0].n, 1)
+        self.assertEqual(A.to_dicts(res), data)
+        self.assertEqual(A.from_dicts([]), [])
+
+    def test_json_many(self):
+        data = [{'foo': 'a'}, {'foo': 'b', 'items': [{'n': 1}]}]
+        res = A.from_json_many(json.dumps(data))
+        self.assertEqual([a.foo for a in res], ['a', 'b'])
+        self.assertEqual(json.loads(A.to_json_many(res)), data)
+
+        with self.assertRaises(TypeError):
+            A.from_json_many(json.dumps({'foo': 'a'}))
+
+    def test_error_index(self):
+        with self.assertRaises(RequiredFieldError) as e:
+            A.from_dicts([{'foo': 'a'}, {'foo': 'b'}, {}])
+        self.assertEqual(e.exception.index, 2)
+        self.assertEqual(e.exception.message, 'record 2: Field \'foo\' is required')
+
+        with self.assertRaises(ValidationError) as e:
+            A.from_json_many('[{"foo": "a", "items": [{"n": 11}]}]')
+        self.assertEqual(e.exception.index, 0)
+        self.assertEqual(e.exception.field_name, 'items')
+
+        with self.assertRaises(TypeError) as e:
+            A.from_dicts([{'foo': 'a'}, 'b'])
+        self.assertEqual(e.exception.index, 1)
+        self.assertEqual(str(e.exception), 'record 1: data must be a dictionary')
+
+
+if __name__ == '__main__':
+    unittest.main()
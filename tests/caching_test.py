@@ -0,0 +1,157 @@
+import copy
+import pickle
+import unittest
+
+from pyjo import Model, Field, ListField, MapField, ArrayField, caching
+
+
+class Address(Model):
+    _cache_serialization = True
+
+    city = Field(type=str)
+
+
+class User(Model):
+    _cache_serialization = True
+
+    name = Field(type=str)
+    address = Field(type=Address)
+    addresses = ListField(Field(type=Address))
+    tags = MapField(ListField(Field(type=str)))
+
+
+class SlotUser(User):
+    _slots = True
+
+
+class NotCached(Model):
+    city = Field(type=str)
+
+
+class Mixed(Model):
+    _cache_serialization = True
+
+    other = Field(type=NotCached)
+    weights = ArrayField('d')
+    extra = Field()
+
+
+class CachingTest(unittest.TestCase):
+
+    def user(self, cls):
+        return cls(name='john', address=Address(city='NYC'), addresses=[Address(city='LA')], tags={'a': ['b']})
+
+    def check_model(self, cls):
+        user = self.user(cls)
+        d = user.to_dict()
+        self.assertIs(caching.cached_dict(user), caching.cached_dict(user))
+        self.assertEqual(user.to_dict(), d)
+        self.assertEqual(user.address.to_dict(), d['address'])
+        self.assertIs(user.to_json(), user.to_json())
+        self.assertIs(user.to_json_bytes(), user.to_json_bytes())
+        self.assertNotEqual(user.to_json(indent=2), user.to_json())
+
+        user.name = 'jack'
+        self.assertEqual(user.to_dict()['name'], 'jack')
+        self.assertIn('jack', user.to_json())
+        del user.name
+        self.assertNotIn('name', user.to_dict())
+        user.update_from_dict({'name': 'jim'})
+        self.assertEqual(user.to_dict()['name'], 'jim')
+
+        # changes of nested models and containers invalidate the models containing them
+        user.address.city = 'SF'
+        self.assertEqual(user.to_dict()['address'], {'city': 'SF'})
+        user.addresses[0].city = 'LV'
+        self.assertEqual(user.to_dict()['addresses'], [{'city': 'LV'}])
+        user.addresses.append(Address(city='NO'))
+        self.assertEqual(user.to_dict()['addresses'], [{'city': 'LV'}, {'city': 'NO'}])
+        user.addresses.pop()
+        self.assertEqual(user.to_dict()['addresses'], [{'city': 'LV'}])
+        user.tags['a'].append('c')
+        self.assertEqual(user.to_json(), cls.from_dict(user.to_dict()).to_json())
+        self.assertEqual(user.to_dict()['tags'], {'a': ['b', 'c']})
+        del user.tags['a']
+        self.assertEqual(user.to_dict()['tags'], {})
+
+        # unchanged subtrees keep their cache
+        user.to_dict()
+        address = caching.cached_dict(user.address)
+        user.name = 'joe'
+        user.to_dict()
+        self.assertIs(caching.cached_dict(user.address), address)
+
+        # a model moved to another parent still invalidates its new parent
+        other = self.user(cls)
+        other.to_dict()
+        other.address = user.address
+        other.to_dict()
+        user.address.city = 'Boston'
+        self.assertEqual(other.to_dict()['address'], {'city': 'Boston'})
+        self.assertEqual(user.to_dict()['address'], {'city': 'Boston'})
+
+    def test_cache(self):
+        self.check_model(User)
+
+    def test_cache_slots(self):
+        self.check_model(SlotUser)
+
+    def test_returned_dict(self):
+        for cls in (User, SlotUser):
+            user = self.user(cls)
+            d = user.to_dict()
+            # a copy of the cached dict is returned, its nested values are shared
+            self.assertIsNot(user.to_dict(), d)
+            d['name'] = 'jack'
+            del d['address']
+            self.assertEqual(user.to_dict(), self.user(cls).to_dict())
+            self.assertIs(user.to_dict()['tags'], user.to_dict()['tags'])
+            self.assertEqual(user.to_json(), self.user(cls).to_json())
+
+    def test_copies_do_not_share_the_cache(self):
+        for cls in (User, SlotUser):
+            user = self.user(cls)
+            user.to_dict()
+            for other in (copy.deepcopy(user), pickle.loads(pickle.dumps(user))):
+                self.assertEqual(other.to_dict(), user.to_dict())
+                other.address.city = 'SF'
+                self.assertEqual(other.to_dict()['address'], {'city': 'SF'})
+                self.assertEqual(user.to_dict()['address'], {'city': 'NYC'})
+        user = SlotUser(name='john')
+        user.to_dict()
+        other = copy.copy(user)
+        other.name = 'jack'
+        self.assertEqual(user.to_dict(), {'name': 'john'})
+        self.assertEqual(other.to_dict(), {'name': 'jack'})
+
+    def test_untracked_values_are_not_cached(self):
+        mixed = Mixed(other=NotCached(city='NYC'))
+        d = mixed.to_dict()
+        self.assertIsNot(mixed.to_dict(), d)
+        mixed.other.city = 'LA'
+        self.assertEqual(mixed.to_dict(), {'other': {'city': 'LA'}})
+        mixed = Mixed(weights=[1.0])
+        mixed.to_dict()
+        mixed.weights.append(2.0)
+        self.assertEqual(mixed.to_dict(), {'weights': [1.0, 2.0]})
+        mixed = Mixed(extra={'a': []})
+        mixed.to_dict()
+        mixed.extra['a'].append(1)
+        self.assertEqual(mixed.to_dict(), {'extra': {'a': [1]}})
+        self.assertEqual(Mixed().to_dict(), {})
+
+        # lists given to construct report their changes
+        user = User.construct(addresses=[Address(city='LA')])
+        user.to_dict()
+        user.addresses.append(Address(city='SF'))
+        self.assertEqual(user.to_dict(), {'addresses': [{'city': 'LA'}, {'city': 'SF'}]})
+
+    def test_lazy(self):
+        user = User.from_dict({'addresses': [{'city': 'LA'}]}, lazy=True)
+        self.assertEqual(user.to_dict(), {'addresses': [{'city': 'LA'}]})
+        user.addresses[0].city = 'SF'
+        self.assertEqual(user.to_dict(), {'addresses': [{'city': 'SF'}]})
+
+
+if __name__ == '__main__':
+    unittest.main()
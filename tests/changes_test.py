@@ -0,0 +1,155 @@
+import copy
+import pickle
+import unittest
+
+from pyjo import Model, Field, ListField, MapField
+
+
+class Address(Model):
+    _track_changes = True
+
+    city = Field(type=str)
+    zip = Field(type=int, cast=int)
+
+
+class User(Model):
+    _track_changes = True
+
+    name = Field(type=str, required=True)
+    age = Field(type=int)
+    address = Field(type=Address)
+    tags = ListField(Field(type=str))
+    kind = Field(type=str, default='user')
+
+
+class SlotUser(User):
+    _slots = True
+
+
+class NoTracking(Model):
+    name = Field(type=str)
+
+
+class SlotNoTracking(Model):
+    _slots = True
+
+    name = Field(type=str)
+    address = Field(type=Address)
+
+
+class Team(Model):
+    _track_changes = True
+
+    name = Field(type=str)
+    tags = ListField(Field(type=str))
+    scores = MapField(Field(type=int))
+    grid = ListField(ListField(Field(type=int)))
+    members = ListField(Field(type=Address))
+    owner = Field(type=NoTracking)
+    others = ListField(Field(type=NoTracking))
+    extra = Field()
+
+
+class SlotTeam(Team):
+    _slots = True
+
+
+TEAM = {'name': 'a', 'tags': ['x'], 'scores': {'a': 1}, 'grid': [[1], [2]], 'members': [{'city': 'NYC'}]}
+NO_CHANGES = {'set': {}, 'unset': []}
+
+
+class ChangesTest(unittest.TestCase):
+
+    def check_model(self, cls):
+        u = cls.from_dict({'name': 'john', 'age': 30, 'address': {'city': 'NYC', 'zip': 10001}})
+        self.assertEqual(u.to_dict_changes(), {'set': {}, 'unset': []})
+
+        u.age = 31
+        u.address.zip = '10002'
+        del u.kind
+        self.assertEqual(u.to_dict_changes(), {'set': {'age': 31, 'address.zip': 10002}, 'unset': ['kind']})
+
+        u.mark_clean()
+        self.assertEqual(u.to_dict_changes(), {'set': {}, 'unset': []})
+        self.assertEqual(u.address.to_dict_changes(), {'set': {}, 'unset': []})
+
+        u.address = Address(city='LA')
+        u.address.zip = 90001
+        u.age = None
+        self.assertEqual(u.to_dict_changes(),
+                         {'set': {'address': {'city': 'LA', 'zip': 90001}}, 'unset': ['age']})
+
+    def test_changes(self):
+        self.check_model(User)
+
+    def test_changes_slots(self):
+        self.check_model(SlotUser)
+
+    def test_construction_is_not_a_change(self):
+        class A(User):
+            def after_init(self):
+                self.age = 1
+
+        for a in (A(name='x'), A.from_dict({'name': 'x'}), A.construct(name='x'),
+                  A.from_dict({'name': 'x'}, lazy=True), A.from_dict({'name': 'x'}, trusted=True)):
+            self.assertEqual(a.to_dict_changes(), {'set': {}, 'unset': []})
+
+        u = User.construct(name='x', tags=['a'])
+        u.update_from_dict({'tags': ['b']})
+        self.assertEqual(u.to_dict_changes(), {'set': {'tags': ['b']}, 'unset': []})
+
+    def test_lazy_values_are_untouched(self):
+        u = User.from_dict({'name': 'john', 'address': {'city': 'NYC'}}, lazy=True)
+        u.name = 'jack'
+        self.assertEqual(u.to_dict_changes(), {'set': {'name': 'jack'}, 'unset': []})
+        self.assertEqual(u.address.city, 'NYC')
+        u.address.city = 'LA'
+        self.assertEqual(u.to_dict_changes(), {'set': {'name': 'jack', 'address.city': 'LA'}, 'unset': []})
+
+    def test_not_tracked(self):
+        a = NoTracking(name='x')
+        a.name = 'y'
+        self.assertIsNone(a._changes)
+        self.assertEqual(a.to_dict_changes(), {'set': {}, 'unset': []})
+
+    def test_mark_clean_not_tracked(self):
+        a = SlotNoTracking(name='x', address=Address(city='NYC'))
+        a.address.city = 'LA'
+        a.mark_clean()
+        self.assertEqual(a.address.to_dict_changes(), {'set': {}, 'unset': []})
+        a.name = 'y'
+        self.assertEqual(a.to_dict_changes(), {'set': {}, 'unset': []})
+
+    def test_containers(self):
+        for cls in (Team, SlotTeam):
+            kwargs = dict(name='a', tags=['x'], scores={'a': 1}, grid=[[1], [2]], members=[Address(city='NYC')])
+            teams = [cls.from_dict(TEAM), cls.from_dict(TEAM, trusted=True), cls.from_dict(TEAM, lazy=True),
+                     cls(**kwargs), cls.construct(**kwargs)]
+            teams += [pickle.loads(pickle.dumps(teams[0], 2)), copy.deepcopy(teams[0])]
+            for team in teams:
+                self.assertEqual(team.to_dict_changes(), NO_CHANGES)
+                for change, path, value in (
+                        (lambda: team.tags.append('y'), 'tags', ['x', 'y']),
+                        (lambda: team.scores.__setitem__('b', 2), 'scores', {'a': 1, 'b': 2}),
+                        (lambda: team.grid[1].append(3), 'grid', [[1], [2, 3]]),
+                        (lambda: setattr(team.members[0], 'city', 'LA'), 'members', [{'city': 'LA'}])):
+                    change()
+                    self.assertEqual(team.to_dict_changes(), {'set': {path: value}, 'unset': []})
+                    team.mark_clean()
+                    self.assertEqual(team.to_dict_changes(), NO_CHANGES)
+                # bound again after mark_clean
+                team.tags.pop()
+                self.assertEqual(team.to_dict_changes(), {'set': {'tags': ['x']}, 'unset': []})
+
+    def test_untracked_values(self):
+        # values whose changes can't be tracked are always reported
+        team = Team(owner=NoTracking(name='a'), others=[NoTracking()], extra={'a': 1}, tags=['x'])
+        self.assertEqual(team.to_dict_changes(),
+                         {'set': {'owner': {'name': 'a'}, 'others': [{}], 'extra': {'a': 1}}, 'unset': []})
+        team.mark_clean()
+        team.owner.name = 'b'
+        self.assertEqual(team.to_dict_changes()['set']['owner'], {'name': 'b'})
+
+
+if __name__ == '__main__':
+    unittest.main()
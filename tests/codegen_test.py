@@ -0,0 +1,222 @@
+import unittest
+from datetime import datetime
+from enum import Enum
+
+from pyjo import Model, Field, RangeField, RegexField, EnumField, DatetimeField, ListField, MapField
+from pyjo.exceptions import FieldTypeError, ValidationError
+from pyjo.model import _generic_methods
+
+generic = _generic_methods()
+
+
+class Color(Enum):
+    red = 1
+    blue = 2
+
+
+class Address(Model):
+    city = Field(type=str, required=True)
+    zip = Field(type=int, cast=int)
+
+
+class User(Model):
+    name = Field(type=str, required=True, repr=True)
+    age = RangeField(min=18, max=120)
+    code = RegexField('[A-Z]{2}')
+    color = EnumField(Color)
+    created = DatetimeField()
+    address = Field(type=Address)
+    tags = ListField(Field(type=str))
+    scores = MapField(Field(type=int))
+    addresses = ListField(Field(type=Address))
+    extra = Field()
+    flag = Field(type=bool, default=False)
+    counter = Field(type=int, default=lambda: 7)
+
+
+def generic_from_dict(cls, data):
+    return generic['from_dict'](cls, data)
+
+
+def generic_init(cls, **kwargs):
+    obj = cls.__new__(cls)
+    generic['__init__'](obj, **kwargs)
+    return obj
+
+
+class CodegenTest(unittest.TestCase):
+
+    def assertSameError(self, f, g):
+        with self.assertRaises(Exception) as e1:
+            f()
+        with self.assertRaises(Exception) as e2:
+            g()
+        self.assertEqual(type(e1.exception), type(e2.exception))
+        self.assertEqual(str(e1.exception), str(e2.exception))
+        self.assertEqual(getattr(e1.exception, 'field_name', None), getattr(e2.exception, 'field_name', None))
+
+    def test_methods_are_generated(self):
+        User(name='john')
+        self.assertTrue(User.__dict__['__init__']._pyjo_generated)
+        self.assertTrue(User.__dict__['from_dict'].__func__._pyjo_generated)
+        self.assertTrue(User.__dict__['to_dict']._pyjo_generated)
+        self.assertFalse(hasattr(User.__dict__['__init__'], '_pyjo_stub'))
+
+    def test_lazy_compilation(self):
+        class A(Model):
+            foo = Field(type=str)
+
+        class B(A):
+            bar = Field(type=int)
+
+        # nothing is compiled until the first call of a generated method
+        for cls in (A, B):
+            self.assertTrue(cls.__dict__['__init__']._pyjo_stub)
+            self.assertTrue(cls.__dict__['from_dict'].__func__._pyjo_stub)
+
+        b = B.from_dict({'foo': 'x', 'bar': 1})
+        self.assertEqual(b.to_dict(), {'foo': 'x', 'bar': 1})
+        self.assertFalse(hasattr(B.__dict__['__init__'], '_pyjo_stub'))
+        self.assertFalse(hasattr(B.__dict__['from_dict'].__func__, '_pyjo_stub'))
+        self.assertTrue(A.__dict__['__init__']._pyjo_stub)
+
+        # a subclass calling the method of a parent not compiled yet
+        class C(A):
+            def to_dict(self):
+                return dict(super(C, self).to_dict(), kind='c')
+
+        self.assertEqual(C(foo='y').to_dict(), {'foo': 'y', 'kind': 'c'})
+        self.assertFalse(hasattr(A.__dict__['to_dict'], '_pyjo_stub'))
+
+    def test_same_output_as_generic(self):
+        data = {
+            'name': 'john',
+            'age': 30,
+            'code': 'IT',
+            'color': 'blue',
+            'created': 1478390400,
+            'address': {'city': 'NYC', 'zip': '10001'},
+            'tags': ['a', 'b'],
+            'scores': {'x': 1},
+            'extra': {'any': [1, 2]},
+            'unknown': 1,
+        }
+        u = User.from_dict(data)
+        g = generic_from_dict(User, data)
+        self.assertEqual(u.to_dict(), generic['to_dict'](g))
+        self.assertEqual(u.to_dict(), generic['to_dict'](u))
+        self.assertEqual(list(u._data), list(g._data))
+        self.assertEqual(u.created, datetime.utcfromtimestamp(1478390400))
+        self.assertEqual(u.color, Color.blue)
+        self.assertEqual(u.address.zip, 10001)
+        self.assertEqual(u.counter, 7)
+        self.assertEqual(repr(u), '<User(name=john)>')
+
+        self.assertEqual(User(name='x', age=20).to_dict(), generic_init(User, name='x', age=20).to_dict())
+        self.assertEqual(User(name='x').to_dict(), {'name': 'x', 'flag': False, 'counter': 7})
+
+    def test_same_errors_as_generic(self):
+        cases = [
+            {},
+            {'name': 1},
+            {'name': 'john', 'age': 10},
+            {'name': 'john', 'code': 'it'},
+            {'name': 'john', 'address': {'zip': 1}},
+            {'name': 'john', 'tags': [1]},
+            {'age': 'old'},
+            # several errors: the values are all decoded (lists and maps validated at once) before the others are
+            # validated
+            {'name': 'john', 'age': 500, 'color': 'green'},
+            {'name': 1, 'address': {'zip': 1}},
+            {'name': 'john', 'tags': [1], 'color': 'green'},
+            {'name': 1, 'addresses': [{'zip': 1}]},
+            {'age': 500, 'tags': [1]},
+            {'tags': [1], 'scores': {'a': 'b'}},
+            {'scores': {'a': 'b'}, 'addresses': [{'city': 1}], 'created': 'now'},
+        ]
+        for data in cases:
+            self.assertSameError(lambda: User.from_dict(data), lambda: generic_from_dict(User, data))
+            self.assertSameError(lambda: User(**data), lambda: generic_init(User, **data))
+        self.assertSameError(lambda: User.from_dict([]), lambda: generic_from_dict(User, []))
+        with self.assertRaises(FieldTypeError) as e:
+            User.from_dict({'age': 500, 'tags': [1]})
+        self.assertEqual(e.exception.field_name, 'tags')
+
+    def test_non_fields_kwargs(self):
+        class A(Model):
+            foo = Field(type=str)
+
+        a = A(foo='x', bar=1)
+        self.assertEqual(a.bar, 1)
+        a = A.from_dict({'foo': 'x', 'bar': 1}, discard_non_fields=False)
+        self.assertEqual(a.bar, 1)
+
+    def test_validator_error_message(self):
+        def validator(x):
+            raise ValidationError('too short')
+
+        class A(Model):
+            foo = Field(validator=validator)
+
+        with self.assertRaises(ValidationError) as e:
+            A(foo='x')
+        self.assertEqual(e.exception.message, 'foo did not pass the validation: too short')
+        self.assertEqual(e.exception.field_name, 'foo')
+
+    def test_overridden_methods_are_kept(self):
+        class A(Model):
+            foo = Field(type=str)
+
+            def to_dict(self):
+                res = super(A, self).to_dict()
+                res['kind'] = 'a'
+                return res
+
+        class B(A):
+            bar = Field(type=int)
+
+        self.assertNotIn('to_dict', B.__dict__)
+        self.assertEqual(B(foo='x', bar=1).to_dict(), {'foo': 'x', 'bar': 1, 'kind': 'a'})
+
+        class C(Model):
+            foo = Field(type=str)
+
+        class D(C):
+            bar = Field(type=int)
+
+            def __init__(self, **kwargs):
+                super(D, self).__init__(**kwargs)
+                self.initialized = True
+
+        d = D.from_dict({'foo': 'x', 'bar': 1})
+        self.assertTrue(d.initialized)
+        self.assertEqual(d.to_dict(), {'foo': 'x', 'bar': 1})
+
+    def test_custom_field(self):
+        calls = []
+
+        class UpperField(Field):
+            def __set__(self, instance, value):
+                calls.append(value)
+                super(UpperField, self).__set__(instance, value.upper() if value else value)
+
+        class A(Model):
+            foo = UpperField(type=str)
+
+        a = A.from_dict({'foo': 'x'})
+        self.assertEqual(a.foo, 'X')
+        self.assertEqual(calls, ['x'])
+
+    def test_shadowed_field(self):
+        class A(Model):
+            foo = Field(type=str)
+
+        class B(A):
+            foo = 'shadow'
+
+        b = B(foo=1)
+        self.assertEqual(b.foo, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+from datetime import datetime
+from enum import Enum
+
+from pyjo import Model, Field, RangeField, EnumField, DatetimeField, ListField
+from pyjo.exceptions import RequiredFieldError, ValidationError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Color(Enum):
+    red = 1
+    blue = 2
+
+
+class Address(Model):
+    city = Field(type=str)
+    zip = Field(type=int)
+
+
+class User(Model):
+    name = Field(type=str, required=True)
+    age = RangeField(min=0, max=120)
+    score = Field(type=float)
+    active = Field(type=bool)
+    color = EnumField(Color)
+    created = DatetimeField()
+    address = Field(type=Address)
+    tags = ListField(Field(type=str))
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class ColumnarTest(unittest.TestCase):
+
+    def users(self):
+        return [
+            User(name='a', age=30, score=1.5, active=True, color=Color.blue,
+                 created=datetime(2020, 1, 1), address=Address(city='NYC', zip=10001), tags=['x']),
+            User(name='b'),
+        ]
+
+    def test_to_columns(self):
+        columns = User.to_columns(self.users())
+        self.assertEqual(sorted(columns), ['active', 'address.city', 'address.zip', 'age', 'color', 'created',
+                                           'name', 'score', 'tags'])
+        self.assertEqual(columns['age'].dtype, numpy.int64)
+        self.assertEqual(columns['age'].tolist(), [30, None])
+        self.assertEqual(columns['score'].dtype, numpy.float64)
+        self.assertEqual(columns['active'].dtype, numpy.bool_)
+        self.assertEqual(columns['created'].dtype, numpy.dtype('datetime64[s]'))
+        self.assertTrue(numpy.isnat(columns['created'][1]))
+        self.assertEqual(columns['color'].tolist(), [1, -1])
+        self.assertEqual(columns.categories['color'], [Color.red, Color.blue])
+        self.assertEqual(columns['name'].dtype, object)
+        self.assertEqual(columns['tags'].tolist(), [['x'], None])
+        self.assertEqual(columns['address.zip'].tolist(), [10001, None])
+
+    def test_roundtrip(self):
+        users = self.users()
+        res = User.from_columns(User.to_columns(users))
+        self.assertEqual(User.to_dicts(res), User.to_dicts(users))
+        self.assertIsNone(res[1].address)
+        self.assertEqual(res[0].created, datetime(2020, 1, 1))
+        self.assertEqual(User.from_columns({}), [])
+
+    def test_vectorized_validation(self):
+        columns = {'name': numpy.array(['a', 'b', 'c'], dtype=object), 'age': numpy.array([1, 200, 300])}
+        with self.assertRaises(ValidationError) as e:
+            User.from_columns(columns)
+        self.assertEqual(e.exception.index, 1)
+
+        columns = {'name': numpy.array(['a', None], dtype=object)}
+        with self.assertRaises(RequiredFieldError) as e:
+            User.from_columns(columns)
+        self.assertEqual(e.exception.index, 1)
+
+        columns = {'name': numpy.array(['a'], dtype=object), 'color': numpy.array([5])}
+        with self.assertRaises(ValidationError):
+            User.from_columns(columns)
+
+        with self.assertRaises(ValueError):
+            User.from_columns({'name': numpy.array(['a'], dtype=object), 'age': numpy.array([1, 2])})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+import copy
+import pickle
+import unittest
+from datetime import datetime
+from enum import Enum
+
+from six import u
+
+from pyjo import Model, Field, ListField, MapField, DatetimeField, EnumField, ArrayField, binary
+
+
+class Color(Enum):
+    red = 1
+    blue = 2
+
+
+class Point(Model):
+    x = Field(type=int)
+    y = Field(type=int)
+
+
+class Shape(Model):
+    name = Field(type=str)
+    area = Field(type=float)
+    created = DatetimeField()
+    color = EnumField(Color)
+    center = Field(type=Point)
+    points = ListField(Field(type=Point))
+    tags = MapField(Field(type=str))
+    weights = ArrayField('d')
+    extra = Field()
+
+
+class SlotShape(Shape):
+    _slots = True
+
+
+class OtherShape(Model):
+    name = Field(type=str)
+
+
+class CachedPoint(Point):
+    _cache_serialization = True
+
+
+class CachedPath(Model):
+    _cache_serialization = True
+
+    name = Field(type=str)
+    points = ListField(Field(type=CachedPoint))
+
+
+class ContentHashTest(unittest.TestCase):
+
+    def shape(self, **kwargs):
+        values = dict(name=u('shäpe'), created=datetime(2020, 1, 2), color=Color.blue, center=Point(x=1, y=-1),
+                      points=[Point(x=200), Point()], tags={'a': 'b', 'c': 'd'}, weights=[1.0, 2.5],
+                      extra={'any': [1, None], 'other': 2})
+        values.update(kwargs)
+        return Shape(**values)
+
+    def test_content_hash(self):
+        shape = self.shape()
+        self.assertEqual(len(shape.content_hash()), binary.CONTENT_HASH_SIZE)
+        self.assertEqual(shape.content_hash(), self.shape().content_hash())
+        self.assertEqual(shape.content_hash(), pickle.loads(pickle.dumps(shape)).content_hash())
+        self.assertEqual(shape.content_hash(), Shape.from_json(shape.to_json()).content_hash())
+        # maps and JSON values are hashed whatever the order of their keys
+        self.assertEqual(shape.content_hash(), self.shape(tags={'c': 'd', 'a': 'b'},
+                                                          extra={'other': 2, 'any': [1, None]}).content_hash())
+        for other in (self.shape(name='shape'), self.shape(center=Point(x=1)), self.shape(points=[Point(x=200)]),
+                      self.shape(color=Color.red), self.shape(weights=[2.5, 1.0]), self.shape(extra=None)):
+            self.assertNotEqual(shape.content_hash(), other.content_hash())
+        # the hash covers the schema of the class, not its name
+        self.assertNotEqual(OtherShape(name='a').content_hash(), Shape(name='a').content_hash())
+
+        shape.center.x = 2
+        self.assertNotEqual(shape.content_hash(), self.shape().content_hash())
+
+    def test_eq(self):
+        self.assertEqual(self.shape(), self.shape())
+        self.assertNotEqual(self.shape(), self.shape(name='shape'))
+        self.assertFalse(self.shape() != self.shape())
+        self.assertNotEqual(OtherShape(name='a'), Shape(name='a'))
+        self.assertNotEqual(Point(), None)
+        shapes = [self.shape(), self.shape(), self.shape(name='shape')]
+        self.assertIn(self.shape(), shapes)
+        self.assertEqual(len({shape.content_hash() for shape in shapes}), 2)
+
+        # values without binary encoding are compared as they are
+        value = object()
+        self.assertEqual(Shape(extra=value), Shape(extra=value))
+        self.assertNotEqual(Shape(extra=object()), Shape(extra=1))
+        with self.assertRaises(TypeError):
+            Shape(extra=object()).content_hash()
+
+    def test_hash(self):
+        # models are mutable and compared on their content: they are not hashable
+        with self.assertRaises(TypeError):
+            hash(self.shape())
+        with self.assertRaises(TypeError):
+            set([self.shape()])
+
+    def test_zeros(self):
+        # equal floats are hashed the same
+        for zero, negative in ((dict(area=0.0), dict(area=-0.0)), (dict(weights=[0.0]), dict(weights=[-0.0])),
+                               (dict(extra={'a': [0.0]}), dict(extra={'a': [-0.0]}))):
+            self.assertEqual(self.shape(**zero).content_hash(), self.shape(**negative).content_hash())
+            self.assertEqual(self.shape(**zero), self.shape(**negative))
+        self.assertEqual(Shape(weights=[-0.0, 1.0]).weights.tolist(), [-0.0, 1.0])
+        self.assertEqual(str(Shape.from_bytes(Shape(area=-0.0).to_bytes()).area), '-0.0')
+
+    def test_memoized(self):
+        for cls in (Shape, SlotShape):
+            shape = cls(name='a', center=Point(x=1), points=[Point(x=2)], tags={'a': 'b'})
+            digest = shape.content_hash()
+            if cls is Shape:
+                self.assertIs(shape.content_hash(), digest)
+            shape.name = 'b'
+            self.assertNotEqual(shape.content_hash(), digest)
+            del shape.name
+            self.assertEqual(shape.content_hash(), cls(center=Point(x=1), points=[Point(x=2)],
+                                                       tags={'a': 'b'}).content_hash())
+            # changes of nested models and containers
+            for change in (lambda: setattr(shape.center, 'x', 3), lambda: shape.points.append(Point()),
+                           lambda: setattr(shape.points[0], 'y', 1), lambda: shape.tags.update(c='d')):
+                digest = shape.content_hash()
+                change()
+                self.assertNotEqual(shape.content_hash(), digest)
+            self.assertEqual(shape.content_hash(), cls.from_dict(shape.to_dict()).content_hash())
+
+    def test_cached(self):
+        path = CachedPath(name='a', points=[CachedPoint(x=1)])
+        digest = path.content_hash()
+        self.assertIs(path.content_hash(), digest)
+        path.points[0].x = 2
+        self.assertNotEqual(path.content_hash(), digest)
+        path.points.append(CachedPoint())
+        self.assertEqual(path, CachedPath(name='a', points=[CachedPoint(x=2), CachedPoint()]))
+        del path.points[1]
+        self.assertEqual(path, CachedPath(name='a', points=[CachedPoint(x=2)]))
+
+        # equal models are distinct parents of a shared nested model
+        point = CachedPoint(x=1)
+        first, second = CachedPath(points=[point]), CachedPath(points=[point])
+        first.content_hash()
+        second.content_hash()
+        point.x = 3
+        self.assertEqual(second.content_hash(), CachedPath(points=[CachedPoint(x=3)]).content_hash())
+
+        other = copy.deepcopy(path)
+        other.name = 'b'
+        self.assertNotEqual(other, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import array
+import unittest
+
+from pyjo import Model, ArrayField
+from pyjo.exceptions import FieldTypeError, RequiredFieldError, ValidationError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ArrayFieldTest(unittest.TestCase):
+
+    def test_array_field(self):
+        class A(Model):
+            samples = ArrayField('d', required=True)
+            counts = ArrayField('q', min=0, max=100)
+
+        values = array.array('d', [1.5, 2.5])
+        a = A(samples=values, counts=[1, 2, 3])
+        self.assertIs(a.samples, values)
+        self.assertEqual(a.counts, array.array('q', [1, 2, 3]))
+        self.assertEqual(a.to_dict(), {'samples': [1.5, 2.5], 'counts': [1, 2, 3]})
+
+        b = A.from_dict(a.to_dict())
+        self.assertEqual(b.samples, values)
+        self.assertEqual(b.counts.typecode, 'q')
+
+        # other buffers are copied
+        buffer = array.array('d', [3.0])
+        a.samples = memoryview(buffer)
+        buffer[0] = 4.0
+        self.assertEqual(a.samples, array.array('d', [3.0]))
+        a.samples = A.samples.to_buffer(values).tobytes()
+        self.assertEqual(a.samples, values)
+        a.counts = []
+        self.assertEqual(a.counts, array.array('q'))
+
+        with self.assertRaises(ValidationError):
+            a.counts = [1, 101]
+        with self.assertRaises(ValidationError):
+            a.counts = array.array('q', [-1])
+        with self.assertRaises(FieldTypeError):
+            a.counts = [1.5]
+        with self.assertRaises(FieldTypeError):
+            a.samples = ['x']
+        with self.assertRaises(FieldTypeError):
+            a.samples = 1
+        with self.assertRaises(RequiredFieldError):
+            a.samples = None
+
+    def test_invalid_typecode(self):
+        with self.assertRaises(TypeError):
+            ArrayField('u')
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_ndarray(self):
+        class A(Model):
+            samples = ArrayField('d', ndarray=True, min=0)
+
+        values = numpy.arange(5, dtype='float64')
+        a = A(samples=values)
+        self.assertIs(a.samples, values)
+        self.assertEqual(a.to_dict(), {'samples': [0.0, 1.0, 2.0, 3.0, 4.0]})
+
+        # buffers are wrapped without copying
+        buffer = array.array('d', [1.0, 2.0])
+        a.samples = buffer
+        buffer[0] = 5.0
+        self.assertEqual(a.samples.tolist(), [5.0, 2.0])
+
+        a.samples = [1, 2]
+        self.assertEqual(a.samples.dtype, numpy.float64)
+        with self.assertRaises(ValidationError):
+            a.samples = numpy.array([1.0, -1.0])
+
+        # numpy arrays are read as machine values in array mode
+        class B(Model):
+            samples = ArrayField('d')
+
+        self.assertEqual(B(samples=values).samples, array.array('d', range(5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
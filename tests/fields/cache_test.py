@@ -0,0 +1,77 @@
+import unittest
+
+from pyjo import Model, Field, RangeField, RegexField, ListField
+from pyjo.exceptions import FieldTypeError, ValidationError
+
+
+class CacheTest(unittest.TestCase):
+
+    def test_cache(self):
+        calls = []
+
+        def validator(x):
+            calls.append(x)
+            return x != 'xx'
+
+        class A(Model):
+            status = Field(type=str, validator=validator, cast=str.lower, cache=2)
+            country = RegexField('^[A-Z]{2}$', cache=10)
+            age = RangeField(min=0, max=120, cache=10)
+            tags = ListField(Field(type=str), cache=10)
+
+        for _ in range(3):
+            a = A(status='OPEN', country='IT', age=30, tags=['a'])
+            self.assertEqual(a.status, 'open')
+        A.from_dict({'status': 'Open'})
+        self.assertEqual(calls, ['open', 'open'])
+        self.assertEqual(A.status.cache_info(), (2, 2, 2, 2))
+        self.assertEqual(A.country.cache_info(), (2, 1, 10, 1))
+        self.assertEqual(A.tags.cache_info(), (0, 0, 10, 0))  # lists are not hashable
+
+        # least recently used values are evicted
+        a.status = 'closed'
+        a.status = 'OPEN'
+        self.assertEqual(calls, ['open', 'open', 'closed', 'open'])
+        self.assertEqual(A.status.cache_info().currsize, 2)
+
+        # errors are not cached
+        for _ in range(2):
+            with self.assertRaises(ValidationError):
+                a.status = 'XX'
+            with self.assertRaises(ValidationError):
+                a.age = 130
+        self.assertEqual(calls.count('xx'), 2)
+
+        # values of different types are cached separately
+        with self.assertRaises(FieldTypeError):
+            a.age = 30.0
+        a.age = None
+        self.assertIsNone(a.age)
+
+        A.status.cache_clear()
+        self.assertEqual(A.status.cache_info(), (0, 0, 2, 0))
+        self.assertIsNone(Field().cache_info())
+
+    def test_mutable_results_are_not_cached(self):
+        class A(Model):
+            tags = Field(type=list, cast=lambda value: value.split(','), cache=10)
+            pair = Field(type=tuple, cast=tuple, cache=10)
+
+        a, b = A(tags='a,b', pair='ab'), A(tags='a,b', pair='ab')
+        a.tags.append('c')
+        self.assertEqual(b.tags, ['a', 'b'])
+        self.assertEqual(A.tags.cache_info(), (0, 2, 10, 0))
+        self.assertIs(a.pair, b.pair)
+        self.assertEqual(A.pair.cache_info(), (1, 1, 10, 1))
+
+    def test_invalid_cache(self):
+        for value in (0, -1, 'a', True):
+            with self.assertRaises(TypeError):
+                Field(cache=value)
+
+    def test_regex_is_compiled(self):
+        self.assertEqual(RegexField('^a+$').pattern.pattern, '^a+$')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+import copy
+import json
+import pickle
+import unittest
+
+from pyjo import Model, Field, ListField, MapField, RangeField, ValidatedList, ValidatedDict
+from pyjo.exceptions import FieldTypeError, ValidationError
+
+
+class B(Model):
+    n = Field(type=int)
+
+
+class A(Model):
+    numbers = ListField(RangeField(min=0, max=10))
+    scores = MapField(Field(type=int, cast=int))
+    items = ListField(Field(type=B))
+
+
+class SlotA(A):
+    _slots = True
+
+
+class Nested(Model):
+    matrix = ListField(MapField(RangeField(min=0, max=10)))
+
+
+class ContainersTest(unittest.TestCase):
+
+    def test_validated_list(self):
+        a = A(numbers=[1, 2])
+        self.assertIsInstance(a.numbers, ValidatedList)
+        self.assertIsInstance(a.numbers, list)
+
+        a.numbers.append(3)
+        a.numbers.insert(0, 0)
+        a.numbers.extend([4, 5])
+        a.numbers += [6]
+        a.numbers[0] = 7
+        a.numbers[1:3] = [8, 9]
+        self.assertEqual(a.numbers, [7, 8, 9, 3, 4, 5, 6])
+
+        for op in (lambda: a.numbers.append(11), lambda: a.numbers.insert(0, -1),
+                   lambda: a.numbers.extend([1, 11]), lambda: a.numbers.__iadd__([11]),
+                   lambda: a.numbers.__setitem__(0, 11), lambda: a.numbers.__setitem__(slice(0, 1), [11])):
+            with self.assertRaises(ValidationError):
+                op()
+        with self.assertRaises(FieldTypeError):
+            a.numbers.append('1')
+        self.assertEqual(a.numbers, [7, 8, 9, 3, 4, 5, 6])
+
+        self.assertEqual(a.to_dict()['numbers'], [7, 8, 9, 3, 4, 5, 6])
+        self.assertEqual(json.dumps(a.numbers), '[7, 8, 9, 3, 4, 5, 6]')
+
+        a.items = [B(n=1)]
+        a.items.append(B(n=2))
+        with self.assertRaises(FieldTypeError):
+            a.items.append({'n': 3})
+        self.assertEqual(a.to_dict()['items'], [{'n': 1}, {'n': 2}])
+
+    def test_validated_dict(self):
+        a = A(scores={'a': '1'})
+        self.assertIsInstance(a.scores, ValidatedDict)
+        self.assertEqual(a.scores, {'a': 1})
+
+        a.scores['b'] = '2'
+        a.scores.update({'c': 3}, d='4')
+        self.assertEqual(a.scores.setdefault('e', '5'), 5)
+        self.assertEqual(a.scores.setdefault('e', '6'), 5)
+        a.scores |= {'f': 6}
+        self.assertEqual(a.scores, {'a': 1, 'b': 2, 'c': 3, 'd': 4, 'e': 5, 'f': 6})
+
+        with self.assertRaises(ValueError):
+            a.scores['g'] = 'x'
+        with self.assertRaises(ValueError):
+            a.scores.update(g='x')
+        self.assertNotIn('g', a.scores)
+        self.assertEqual(json.loads(json.dumps(a.scores)), a.scores)
+
+    def test_elements_are_validated_once(self):
+        calls = []
+
+        def validator(x):
+            calls.append(x)
+            return True
+
+        class C(Model):
+            numbers = ListField(Field(type=int, validator=validator))
+
+        c = C(numbers=[1, 2])
+        c.numbers.append(3)
+        self.assertEqual(calls, [1, 2, 3])
+
+        # assigning a list validated by the same field copies it without validating it again
+        d = C(numbers=c.numbers)
+        self.assertEqual(calls, [1, 2, 3])
+        self.assertIsNot(d.numbers, c.numbers)
+        self.assertEqual(d.numbers, [1, 2, 3])
+
+        e = C.from_dict({'numbers': [4]}, trusted=True)
+        self.assertIsInstance(e.numbers, ValidatedList)
+        e.numbers.append(5)
+        self.assertEqual(calls, [1, 2, 3, 5])
+
+    def test_fused_decoding(self):
+        calls = []
+
+        def validator(x):
+            calls.append(x)
+            return x >= 0
+
+        class C(Model):
+            matrix = ListField(MapField(Field(type=int, validator=validator)))
+            names = MapField(ListField(Field(type=str)))
+
+        data = {'matrix': [{'a': 1}, {'b': 2, 'c': 3}], 'names': {'x': ['a', 'b']}}
+        c = C.from_dict(data)
+        self.assertEqual(c.to_dict(), data)
+        self.assertEqual(calls, [1, 2, 3])
+        self.assertIsInstance(c.matrix, ValidatedList)
+        self.assertIsInstance(c.matrix[1], ValidatedDict)
+        self.assertIsInstance(c.names['x'], ValidatedList)
+        c.matrix[0]['d'] = 4
+        c.names['x'].append('c')
+        with self.assertRaises(ValidationError):
+            c.matrix[1]['e'] = -1
+        with self.assertRaises(FieldTypeError):
+            c.names['x'].append(1)
+
+        for invalid in ({'matrix': [{'a': -1}]}, {'matrix': [{'a': 'x'}]}, {'matrix': [1]}, {'matrix': {'a': 1}},
+                        {'names': {'x': [1]}}, {'names': ['a']}):
+            with self.assertRaises(Exception) as fused:
+                C.from_dict(invalid)
+            with self.assertRaises(Exception) as generic:
+                C(**{k: C._fields[k].from_dict(v) for k, v in invalid.items()})
+            self.assertEqual(type(fused.exception), type(generic.exception))
+            self.assertEqual(str(fused.exception), str(generic.exception))
+
+    def test_copy_and_pickle(self):
+        a = A(numbers=[1], scores={'a': 1})
+        b = copy.deepcopy(a)
+        self.assertIsInstance(b.numbers, ValidatedList)
+        with self.assertRaises(ValidationError):
+            b.numbers.append(11)
+        self.assertIsInstance(copy.copy(a.scores), ValidatedDict)
+
+        self.assertIs(type(pickle.loads(pickle.dumps(a.numbers))), list)
+        self.assertIs(type(pickle.loads(pickle.dumps(a.scores))), dict)
+
+    def test_pickled_model(self):
+        for cls in (A, SlotA):
+            a = cls(numbers=[1], scores={'a': 1}, items=[B(n=1)])
+            for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+                b = pickle.loads(pickle.dumps(a, protocol))
+                self.assertEqual(b.to_dict(), a.to_dict())
+                self.assertIsInstance(b.numbers, ValidatedList)
+                self.assertIsInstance(b.scores, ValidatedDict)
+                with self.assertRaises(ValidationError):
+                    b.numbers.append(11)
+                with self.assertRaises(FieldTypeError):
+                    b.items.append(1)
+                b.scores['b'] = '2'
+                self.assertEqual(b.scores, {'a': 1, 'b': 2})
+
+        nested = pickle.loads(pickle.dumps(Nested(matrix=[{'a': 1}]), 2))
+        self.assertIsInstance(nested.matrix[0], ValidatedDict)
+        with self.assertRaises(ValidationError):
+            nested.matrix[0]['b'] = 11
+        with self.assertRaises(FieldTypeError):
+            nested.matrix.append(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
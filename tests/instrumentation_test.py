@@ -0,0 +1,101 @@
+import unittest
+
+import pyjo
+from pyjo import Model, Field, ListField, RangeField
+from pyjo.exceptions import ValidationError
+
+
+class B(Model):
+    n = RangeField(min=0, max=10)
+
+
+class A(Model):
+    foo = Field(type=str, required=True)
+    items = ListField(Field(type=B))
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def tearDown(self):
+        pyjo.disable_stats()
+        pyjo.reset_stats()
+
+    def test_stats(self):
+        events = []
+        pyjo.enable_stats(callback=lambda *args: events.append(args))
+        self.assertTrue(pyjo.stats_enabled())
+        self.assertNotIn('to_dict', A.__dict__)
+
+        a = A.from_dict({'foo': 'x', 'items': [{'n': 1}, {'n': 2}]})
+        self.assertEqual(a.to_dict(), {'foo': 'x', 'items': [{'n': 1}, {'n': 2}]})
+        with self.assertRaises(ValidationError):
+            B(n=11)
+
+        stats = pyjo.stats()
+        self.assertEqual(stats[('A', None, 'from_dict')]['calls'], 1)
+        self.assertEqual(stats[('A', 'items', 'from_dict')]['calls'], 1)
+        self.assertEqual(stats[('A', 'foo', 'validate')]['calls'], 1)
+        self.assertEqual(stats[('B', None, 'init')]['calls'], 3)
+        self.assertEqual(stats[('B', None, 'init')]['failures'], 1)
+        self.assertEqual(stats[('B', 'n', 'validate')]['calls'], 3)
+        self.assertEqual(stats[('B', 'n', 'validate')]['failures'], 1)
+        self.assertEqual(stats[('B', 'n', 'to_dict')]['calls'], 2)
+        # elements of lists, checked by the inner field
+        self.assertEqual(stats[(None, 'items inner field', 'validate')]['calls'], 2)
+        self.assertGreater(stats[('A', None, 'from_dict')]['time'], 0)
+        self.assertEqual(len(events), sum(s['calls'] for s in stats.values()))
+        self.assertIn(('B', 'n', 'validate'), [event[:3] for event in events if event[4]])
+
+        self.assertEqual(pyjo.stats(reset=True), stats)
+        self.assertEqual(pyjo.stats(), {})
+
+    def test_containers(self):
+        class C(Model):
+            matrix = ListField(ListField(RangeField(min=0, max=10)))
+
+        pyjo.enable_stats()
+        c = C.from_dict({'matrix': [[1, 2], [3]]})
+        c.matrix[0].append(4)
+        with self.assertRaises(ValidationError):
+            c.matrix[1].append(11)
+        stats = pyjo.stats()
+        self.assertEqual(stats[(None, 'matrix inner field', 'validate')]['calls'], 2)
+        self.assertEqual(stats[(None, 'matrix inner field inner field', 'validate')]['calls'], 5)
+        self.assertEqual(stats[(None, 'matrix inner field inner field', 'validate')]['failures'], 1)
+
+    def test_arguments(self):
+        pyjo.enable_stats()
+        for kwargs in ({'lazy': True}, {'trusted': True}, {}):
+            a = A.from_dict({'foo': 'x', 'items': [{'n': 1}]}, **kwargs)
+            self.assertEqual(a.items[0].n, 1)
+        # the arguments are passed through
+        originals = pyjo.instrumentation._originals
+        generic = originals['from_dict']
+        calls = []
+        originals['from_dict'] = lambda *args, **kwargs: calls.append(kwargs) or generic(*args, **kwargs)
+        try:
+            A.from_dict({'foo': 'x'}, lazy=True)
+        finally:
+            originals['from_dict'] = generic
+        self.assertEqual(calls, [{'discard_non_fields': True, 'lazy': True, 'trusted': False}])
+        self.assertEqual(pyjo.stats()[('A', None, 'from_dict')]['calls'], 4)
+
+    def test_disable(self):
+        pyjo.enable_stats()
+
+        class C(Model):
+            foo = Field(type=str)
+
+        self.assertNotIn('__init__', C.__dict__)
+        pyjo.disable_stats()
+        self.assertFalse(pyjo.stats_enabled())
+        for cls in (A, B, C):
+            self.assertTrue(cls.__dict__['__init__']._pyjo_generated)
+            self.assertTrue(cls.__dict__['to_dict']._pyjo_generated)
+        self.assertEqual(C(foo='x').to_dict(), {'foo': 'x'})
+        self.assertEqual(pyjo.stats(), {})
+        self.assertEqual(Field.__dict__['cast_and_validate'].__module__, 'pyjo.fields.field')
+
+
+if __name__ == '__main__':
+    unittest.main()
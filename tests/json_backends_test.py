@@ -0,0 +1,104 @@
+import io
+import json
+import unittest
+from datetime import datetime
+from enum import Enum
+
+from pyjo import Model, Field, DatetimeField, EnumField, register_json_backend, set_json_backend, get_json_backend
+from pyjo.json_backends import _backends
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class Color(Enum):
+    red = 1
+
+
+class A(Model):
+    foo = Field(type=str)
+    date = DatetimeField()
+    color = EnumField(Color)
+
+
+DATA = {'foo': u'café', 'date': 1478390400, 'color': 'red'}
+
+
+class JsonBackendsTest(unittest.TestCase):
+
+    def tearDown(self):
+        set_json_backend('json')
+
+    def test_default_backend(self):
+        a = A.from_dict(DATA)
+        self.assertEqual(get_json_backend().name, 'json')
+        self.assertEqual(A.from_json(a.to_json()).to_dict(), DATA)
+        self.assertIsInstance(a.to_json_bytes(), bytes)
+        self.assertEqual(a.to_json_bytes(), a.to_json().encode('utf-8'))
+        self.assertEqual(A.from_json_bytes(a.to_json_bytes()).date, datetime.utcfromtimestamp(1478390400))
+
+    def test_custom_backend(self):
+        calls = []
+
+        def dumps(obj, indent):
+            calls.append('dumps')
+            return b'{"foo": "custom"}'
+
+        def loads(value):
+            calls.append('loads')
+            return {'foo': 'custom'}
+
+        register_json_backend('custom', dumps, loads)
+        try:
+            class B(A):
+                _json_backend = 'custom'
+
+            self.assertEqual(B().to_json(), '{"foo": "custom"}')
+            self.assertEqual(B.from_json_bytes(b'{}').foo, 'custom')
+            self.assertEqual(calls, ['dumps', 'loads'])
+            # other models use the global backend
+            self.assertEqual(A(foo='a').to_json(), '{"foo": "a"}')
+
+            set_json_backend('custom')
+            self.assertEqual(A.from_json('{}').foo, 'custom')
+        finally:
+            del _backends['custom']
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            set_json_backend('unknown')
+
+    def test_auto(self):
+        backend = set_json_backend('auto')
+        self.assertIn(backend.name, _backends)
+        a = A.from_dict(DATA)
+        self.assertEqual(A.from_json_bytes(a.to_json_bytes()).to_dict(), DATA)
+        self.assertEqual(A.from_json(a.to_json(indent=2)).to_dict(), DATA)
+        self.assertEqual(A.to_dicts(A.from_json_many(A.to_json_many([a, a]))), [DATA, DATA])
+
+        out = io.BytesIO()
+        A.dump_jsonl([a, a], out)
+        self.assertEqual(A.to_dicts(A.iter_jsonl(io.BytesIO(out.getvalue()))), [DATA, DATA])
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    def test_orjson_fallback(self):
+        # values orjson can't serialize are written as json does
+        backend = get_json_backend('orjson')
+        for value in ({1: 'a', None: 2}, {'a': 2 ** 70, 'b': -2 ** 64}, [1, {2: {'c': 10 ** 30}}]):
+            self.assertEqual(json.loads(backend.dumps(value)), json.loads(json.dumps(value)))
+        self.assertEqual(backend.dumps({'a': 2 ** 70}, indent=2), '{\n  "a": 1180591620717411303424\n}')
+        with self.assertRaises(TypeError):
+            backend.dumps({'a': object()})
+
+    def test_same_values_for_all_backends(self):
+        a = A.from_dict(DATA)
+        for name in _backends:
+            backend = set_json_backend(name)
+            self.assertEqual(get_json_backend('json').loads(a.to_json()), DATA, name)
+            self.assertEqual(A.from_json(backend.dumps_bytes(DATA)).to_dict(), DATA, name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from pyjo import Model, Field, ListField, MapField, RangeField, ValidatedList
+from pyjo.exceptions import FieldTypeError, ValidationError
+from pyjo.fields.field import LazyValue
+
+
+class C(Model):
+    n = RangeField(min=0, max=10)
+
+
+class B(Model):
+    c = Field(type=C)
+    label = Field(type=str, default='b')
+
+
+class A(Model):
+    foo = Field(type=str)
+    b = Field(type=B)
+    items = ListField(Field(type=C))
+    tags = MapField(Field(type=int))
+
+
+class SlotA(Model):
+    _slots = True
+    b = Field(type=B)
+    items = ListField(Field(type=int))
+
+
+DATA = {'foo': 'x', 'b': {'c': {'n': 1}, 'other': 1}, 'items': [{'n': 2}], 'tags': {'t': 1}}
+
+
+class LazyTest(unittest.TestCase):
+
+    def test_decoded_on_access(self):
+        a = A.from_dict(DATA, lazy=True)
+        self.assertIsInstance(a._data['b'], LazyValue)
+        self.assertIsInstance(a._data['items'], LazyValue)
+        self.assertEqual(a.foo, 'x')
+
+        self.assertEqual(a.items[0].n, 2)
+        self.assertIsInstance(a._data['items'], ValidatedList)
+
+        b = a.b
+        self.assertIsInstance(b, B)
+        self.assertIs(a.b, b)
+        # nested models are lazy too
+        self.assertIsInstance(b._data['c'], LazyValue)
+        self.assertEqual(b.c.n, 1)
+        self.assertEqual(b.label, 'b')
+
+    def test_to_dict_passes_raw_values(self):
+        a = A.from_json('{"foo": "x", "b": {"other": 1}, "tags": {"t": 1}}', lazy=True)
+        self.assertEqual(a.to_dict(), {'foo': 'x', 'b': {'other': 1}, 'tags': {'t': 1}})
+        a.b
+        self.assertEqual(a.to_dict(), {'foo': 'x', 'b': {'label': 'b'}, 'tags': {'t': 1}})
+
+    def test_validation_on_access(self):
+        a = A.from_dict({'b': {'c': {'n': 11}}, 'tags': {'t': 'x'}}, lazy=True)
+        with self.assertRaises(FieldTypeError):
+            a.tags
+        b = a.b
+        with self.assertRaises(ValidationError):
+            b.c
+
+    def test_slots(self):
+        a = SlotA.from_dict({'b': {'c': {'n': 1}}, 'items': [1, 2]}, lazy=True)
+        self.assertEqual(a.to_dict(), {'b': {'c': {'n': 1}}, 'items': [1, 2]})
+        self.assertEqual(a.items, [1, 2])
+        self.assertEqual(a.b.c.n, 1)
+
+    def test_same_result_as_eager(self):
+        self.assertEqual(A.from_dict(DATA, lazy=True).to_dict(), DATA)
+        eager = A.from_dict(DATA)
+        lazy = A.from_dict(DATA, lazy=True)
+        self.assertEqual(lazy.b.to_dict(), eager.b.to_dict())
+        self.assertEqual(A.to_dicts([lazy.items[0]]), A.to_dicts([eager.items[0]]))
+
+
+if __name__ == '__main__':
+    unittest.main()
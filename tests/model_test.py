@@ -278,6 +278,34 @@ class TestModel(unittest.TestCase):
         with self.assertRaises(ValidationError):
             a = A()
 
+    def test_inherited_fields(self):
+        class Base(Model):
+            a = Field(type=str)
+            b = Field(type=str)
+
+        class Left(Base):
+            c = Field(type=int)
+
+        class Right(Base):
+            b = Field(type=int)
+
+        class Mixin(object):
+            d = Field(type=bool)
+
+        class Child(Left, Right, Mixin):
+            e = Field(type=float)
+
+        # the fields of the classes first in the MRO take precedence, as for any attribute
+        self.assertEqual(sorted(Child._fields), ['a', 'b', 'c', 'd', 'e'])
+        self.assertIs(Child._fields['b'], Right.__dict__['b'])
+        self.assertIs(Child._fields['d'], Mixin.__dict__['d'])
+        self.assertEqual(Child._fields['d'].name, 'd')
+        self.assertEqual(list(Left._fields), ['a', 'b', 'c'])
+        self.assertEqual(Child(a='x', b=1, c=2, d=True, e=1.5).to_dict(),
+                         {'a': 'x', 'b': 1, 'c': 2, 'd': True, 'e': 1.5})
+        with self.assertRaises(FieldTypeError):
+            Child(b='x')
+
 
 if __name__ == '__main__':
     unittest.main()
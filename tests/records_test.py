@@ -0,0 +1,112 @@
+import mmap
+import unittest
+from datetime import datetime
+from enum import Enum
+
+from pyjo import Model, Field, RangeField, DatetimeField, EnumField, ListField, records
+from pyjo.exceptions import NotEditableField, ValidationError
+
+
+class Level(Enum):
+    low = 1
+    high = 2
+
+
+class Reading(Model):
+    id = Field(type=int, required=True, repr=True)
+    sensor = RangeField(min=0, max=1000)
+    delta = RangeField(min=-100, max=100)
+    value = Field(type=float)
+    ok = Field(type=bool)
+    level = EnumField(Level)
+    at = DatetimeField()
+
+
+class SlotReading(Reading):
+    _slots = True
+
+
+class Many(Model):
+    a0 = Field(type=int)
+    a1 = Field(type=int)
+    a2 = Field(type=int)
+    a3 = Field(type=int)
+    a4 = Field(type=int)
+    a5 = Field(type=int)
+    a6 = Field(type=int)
+    a7 = Field(type=int)
+    a8 = Field(type=int)
+
+
+class RecordsTest(unittest.TestCase):
+
+    def readings(self, cls=Reading):
+        return [cls(id=i, sensor=i * 100, delta=-i, value=i / 2.0, ok=i % 2 == 0,
+                    level=Level.high if i % 2 else None, at=datetime(2020, 1, 1, 0, 0, i))
+                for i in range(10)]
+
+    def test_layout(self):
+        layout = records.layout(Reading)
+        # bitmap, int64, uint16, int8, double, bool, uint8 ordinal, int64 timestamp
+        self.assertEqual(layout.struct.format, '<BqHbd?Bq')
+        self.assertEqual(layout.size, 1 + 8 + 2 + 1 + 8 + 1 + 1 + 8)
+        self.assertEqual(len(Reading.pack_records(self.readings())), 10 * layout.size)
+
+    def test_views(self):
+        for cls in (Reading, SlotReading):
+            readings = self.readings(cls)
+            views = cls.record_views(cls.pack_records(readings))
+            self.assertEqual(len(views), 10)
+            self.assertEqual([view.to_dict() for view in views], cls.to_dicts(readings))
+            view = views[3]
+            self.assertEqual(view.at, datetime(2020, 1, 1, 0, 0, 3))
+            self.assertIs(view.level, Level.high)
+            self.assertIsNone(views[-2].level)
+            self.assertEqual(repr(view), '<{}View(id=3)>'.format(cls.__name__))
+            self.assertEqual(view.to_model().to_dict(), readings[3].to_dict())
+            self.assertIsInstance(view.to_model(trusted=True), cls)
+            self.assertEqual(views.column('level'), [r.level for r in readings])
+            self.assertEqual(views.column('value'), [r.value for r in readings])
+            self.assertEqual([m.to_dict() for m in views.to_models()], cls.to_dicts(readings))
+            with self.assertRaises(IndexError):
+                views[10]
+
+    def test_read_only(self):
+        view = Reading.record_views(Reading.pack_records(self.readings()))[0]
+        with self.assertRaises(NotEditableField):
+            view.value = 1.0
+        with self.assertRaises(NotEditableField):
+            del view.value
+        with self.assertRaises(AttributeError):
+            view.other = 1
+
+    def test_buffers(self):
+        data = Many.pack_records([Many(a0=1, a8=-1), Many()])
+        self.assertEqual([v.to_dict() for v in Many.record_views(bytes(data))], [{'a0': 1, 'a8': -1}, {}])
+        buf = mmap.mmap(-1, len(data))
+        buf.write(bytes(data))
+        self.assertEqual(Many.record_views(buf)[0].a8, -1)
+        with self.assertRaises(ValueError):
+            Many.record_views(data[:-1])
+
+    def test_validation(self):
+        views = Reading.record_views(Reading.pack_records([Reading.construct(id=1, sensor=1001)]))
+        self.assertEqual(views[0].sensor, 1001)
+        with self.assertRaises(ValidationError):
+            views[0].to_model()
+        with self.assertRaises(ValueError) as context:
+            Reading.pack_records([Reading(id=1), Reading.construct(id=1, delta=1000)])
+        self.assertEqual(context.exception.index, 1)
+
+    def test_not_flat(self):
+        class Tagged(Model):
+            tags = ListField(Field(type=str))
+
+        with self.assertRaises(TypeError):
+            Tagged.pack_records([])
+        with self.assertRaises(TypeError):
+            Tagged.record_views(b'')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import json
+import threading
+import unittest
+
+from pyjo import Model, Field, ListField, MapField, RangeField, selective
+from pyjo.exceptions import RequiredFieldError, ValidationError
+from pyjo.model import _generic_methods
+
+
+class Owner(Model):
+    id = Field(type=int, required=True)
+    name = Field(type=str)
+
+
+class Leaf(Model):
+    name = Field(type=str)
+
+
+class Node(Model):
+    name = Field(type=str)
+    children = ListField(Field(type=Leaf))
+
+
+class Document(Model):
+    id = Field(type=int, required=True)
+    score = RangeField(min=0, max=10)
+    owner = Field(type=Owner)
+    owners = ListField(Field(type=Owner))
+    by_name = MapField(Field(type=Owner))
+    raw = Field(from_dict=lambda v: {'raw': v})
+    extra = Field()
+    tree = Field(type=Node)
+
+
+@unittest.skipIf(selective.simdjson is None, 'pysimdjson is not installed')
+class SkipUndeclaredTest(unittest.TestCase):
+
+    def test_same_models(self):
+        owner = {'id': 1, 'name': 'john', 'history': [{'a': 1}] * 10}
+        data = {
+            'id': 1,
+            'score': 5,
+            'blob': 'x' * 1000,
+            'nested': {'deep': [[1, 2, {'x': None}], 'a']},
+            'owner': owner,
+            'owners': [owner, owner],
+            'by_name': {'john': owner},
+            'raw': {'kept': [1, 2]},
+            'extra': {'a': [1, {'b': None}]},
+            'tree': {'name': 'root', 'junk': 1, 'children': [{'name': 'leaf', 'junk': 2}]},
+        }
+        value = json.dumps(data)
+        expected = Document.from_json(value).to_dict()
+        self.assertEqual(Document.from_json(value, skip_undeclared=True).to_dict(), expected)
+        self.assertEqual(Document.from_json_bytes(value.encode('utf-8'), skip_undeclared=True).to_dict(), expected)
+        self.assertEqual(Document.to_dicts(Document.from_json_many(json.dumps([data, data]), skip_undeclared=True)),
+                         [expected, expected])
+
+    def test_only_declared_keys_are_decoded(self):
+        data = {'id': 1, 'blob': {'x': 1}, 'owner': {'id': 2, 'history': [1, 2]}, 'tree': {'children': [{'z': 1}]}}
+        plan = ('object', selective._model_plan(Document, _generic_methods()['from_dict']))
+        parsed = selective._parse(json.dumps(data), plan)
+        self.assertEqual(parsed, {'id': 1, 'owner': {'id': 2}, 'tree': {'children': [{}]}})
+
+    def test_errors(self):
+        with self.assertRaises(RequiredFieldError):
+            Document.from_json('{"owner": {"name": "john"}, "id": 1}', skip_undeclared=True)
+        with self.assertRaises(ValidationError):
+            Document.from_json('{"id": 1, "score": 11, "junk": {}}', skip_undeclared=True)
+        with self.assertRaises(ValueError):
+            Document.from_json('{"id": 1, "junk": [1, }', skip_undeclared=True)
+        with self.assertRaises(TypeError):
+            Document.from_json('[1]', skip_undeclared=True)
+        with self.assertRaises(TypeError):
+            Document.from_json_many('{"id": 1}', skip_undeclared=True)
+        with self.assertRaises(ValueError):
+            Document.from_json('{"id": 1}', discard_non_fields=False, skip_undeclared=True)
+
+    def test_parser_per_thread(self):
+        Document.from_json('{"id": 1}', skip_undeclared=True)
+        parser = selective._local.parser
+        self.assertEqual(Document.from_json('{"id": 2}', skip_undeclared=True).id, 2)
+        self.assertIs(selective._local.parser, parser)
+
+        # a document still referenced doesn't prevent parsing the next one
+        doc = parser.parse(b'{"a": [1]}')
+        self.assertEqual(Document.from_json('{"id": 3}', skip_undeclared=True).id, 3)
+        self.assertIsNot(selective._local.parser, parser)
+        del doc
+
+        parsers = []
+        thread = threading.Thread(target=lambda: parsers.append(
+            (Document.from_json('{"id": 4}', skip_undeclared=True).id, selective._local.parser)))
+        thread.start()
+        thread.join()
+        self.assertEqual(parsers[0][0], 4)
+        self.assertIsNot(parsers[0][1], selective._local.parser)
+
+
+class SimdjsonMissingTest(unittest.TestCase):
+
+    def test_import_error(self):
+        simdjson = selective.simdjson
+        selective.simdjson = None
+        try:
+            with self.assertRaises(ImportError):
+                Document.from_json('{"id": 1}', skip_undeclared=True)
+        finally:
+            selective.simdjson = simdjson
+
+
+if __name__ == '__main__':
+    unittest.main()
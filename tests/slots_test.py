@@ -0,0 +1,73 @@
+import copy
+import unittest
+
+from pyjo import Model, Field, ListField, RangeField
+from pyjo.exceptions import RequiredFieldError, ValidationError
+
+
+class SlotsTest(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        class A(Model):
+            _slots = True
+            foo = Field(type=str)
+            bar = Field(type=int, default=0)
+
+        a = A(foo='x')
+        self.assertFalse(hasattr(a, '__dict__'))
+        self.assertEqual(A.__slots__, ('_pyjo_foo', '_pyjo_bar'))
+        self.assertEqual(a.foo, 'x')
+        self.assertEqual(a.bar, 0)
+        with self.assertRaises(AttributeError):
+            a.other = 1
+
+    def test_model_api(self):
+        class A(Model):
+            _slots = True
+            foo = Field(type=str, required=True, repr=True)
+            bar = RangeField(min=0, max=10)
+            items = ListField(Field(type=int))
+
+        a = A.from_dict({'foo': 'x', 'items': [1, 2]})
+        self.assertEqual(repr(a), '<A(foo=x)>')
+        self.assertEqual(a.to_dict(), {'foo': 'x', 'items': [1, 2]})
+        self.assertTrue(A.foo.has_value(a))
+        self.assertFalse(A.bar.has_value(a))
+
+        a.update_from_dict({'bar': 5})
+        self.assertEqual(a.to_dict(), {'foo': 'x', 'bar': 5, 'items': [1, 2]})
+
+        del a.bar
+        self.assertEqual(a.bar, None)
+        self.assertEqual(a.to_dict(), {'foo': 'x', 'items': [1, 2]})
+
+        with self.assertRaises(RequiredFieldError):
+            a.foo = None
+        with self.assertRaises(ValidationError):
+            a.bar = 11
+
+        b = copy.deepcopy(a)
+        self.assertEqual(b.to_dict(), a.to_dict())
+
+    def test_inheritance(self):
+        class A(Model):
+            foo = Field(type=str)
+
+        class B(A):
+            _slots = True
+            bar = Field(type=A)
+
+        class C(B):
+            baz = Field(type=int)
+
+            def __init__(self, **kwargs):
+                super(C, self).__init__(**kwargs)
+
+        self.assertEqual(C.__slots__, ('_pyjo_baz',))
+        c = C.from_dict({'foo': 'x', 'bar': {'foo': 'y'}, 'baz': 1})
+        self.assertEqual(c.to_dict(), {'foo': 'x', 'bar': {'foo': 'y'}, 'baz': 1})
+        self.assertEqual(A(foo='z').to_dict(), {'foo': 'z'})
+
+
+if __name__ == '__main__':
+    unittest.main()
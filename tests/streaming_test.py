@@ -0,0 +1,133 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyjo import Model, Field, RangeField
+from pyjo.exceptions import RequiredFieldError, ValidationError
+from pyjo.streaming import iter_lines
+
+
+class A(Model):
+    foo = Field(type=str, required=True)
+    n = RangeField(min=0, max=10)
+
+
+class JsonLinesTest(unittest.TestCase):
+
+    def test_roundtrip_text(self):
+        models = [A(foo='x{}'.format(i), n=i % 10) for i in range(100)]
+        out = io.StringIO()
+        self.assertEqual(A.dump_jsonl(iter(models), out, chunk_size=64), 100)
+        self.assertEqual(len(out.getvalue().splitlines()), 100)
+
+        res = list(A.iter_jsonl(io.StringIO(out.getvalue()), chunk_size=7))
+        self.assertEqual(A.to_dicts(res), A.to_dicts(models))
+
+    def test_roundtrip_binary(self):
+        models = [A(foo=u'è {}'.format(i)) for i in range(10)]
+        out = io.BytesIO()
+        A.dump_jsonl(models, out)
+        res = list(A.iter_jsonl(io.BytesIO(out.getvalue()), chunk_size=5))
+        self.assertEqual(A.to_dicts(res), A.to_dicts(models))
+
+    def test_lazy(self):
+        data = io.StringIO(u'{"foo": "a"}\n\n{"foo": "b"}\r\n{"n": 1}\n')
+        it = A.iter_jsonl(data)
+        self.assertEqual(next(it).foo, 'a')
+        self.assertEqual(next(it).foo, 'b')
+        with self.assertRaises(RequiredFieldError) as e:
+            next(it)
+        self.assertEqual(e.exception.index, 3)
+
+    def test_invalid_lines(self):
+        data = u'{"foo": "a"}\n{"foo": "b", "n": 11}\nnot json\n{"foo": "c"}'
+        res = list(A.iter_jsonl(io.StringIO(data), skip_invalid=True))
+        self.assertEqual([a.foo for a in res], ['a', 'c'])
+
+        invalid = []
+        res = list(A.iter_jsonl(io.StringIO(data), skip_invalid=True, invalid=invalid))
+        self.assertEqual([a.foo for a in res], ['a', 'c'])
+        self.assertEqual([i for i, line, e in invalid], [1, 2])
+        self.assertIsInstance(invalid[0][2], ValidationError)
+        self.assertIsInstance(invalid[1][2], ValueError)
+
+        # invalid lines are collected only when skipped
+        with self.assertRaises(ValueError):
+            A.iter_jsonl(io.StringIO(data), invalid=[])
+
+    def test_long_lines(self):
+        lines = [u'x' * 1000, u'', u'yz', u'w' * 50]
+        for chunk_size in (1, 3, 7, 1000, 5000):
+            self.assertEqual(list(iter_lines(io.StringIO(u'\n'.join(lines)), chunk_size)), lines)
+            self.assertEqual(list(iter_lines(io.BytesIO(u'\n'.join(lines).encode('utf-8') + b'\n'), chunk_size)),
+                             [line.encode('utf-8') for line in lines])
+        self.assertEqual(list(iter_lines(io.StringIO(u''))), [])
+
+
+class JsonArrayFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def write(self, content):
+        path = os.path.join(self.dir, 'data.json')
+        with io.open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_iterate(self):
+        records = [{'foo': u'è' * (i % 4) + 'x' * (i % 50), 'n': i % 10, 'junk': [{'a': ']', 'b': [1.5e3]}]}
+                   for i in range(300)]
+        path = self.write(json.dumps(records, ensure_ascii=False, indent=1))
+        expected = [{'foo': r['foo'], 'n': r['n']} for r in records]
+        # windows smaller than the elements
+        for window_size in (16, 100, 1 << 20):
+            res = list(A.iter_json_array(path, window_size=window_size))
+            self.assertEqual(A.to_dicts(res), expected)
+
+        with io.open(path, 'rb') as f:
+            content = f.read()
+        offsets = list(A.iter_json_array(path, offsets=True))
+        for offset, a in offsets[::37]:
+            self.assertEqual(json.JSONDecoder().raw_decode(content[offset:].decode('utf-8'))[0]['foo'], a.foo)
+
+        ranges = A.split_json_array(path, 3, window_size=64)
+        self.assertEqual(len(ranges), 3)
+        self.assertEqual(ranges[0][0], offsets[0][0])
+        self.assertEqual(ranges[-1][1], len(content))
+        parts = [list(A.iter_json_array(path, start, end, window_size=50)) for start, end in ranges]
+        self.assertTrue(all(parts))
+        self.assertEqual(A.to_dicts(sum(parts, [])), expected)
+
+    def test_empty(self):
+        for content in (u'[]', u' [ \n ] '):
+            self.assertEqual(list(A.iter_json_array(self.write(content))), [])
+            self.assertEqual(A.split_json_array(self.write(content), 4), [])
+        for content in (u'', u'  ', u'{"foo": "a"}', u'[{"foo": "a"}', u'[{"foo": "a"} {"foo": "b"}]',
+                        u'[{"foo": "a"}, {"foo": }]'):
+            with self.assertRaises(ValueError):
+                list(A.iter_json_array(self.write(content), window_size=4))
+
+    def test_invalid_elements(self):
+        path = self.write(u'[{"foo": "a"}, {"foo": "b", "n": 11}, {"n": 1}, {"foo": "c"}]')
+        it = A.iter_json_array(path)
+        self.assertEqual(next(it).foo, 'a')
+        with self.assertRaises(ValidationError) as e:
+            next(it)
+        self.assertEqual(e.exception.index, 1)
+
+        self.assertEqual([a.foo for a in A.iter_json_array(path, skip_invalid=True)], ['a', 'c'])
+        invalid = []
+        self.assertEqual([a.foo for a in A.iter_json_array(path, skip_invalid=True, invalid=invalid)], ['a', 'c'])
+        self.assertEqual([(i, record) for i, record, _ in invalid], [(1, {'foo': 'b', 'n': 11}), (2, {'n': 1})])
+        self.assertIsInstance(invalid[1][2], RequiredFieldError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+import unittest
+from datetime import datetime
+from enum import Enum
+
+from six import u
+
+from pyjo import Model, Field, RangeField, DatetimeField, EnumField, ListField, table
+from pyjo.exceptions import NotEditableField, SchemaMismatchError
+from pyjo.table import ModelTable
+
+
+class Kind(Enum):
+    city = 1
+    village = 2
+
+
+class Place(Model):
+    id = Field(type=int, required=True)
+    name = Field(type=str)
+    code = Field(type=bytes)
+    population = RangeField(min=0, max=10 ** 9)
+    kind = EnumField(Kind)
+    founded = DatetimeField()
+
+
+PLACES = [Place(id=i, name=u('Zürich') if i % 2 else 'Paris', code=b'\x00' * (i % 3) or None, population=i * 1000,
+                kind=Kind.city if i % 2 else Kind.village, founded=datetime(1000 + i, 1, 1))
+          for i in range(20)]
+
+
+def read_table(name):
+    with ModelTable.attach(Place, name) as places:
+        return [place.to_dict() for place in places]
+
+
+@unittest.skipIf(table.shared_memory is None, 'multiprocessing.shared_memory requires Python 3.8+')
+class ModelTableTest(unittest.TestCase):
+
+    def test_views(self):
+        with ModelTable.create(Place, PLACES) as places:
+            self.assertEqual(len(places), 20)
+            self.assertEqual([place.to_dict() for place in places], Place.to_dicts(PLACES))
+            self.assertEqual(places[1].name, u('Zürich'))
+            self.assertIsNone(places[0].code)
+            self.assertEqual(places[-3].code, b'\x00\x00')
+            self.assertEqual(places.column('kind'), [p.kind for p in PLACES])
+            self.assertEqual(places[3].to_model().to_dict(), PLACES[3].to_dict())
+            with self.assertRaises(NotEditableField):
+                places[0].name = 'Lyon'
+
+    def test_strings_are_stored_once(self):
+        with ModelTable.create(Place, [Place(id=i, name='x' * 1000) for i in range(100)]) as places:
+            self.assertLess(places._shm.size, 2 * 1000 + 100 * 100)
+
+    def test_attach(self):
+        with ModelTable.create(Place, PLACES) as places:
+            with ModelTable.attach(Place, places.name) as attached:
+                self.assertEqual(attached[5].to_dict(), PLACES[5].to_dict())
+            # the segment stays available to the creating process
+            self.assertEqual(places[5].to_dict(), PLACES[5].to_dict())
+
+    def test_other_process(self):
+        context = multiprocessing.get_context('spawn')
+        with ModelTable.create(Place, PLACES) as places:
+            pool = context.Pool(1)
+            try:
+                self.assertEqual(pool.apply(read_table, (places.name,)), Place.to_dicts(PLACES))
+            finally:
+                pool.close()
+                pool.join()
+            self.assertEqual(places[0].to_dict(), PLACES[0].to_dict())
+
+    def test_schema_mismatch(self):
+        class Other(Model):
+            id = Field(type=int, required=True)
+            name = Field(type=str)
+
+        with ModelTable.create(Place, PLACES) as places:
+            with self.assertRaises(SchemaMismatchError):
+                ModelTable.attach(Other, places.name)
+
+    def test_closed(self):
+        places = ModelTable.create(Place, PLACES)
+        view = places[0]
+        places.close()
+        places.unlink()
+        with self.assertRaises(ValueError):
+            view.id
+
+    def test_not_flat(self):
+        class Tagged(Model):
+            tags = ListField(Field(type=str))
+
+        with self.assertRaises(TypeError):
+            ModelTable.create(Tagged, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
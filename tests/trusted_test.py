@@ -0,0 +1,142 @@
+import unittest
+from datetime import datetime
+
+from pyjo import Model, Field, ListField, MapField, RangeField, DatetimeField, codegen
+from pyjo.exceptions import FieldTypeError, ValidationError
+
+
+class C(Model):
+    n = RangeField(min=0, max=10)
+    date = DatetimeField()
+
+
+class B(Model):
+    c = Field(type=C)
+    items = ListField(Field(type=C))
+    by_name = MapField(Field(type=C))
+    label = Field(type=str, default='b')
+
+
+class A(Model):
+    foo = Field(type=str, required=True)
+    b = Field(type=B)
+
+
+class SlotA(Model):
+    _slots = True
+    foo = Field(type=str, required=True)
+    b = Field(type=B)
+
+
+DATA = {
+    'foo': 'x',
+    'b': {
+        'c': {'n': 1, 'date': 1478390400},
+        'items': [{'n': 2}],
+        'by_name': {'k': {'n': 3}},
+    },
+}
+
+
+class TrustedTest(unittest.TestCase):
+
+    def test_construct(self):
+        a = A.construct(foo=1, b=None, other='x')
+        self.assertEqual(a.foo, 1)
+        self.assertEqual(a.other, 'x')
+        # required fields and defaults are not checked
+        self.assertEqual(A.construct().to_dict(), {})
+        self.assertEqual(B.construct().label, 'b')
+        # validation still applies on assignment
+        c = C.construct(n=20)
+        self.assertEqual(c.n, 20)
+        with self.assertRaises(ValidationError):
+            c.n = 30
+
+    def test_from_dict_trusted(self):
+        for cls in (A, SlotA):
+            a = cls.from_dict(DATA, trusted=True)
+            self.assertEqual(a.to_dict(), A.from_dict(DATA).to_dict())
+            self.assertEqual(a.b.c.date, datetime.utcfromtimestamp(1478390400))
+            self.assertIsInstance(a.b.items[0], C)
+            self.assertEqual(a.b.by_name['k'].n, 3)
+            self.assertEqual(a.b.label, 'b')
+
+    def test_construct_containers(self):
+        class D(Model):
+            tags = ListField(Field(type=str))
+            grid = ListField(ListField(Field(type=int)), default=lambda: [[1]])
+            by_name = MapField(Field(type=C), default={})
+
+        class SlotD(D):
+            _slots = True
+
+        for cls in (D, SlotD):
+            for d in (cls.construct(tags=['a']), cls.from_dict({'tags': ['a']}, trusted=True),
+                      Model.construct.__func__(cls, tags=['a'])):
+                # the elements given are not checked, the ones added later are
+                with self.assertRaises(FieldTypeError):
+                    d.tags.append(1)
+                with self.assertRaises(FieldTypeError):
+                    d.grid[0].append('x')
+                with self.assertRaises(FieldTypeError):
+                    d.by_name['k'] = 1
+                self.assertEqual(d.to_dict(), {'tags': ['a'], 'grid': [[1]], 'by_name': {}})
+            self.assertEqual(cls.construct(tags=[1]).tags, [1])
+
+    def test_no_validation(self):
+        data = {'b': {'c': {'n': 100}, 'items': [{'n': -1}], 'label': 5}}
+        a = A.from_dict(data, trusted=True)
+        self.assertEqual(a.foo, None)
+        self.assertEqual(a.b.c.n, 100)
+        self.assertEqual(a.b.items[0].n, -1)
+        self.assertEqual(a.b.label, 5)
+
+    def test_generic_fallback(self):
+        class D(A):
+            def __init__(self, **kwargs):
+                super(D, self).__init__(**kwargs)
+
+            @classmethod
+            def construct(cls, **kwargs):
+                res = super(D, cls).construct(**kwargs)
+                res.constructed = True
+                return res
+
+        d = D.from_dict(dict(DATA, foo=None), trusted=True)
+        self.assertTrue(d.constructed)
+        self.assertEqual(d.b.c.n, 1)
+
+        d = A.from_dict({'foo': 'x', 'other': 1}, trusted=True, discard_non_fields=False)
+        self.assertEqual(d.other, 1)
+
+    def test_compiled_once(self):
+        class E(Model):
+            n = Field(type=int)
+
+        class F(Model):
+            e = Field(type=E)
+            items = ListField(Field(type=E))
+
+        decode = codegen.compiled_method(F, 'from_dict')
+        self.assertTrue(decode.__func__._pyjo_generated)
+        self.assertFalse(getattr(decode.__func__, '_pyjo_stub', False))
+
+        # nested models are decoded by their generated from_dict, not through the stub compiling them
+        data = {'e': {'n': 1}, 'items': [{'n': 2}]}
+        for kwargs in ({'trusted': True}, {'lazy': True}):
+            self.assertEqual(F.from_dict(data, **kwargs).to_dict(), data)
+        calls = []
+        ensure_compiled = codegen._ensure_compiled
+        codegen._ensure_compiled = lambda *args: calls.append(args) or ensure_compiled(*args)
+        try:
+            for kwargs in ({'trusted': True}, {'lazy': True}):
+                self.assertEqual(F.from_dict(data, **kwargs).to_dict(), data)
+            self.assertEqual(F.from_dicts([data] * 2)[1].to_dict(), data)
+        finally:
+            codegen._ensure_compiled = ensure_compiled
+        self.assertEqual(calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()